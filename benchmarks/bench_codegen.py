@@ -0,0 +1,53 @@
+"""Compares the codegen reverse function against the tree walking reverse()
+and the prune_options + substitute_parameters pipeline.
+
+    $ python -m benchmarks.bench_codegen -n 100000
+"""
+
+import argparse
+import timeit
+
+from benchmarks.workloads import MIXNA_ROUTE
+from reverser import RSRReverser, RouteParameterizationIrreversibleError
+
+PARAMETERS = {
+    'artist': 'artist',
+    'song': 'song',
+    'page': '2',
+}
+
+
+def pipeline(reverser, parameters):
+    pruned_route = reverser.prune_options(parameters)
+    reversed_route = reverser.substitute_parameters(parameters, pruned_route)
+    if not reverser.is_reversed(reversed_route):
+        raise RouteParameterizationIrreversibleError
+    return reversed_route
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    tree = RSRReverser(MIXNA_ROUTE)
+    codegen = RSRReverser(MIXNA_ROUTE, codegen=True)
+    assert pipeline(tree, PARAMETERS) == tree.reverse(PARAMETERS) == \
+        codegen.reverse(PARAMETERS)
+
+    cases = [
+        ('pipeline', lambda: pipeline(tree, PARAMETERS)),
+        ('tree', lambda: tree.reverse(PARAMETERS)),
+        ('codegen', lambda: codegen.reverse(PARAMETERS)),
+    ]
+    baseline = None
+    for name, case in cases:
+        seconds = min(timeit.repeat(case, number=args.number, repeat=3))
+        baseline = baseline or seconds
+        print('%-10s %8.3fs %10.0f/s %6.1fx' % (name, seconds,
+                                                args.number / seconds,
+                                                baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Measures the memory of 100k generated routes--per-tenant and per-locale
+variants of a handful of shapes--with tracemalloc.
+
+    $ python -m benchmarks.bench_memory -n 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from reverser import RSRReverser, RouteRegistry
+
+SHAPES = [
+    '/{tenant}/%s/mixna/{artist}/{song}[/{page:digits}[/{date}[/{comment}]]]',
+    '/{tenant}/%s/users/{user}[/posts[/{post:digits}]]',
+    '/%s/search[/{query}][/{page:digits}]',
+    '/%s/static/{path:slug}',
+]
+LOCALES = ['en', 'de', 'fr', 'es', 'it', 'ja', 'pt', 'nl']
+
+
+def generated_routes(number):
+    """Builds :number: routes, each with a literal tenant segment of its
+    own.
+    """
+
+    return ['/t%d' % i + SHAPES[i % len(SHAPES)] % LOCALES[i % len(LOCALES)]
+            for i in range(number)]
+
+
+def measure(build):
+    """Gets the bytes allocated by :build: that are still held after it
+    returns.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    held = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before,
+                                                           'filename'))
+    del held
+    return size
+
+
+def registry(routes):
+    registry = RouteRegistry(dict(enumerate(routes)))
+    for key in range(len(routes)):
+        registry.get_reverser(key)
+    return registry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    routes = generated_routes(args.number)
+    cases = [
+        ('RSRReverser', lambda: [RSRReverser(route) for route in routes]),
+        ('CompiledRoute', lambda: [RSRReverser(route).compile()
+                                   for route in routes]),
+        ('RouteRegistry', lambda: registry(routes)),
+    ]
+    for name, build in cases:
+        size = measure(build)
+        print('%-14s %10.1f MiB %8.0f bytes/route' % (
+            name, size / 1048576.0, size / float(args.number)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Times prune_options() on routes with many options and on deeply nested
+options.
+
+    $ python -m benchmarks.bench_prune_options -n 1000
+"""
+
+import argparse
+import timeit
+
+from benchmarks.workloads import wide_route, deep_route
+from reverser import RSRReverser
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=1000)
+    args = parser.parse_args()
+
+    cases = [
+        ('wide 60 options', wide_route(60), 60),
+        ('deep 10 levels', deep_route(10), 10),
+        ('deep 50 levels', deep_route(50), 50),
+    ]
+    for name, route, count in cases:
+        reverser = RSRReverser(route)
+        all_params = dict(('o%d' % i, 'v') for i in range(count))
+        half_params = dict(('o%d' % i, 'v') for i in range(0, count, 2))
+        for label, params in (('all', all_params), ('half', half_params)):
+            seconds = min(timeit.repeat(
+                lambda: reverser.prune_options(params),
+                number=args.number, repeat=3))
+            print('%-16s %-5s %8.3fs %10.0f/s' % (name, label, seconds,
+                                                  args.number / seconds))
+
+
+if __name__ == '__main__':
+    main()
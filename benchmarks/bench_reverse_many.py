@@ -0,0 +1,43 @@
+"""Compares reverse_many() against calling reverse() once per record on the
+README's /mixna/ route.
+
+    $ python -m benchmarks.bench_reverse_many -n 10000000
+"""
+
+import argparse
+import collections
+import time
+
+from benchmarks.workloads import MIXNA_ROUTE, song_database
+from reverser import RSRReverser
+
+
+def loop(reverser, records):
+    for parameters in records:
+        yield reverser.reverse(parameters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=10000000)
+    args = parser.parse_args()
+
+    reverser = RSRReverser(MIXNA_ROUTE)
+    cases = [
+        ('reverse loop', lambda: loop(reverser, song_database(args.number))),
+        ('reverse_many',
+         lambda: reverser.reverse_many(song_database(args.number))),
+    ]
+    baseline = None
+    for name, case in cases:
+        start = time.time()
+        collections.deque(case(), maxlen=0)
+        seconds = time.time() - start
+        baseline = baseline or seconds
+        print('%-13s %8.3fs %10.0f/s %6.2fx' % (name, seconds,
+                                                args.number / seconds,
+                                                baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
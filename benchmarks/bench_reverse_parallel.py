@@ -0,0 +1,50 @@
+"""Measures how reverse_parallel() scales from 1 to N worker processes
+against a serial reverse() loop on the README's /mixna/ route.
+
+    $ python -m benchmarks.bench_reverse_parallel -n 10000000
+"""
+
+import argparse
+import collections
+import multiprocessing
+import time
+
+from benchmarks.workloads import MIXNA_ROUTE, song_database
+from reverser import RSRReverser, RSR_CHUNK_SIZE
+
+
+def loop(reverser, records):
+    for parameters in records:
+        yield reverser.reverse(parameters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=10000000)
+    parser.add_argument('-p', '--processes', type=int,
+                        default=multiprocessing.cpu_count())
+    parser.add_argument('-c', '--chunksize', type=int,
+                        default=RSR_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    reverser = RSRReverser(MIXNA_ROUTE)
+    cases = [('serial', lambda: loop(reverser, song_database(args.number)))]
+    for processes in range(1, args.processes + 1):
+        cases.append(('%d processes' % processes,
+                      lambda processes=processes: reverser.reverse_parallel(
+                          song_database(args.number), processes=processes,
+                          chunksize=args.chunksize)))
+
+    baseline = None
+    for name, case in cases:
+        start = time.time()
+        collections.deque(case(), maxlen=0)
+        seconds = time.time() - start
+        baseline = baseline or seconds
+        print('%-13s %8.3fs %10.0f/s %6.2fx' % (name, seconds,
+                                                args.number / seconds,
+                                                baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Compares Router.match() on 5,000 routes against trying each route's
+RSRReverser.match() in order.
+
+    $ python -m benchmarks.bench_router -r 5000 -n 1000
+    $ python -m benchmarks.bench_router -r 5000 -n 1000 --distinct-names
+
+--distinct-names gives every route's parameters their own names--e.g.
+'/api/{id0}/res0', '/api/{id1}/res1', ...--so routes only share the
+tree's parameter edges through their types.
+"""
+
+import argparse
+import random
+import time
+
+from reverser import RSRReverser, Router
+
+
+def routes(number, distinct_names=False):
+    for i in range(number):
+        if distinct_names:
+            yield 'route%d' % i, '/api/{id%d}/res%d' % (i, i)
+        else:
+            yield 'route%d' % i, '/section%d/item%d/{id:digits}[/{slug}]' % (
+                i % 50, i)
+
+
+def paths(number, routes, distinct_names=False):
+    rng = random.Random(0)
+    for _ in range(number):
+        i = rng.randrange(routes)
+        if distinct_names:
+            yield '/api/%d/res%d' % (i, i)
+        else:
+            yield '/section%d/item%d/%d/some-slug' % (i % 50, i, i)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-r', '--routes', type=int, default=5000)
+    parser.add_argument('-n', '--number', type=int, default=1000)
+    parser.add_argument('--distinct-names', action='store_true')
+    args = parser.parse_args()
+
+    route_list = list(routes(args.routes, args.distinct_names))
+    start = time.time()
+    router = Router(route_list)
+    print('built router for %d routes in %.3fs' % (args.routes,
+                                                     time.time() - start))
+    reversers = [(name, RSRReverser(route)) for name, route in route_list]
+    path_list = list(paths(args.number, args.routes, args.distinct_names))
+
+    def linear(path):
+        for name, reverser in reversers:
+            parameters = reverser.match(path)
+            if parameters is not None:
+                return name, parameters
+
+    for path in path_list[:10]:
+        assert tuple(router.match(path)) == linear(path)
+
+    cases = [('linear scan', linear), ('router', router.match)]
+    baseline = None
+    for name, case in cases:
+        start = time.time()
+        for path in path_list:
+            case(path)
+        seconds = time.time() - start
+        baseline = baseline or seconds
+        print('%-12s %8.3fs %10.0f/s %8.1fx' % (name, seconds,
+                                                len(path_list) / seconds,
+                                                baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Measures one CompiledRoute shared by 1 to N threads against building an
+RSRReverser per request, on the README's /mixna/ route.
+
+On a free-threaded CPython build (python3.13t and later) the shared
+CompiledRoute should scale with the thread count; with the GIL, it shows
+the cost of contention alone.
+
+    $ python -m benchmarks.bench_threads -n 1000000 -t 8
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from benchmarks.workloads import MIXNA_ROUTE, song_database
+from reverser import RSRReverser
+
+
+def shared(route, records):
+    reverse = route.reverse
+    for parameters in records:
+        reverse(parameters)
+
+
+def per_request(records):
+    for parameters in records:
+        RSRReverser(MIXNA_ROUTE).reverse(parameters)
+
+
+def run(threads, target, args):
+    workers = [threading.Thread(target=target, args=args(i))
+               for i in range(threads)]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=1000000,
+                        help='reversals per thread count')
+    parser.add_argument('-t', '--threads', type=int, default=8)
+    parser.add_argument('--per-request', type=int, default=10000,
+                        help='reversals for the reverser-per-request case')
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)
+    print('python %s, GIL %s' % (sys.version.split()[0],
+                                 'enabled' if is_gil_enabled()
+                                 else 'disabled'))
+
+    seconds = run(1, per_request, lambda i: (song_database(args.per_request),))
+    print('%-22s %8.3fs %10.0f/s' % ('reverser per request', seconds,
+                                      args.per_request / seconds))
+
+    route = RSRReverser(MIXNA_ROUTE).compile()
+    baseline = None
+    threads = 1
+    while threads <= args.threads:
+        number = args.number // threads
+        seconds = run(threads, shared,
+                      lambda i: (route, song_database(number)))
+        baseline = baseline or seconds
+        print('%-22s %8.3fs %10.0f/s %6.2fx' % (
+            'shared, %d threads' % threads, seconds,
+            number * threads / seconds, baseline / seconds))
+        threads *= 2
+
+
+if __name__ == '__main__':
+    main()
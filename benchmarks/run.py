@@ -0,0 +1,127 @@
+"""Runs the benchmark suite and writes the results as JSON.
+
+Every workload is timed against every reversal engine: reverse(), a
+codegen reverse(), and reverse_many().  The README's /mixna/ workload
+streams --records records through a reverse() loop, through
+reverse_many() and, as cursor-style tuples, through reverse_args().
+
+    $ python -m benchmarks.run --output results.json
+    $ python -m benchmarks.run --number 10000 --records 100000 --only deep
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import platform
+import sys
+import time
+import timeit
+
+from benchmarks.workloads import (MIXNA_ROUTE, song_database, song_rows,
+                                  flat_route, wide_route, deep_route,
+                                  parameters)
+from reverser import RSRReverser, RouteParameterizationIrreversibleError
+
+WORKLOADS = [
+    ('flat 5 params', flat_route(5), parameters('p', 5)),
+    ('flat 20 params', flat_route(20), parameters('p', 20)),
+    ('deep 10 levels all', deep_route(10), parameters('o', 10)),
+    ('deep 10 levels half', deep_route(10), parameters('o', 5)),
+    ('wide 60 options all', wide_route(60), parameters('o', 60)),
+    ('wide 60 options third', wide_route(60), parameters('o', 60, step=3)),
+    ('unrelated 25 keys', flat_route(3), parameters('p', 3, unrelated=25)),
+    ('irreversible', flat_route(5), parameters('p', 4)),
+]
+
+
+def reverse_or_none(reverse, params):
+    try:
+        return reverse(params)
+    except RouteParameterizationIrreversibleError:
+        return None
+
+
+def engines(route, params, number):
+    """Yields (engine, callable) pairs; each callable reverses the :route:
+    :number: times.
+    """
+
+    reverser = RSRReverser(route)
+    codegen = RSRReverser(route, codegen=True)
+    yield 'reverse', lambda: [reverse_or_none(reverser.reverse, params)
+                              for _ in range(number)]
+    yield 'codegen', lambda: [reverse_or_none(codegen.reverse, params)
+                              for _ in range(number)]
+    yield 'reverse_many', lambda: collections.deque(reverser.reverse_many(
+        itertools.repeat(params, number), on_error='default'), maxlen=0)
+
+
+def mixna_engines(records):
+    reverser = RSRReverser(MIXNA_ROUTE)
+    yield 'reverse', lambda: collections.deque(
+        (reverser.reverse(params) for params in song_database(records)),
+        maxlen=0)
+    yield 'reverse_many', lambda: collections.deque(
+        reverser.reverse_many(song_database(records)), maxlen=0)
+    yield 'reverse_args', lambda: collections.deque(
+        itertools.starmap(reverser.reverse_args, song_rows(records)),
+        maxlen=0)
+
+
+def measure(workload, engine, case, number, repeat):
+    seconds = min(timeit.repeat(case, number=1, repeat=repeat))
+    return {
+        'workload': workload,
+        'engine': engine,
+        'number': number,
+        'seconds': seconds,
+        'per_second': number / seconds if seconds else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help='reversals per timing')
+    parser.add_argument('-m', '--records', type=int, default=10000000,
+                        help='records in the /mixna/ workload')
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('-o', '--output', help='JSON file (default: stdout)')
+    parser.add_argument('--only', help='run workloads containing this text')
+    args = parser.parse_args()
+
+    results = []
+    for workload, route, params in WORKLOADS:
+        if args.only and args.only not in workload:
+            continue
+        for engine, case in engines(route, params, args.number):
+            results.append(measure(workload, engine, case, args.number,
+                                   args.repeat))
+            sys.stderr.write('%(workload)-22s %(engine)-13s '
+                             '%(per_second)12.0f/s\n' % results[-1])
+
+    workload = 'mixna %d records' % args.records
+    if not args.only or args.only in workload:
+        for engine, case in mixna_engines(args.records):
+            results.append(measure(workload, engine, case, args.records, 1))
+            sys.stderr.write('%(workload)-22s %(engine)-13s '
+                             '%(per_second)12.0f/s\n' % results[-1])
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Routes and parameter records shared by the benchmarks."""
+
+MIXNA_ROUTE = '/mixna/{artist}/{song}[/{page}[/{date}[/{comment}]]]'
+
+
+def song_database(number):
+    """Yields :number: README-style records with only the required
+    parameters of the /mixna/ route.
+    """
+
+    for i in range(number):
+        yield {
+            'artist': 'artist%d' % (i % 1000),
+            'song': 'song%d' % i,
+        }
+
+
+def song_rows(number):
+    """Yields the records of :song_database: as cursor-style (artist, song)
+    tuples.
+    """
+
+    for i in range(number):
+        yield 'artist%d' % (i % 1000), 'song%d' % i
+
+
+def flat_route(params):
+    return '/flat' + ''.join('/{p%d}' % i for i in range(params))
+
+
+def wide_route(options):
+    return '/wide' + ''.join('[/{o%d}]' % i for i in range(options))
+
+
+def deep_route(depth):
+    return '/deep' + ''.join('[/{o%d}' % i for i in range(depth)) + \
+        ']' * depth
+
+
+def parameters(prefix, count, step=1, unrelated=0):
+    """Builds a parameter dictionary for the routes above, optionally padded
+    with :unrelated: keys that no route uses.
+    """
+
+    params = dict(('%s%d' % (prefix, i), 'v%d' % i)
+                  for i in range(0, count, step))
+    params.update(('unrelated%d' % i, 'x') for i in range(unrelated))
+    return params
@@ -1,6 +1,55 @@
+import collections
+import copy
+import itertools
+import multiprocessing
 import re
+import sys
+from collections import namedtuple, OrderedDict
+from operator import itemgetter
+
+try:
+    from sys import intern
+except ImportError:
+    pass
+
+try:
+    from urllib.parse import quote, unquote
+except ImportError:
+    from urllib import quote, unquote
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 RSR_TYPE_PATTERN = '(%s[a-zA-Z0-9]*)?'
+RSR_CACHE_SIZE = 128
+RSR_REGISTRY_CACHE_SIZE = 4096
+RSR_ROUTER_MAX_VARIANTS = 256
+RSR_CHUNK_SIZE = 10000
+RSR_NODE_CACHE_SIZE = 65536
+RSR_ENCODE_CACHE_SIZE = 65536
+
+ON_ERROR_RAISE = 'raise'
+ON_ERROR_SKIP = 'skip'
+ON_ERROR_DEFAULT = 'default'
+ON_ERROR_CHOICES = (ON_ERROR_RAISE, ON_ERROR_SKIP, ON_ERROR_DEFAULT)
+
+ENCODE_SEGMENT = 'segment'
+ENCODE_PATH = 'path'
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize')
+RouteMatch = namedtuple('RouteMatch', 'name parameters')
+
+_MISSING = object()
+_REBUILD_OPTIONS = ('dialect', 'encode', 'query', 'query_exclude', 'codegen',
+                    'validate', 'types', 'cache_size')
+_shared_nodes = {}
+_dialects = {}
+_configs = {}
+
+RSR_PARAMETER_TYPES = {}
+RSR_URL_ENCODERS = {}
 
 
 class InvalidParameterError(Exception):
@@ -13,328 +62,3138 @@ class RouteParameterizationIrreversibleError(Exception):
     an unsupplied required parameter."""
 
 
-class RSRReverser(object):
-    """A Rails-style route reverser.
+class LiteralNode(namedtuple('LiteralNode', 'text')):
+    """A run of literal text in a compiled route.
 
     Attributes:
-        option_bounds (str): The characters signaling the beginning and end
-                             of a route option.
-        param_bounds (str): The characters signaling the beginning and end
-                            of a route parameter.
-        param_separator (str): The character signaling the separator between
-                               the parameter's name and type.
-
-    NOTE:
-        The option_bounds, param_bounds, and param_separator must all be
-        regex-safe strings.
+        text (str): The literal text.
     """
 
-    option_bounds = '[]'
-    param_bounds = '{}'
-    param_separator = ':'
+    __slots__ = ()
 
-    def __init__(self, route, option_bounds=None, param_bounds=None,
-                 param_separator=None):
-        """Constructs a new RSRReverser.
 
-        Args:
-            option_bounds (str): @see RSRReverser::option_bounds.
-            param_bounds (str): @see RSRReverser::param_bounds.
-            param_separator (str): @see RSRReverser::param_separator.
-        """
+class ParameterNode(namedtuple('ParameterNode', 'name type token')):
+    """A parameter in a compiled route.
 
-        self._route = route
-        self.option_bounds = self.pick('option_bounds', option_bounds)
-        self.param_bounds = self.pick('param_bounds', param_bounds)
-        self.param_separator = self.pick('param_separator', param_separator)
-        self._param_pattern = self.extrapolate_param_pattern()
+    Attributes:
+        name (str): The parameter's name.
+        type (str|None): The parameter's type or None if it has none.
+        token (str): The parameter exactly as it appears in the route.
+    """
 
-    def pick(self, attr, val):
-        """Gets the matching class attribute from RSRReverser if val is None.
+    __slots__ = ()
 
-        Args:
-            attr (str): The name of the attribute to select from RSRReverser.
-            val (var): Any value.
 
-        Returns (var):
-            If val is None, returns the matching class attribute from
-            RSRReverser.  Otherwise, returns val.
-        """
+class OptionNode(namedtuple('OptionNode', 'children')):
+    """An option in a compiled route.
 
-        val = val if val else getattr(RSRReverser, attr)
-        return val
+    Attributes:
+        children (tuple): The nodes inside the option.
+    """
 
-    def set_route(self, route):
-        """Sets THIS RSRReverser's route.
+    __slots__ = ()
 
-        Args:
-            route (str): A Rails-style route.
-        """
 
-        self._route = route
+class OptionRequirement(namedtuple('OptionRequirement',
+                                   'names parent reversible')):
+    """What an option in a compiled route needs in order to be reversed.
 
-    def get_route(self):
-        """Gets THIS RSRReverser's route.
+    Attributes:
+        names (frozenset): The names of the parameters directly inside the
+                           option (not inside its nested options).  All of
+                           them must be supplied.
+        parent (int|None): The index of the enclosing option's
+                           OptionRequirement--or None for a top-level
+                           option.  The enclosing option must be reversed
+                           too.
+        reversible (bool): Whether or not the option can ever be reversed;
+                           False if it directly contains an InvalidNode.
+    """
 
-        Returns (str):
-            THIS RSRReverser's route.
-        """
+    __slots__ = ()
 
-        return self._route
 
-    def extrapolate_param_pattern(self):
-        """Extrapolates the regular expression to be used to match parameters
-        based on THIS RSRReverser's :param_separator: and :param_bounds:.
+class InvalidNode(namedtuple('InvalidNode', 'text')):
+    """Route text that can never be reversed: a syntactically invalid
+    parameter or an unmatched bound.
 
-        Returns (str):
-            The regular expression to be used to match parameters.
-        """
+    Attributes:
+        text (str): The offending text.
+    """
 
-        type_pattern = RSR_TYPE_PATTERN % self.param_separator
-        param_pattern = '%s%%s%s%s' % (self.param_bounds[0],
-                                       type_pattern,
-                                       self.param_bounds[1])
-        return param_pattern
+    __slots__ = ()
 
-    def get_option_start(self, route=None):
-        """Gets the starting position of the FIRST option in the :route:.
 
-        Args:
-            route (str|None): The route to search--or None to search THIS
-                              RSRReverser's route.
+def compile_validator(validator):
+    """Compiles a parameter type's validator into a function.
 
-        Returns (int):
-            The starting position of the FIRST option or -1 if none exists.
-        """
+    Args:
+        validator (str|re.RegexObject|callable): A regular expression that
+            must match the whole value or a function that takes the value
+            and returns whether or not it is valid.
 
-        route = route if route else self.get_route()
+    Returns (callable):
+        A function that takes a value and returns whether or not it is
+        valid.  Validators built from a regular expression without flags
+        carry its source in a pattern attribute.
+    """
 
-        start = route.find(self.option_bounds[0])
-        end = route.find(self.option_bounds[1])
-        if end == -1:
-            return -1
-        if end < start:
-            return -1
-        return start
+    if isinstance(validator, str):
+        validator = re.compile(validator)
+    if hasattr(validator, 'pattern') and hasattr(validator, 'match'):
+        regex = re.compile('(?:%s)\\Z' % validator.pattern, validator.flags)
 
-    def get_option_end(self, route=None):
-        """Gets the ending position of the FIRST option in the :route:.
+        def validate(value):
+            return regex.match(value) is not None
 
-        Args:
-            route (str|None): The route to search--or None to search THIS
-                              RSRReverser's route.
+        if not validator.flags & ~re.UNICODE:
+            validate.pattern = validator.pattern
+        return validate
+    if callable(validator):
+        return validator
+    raise TypeError('validator must be a regular expression or a callable, '
+                    'not %r' % (validator,))
 
-        Returns (int):
-            The ending position of the FIRST option or -1 if none exists.
-        """
 
-        route = route if route else self.get_route()
+def shared_node(node):
+    """Gets the shared instance of a compiled LiteralNode, ParameterNode or
+    InvalidNode--so that the segments many routes have in common are only
+    held in memory once.
 
-        start = self.get_option_start(route)
-        if start == -1:
-            return -1
+    Args:
+        node (LiteralNode|ParameterNode|InvalidNode): A compiled node.
 
-        pos = start
-        opts = 1
-        while opts > 0:
-            pos += 1
-            if pos >= len(route):
-                return -1
+    Returns (LiteralNode|ParameterNode|InvalidNode):
+        The first node equal to :node: (and of the same type), with its
+        strings interned--or :node: itself once RSR_NODE_CACHE_SIZE nodes
+        are shared.
+    """
 
-            char = route[pos]
-            if char not in self.option_bounds:
-                continue
+    key = (type(node), node)
+    try:
+        return _shared_nodes[key]
+    except KeyError:
+        pass
 
-            if char == self.option_bounds[0]:
-                opts += 1
+    node = type(node)(*[value if value is None else intern(value)
+                        for value in node])
+    if len(_shared_nodes) < RSR_NODE_CACHE_SIZE:
+        _shared_nodes[key] = node
+    return node
 
-            if char == self.option_bounds[1]:
-                opts -= 1
 
-        return pos
+def register_parameter_type(name, validator):
+    """Registers a parameter type for every RSRReverser; e.g. the 'digits'
+    in '{page:digits}'.
 
-    def get_option(self, route=None):
-        """Gets the FIRST option in the :route:.
+    Args:
+        name (str): The type's name.
+        validator (str|re.RegexObject|callable): @see compile_validator.
+    """
 
-        Args:
-            route (str|None): The route to search--or None to search THIS
-                              RSRReverser's route.
+    RSR_PARAMETER_TYPES[name] = compile_validator(validator)
 
-        Returns (str):
-            The first option in the :route: or '' if none exists.
 
-            example:
-                :route: '/eg[/{option1}]/sep[/{option2}]' -> '[/{option1}]'
-                :route: '/eg/no/options' -> ''
-        """
+register_parameter_type('digits', r'[0-9]+')
+register_parameter_type('alpha', r'[a-zA-Z]+')
+register_parameter_type('alnum', r'[a-zA-Z0-9]+')
+register_parameter_type('slug', r'[-a-zA-Z0-9_]+')
 
-        route = route if route else self.get_route()
-        op_start = self.get_option_start(route)
-        op_end = self.get_option_end(route)
-        if op_start == -1 or op_end == -1:
-            return ''
-        if op_end < op_start:
-            return ''
-        return route[op_start:op_end + 1]
 
-    def clean_parameter(self, parameter):
-        """Ensures that the :parameter: is syntactically valid and returns its
-        name.
+def url_encoder(safe):
+    """Builds a function that percent-encodes parameter values for a URL.
 
-        Args:
-            parameter (str|None): A route parameter string.
+    Values made only of unreserved and :safe: ASCII characters are returned
+    as they are without any work.  Other values are encoded as UTF-8 and
+    memoized--up to RSR_ENCODE_CACHE_SIZE values, after which the memo
+    starts over.
 
-        Returns (str):
-            The :parameter:'s name or '' if the :parameter: is syntactically
-            invalid.
+    Args:
+        safe (str): The reserved characters to leave unencoded.
+
+    Returns (function):
+        A function that takes a value and returns it encoded.  It carries
+        every character it leaves unencoded in a safe attribute.
 
         example:
-            :parameter: '{param}' -> 'param'
-            :parameter: '{param:digits}' -> 'param'
-            :parameter: '{param:invalid:type}' -> ''
-        """
+            url_encoder('/')('AC/DC & Friends') -> 'AC/DC%20%26%20Friends'
+    """
 
-        parts = parameter.split(self.param_separator)
-        if len(parts) == 1:
+    safe = '-._~' + safe
+    is_safe = re.compile('[a-zA-Z0-9%s]*\\Z' % re.escape(safe)).match
+    memo = {}
+
+    def encode(value):
+        if is_safe(value):
+            return value
+        try:
+            return memo[value]
+        except KeyError:
             pass
-        elif len(parts) == 2:
-            parameter = parts[0]
+        encoded = quote(value if isinstance(value, str)
+                        else value.encode('utf-8'), safe)
+        if len(memo) >= RSR_ENCODE_CACHE_SIZE:
+            memo.clear()
+        memo[value] = encoded
+        return encoded
+
+    encode.safe = safe
+    return encode
+
+
+RSR_URL_ENCODERS[ENCODE_SEGMENT] = url_encoder("!$&'()*+,;=:@")
+RSR_URL_ENCODERS[ENCODE_PATH] = url_encoder("!$&'()*+,;=:@/")
+_encode_query = url_encoder("!$'()*,;:@/?")
+
+
+def _query_string(parameters, skip):
+    """@see RSRReverser::query_string--leaving out the names in :skip:."""
+
+    pairs = []
+    for key in sorted(parameters):
+        if key in skip:
+            continue
+        value = parameters[key]
+        if value is None:
+            continue
+        prefix = _encode_query('%s' % key) + '='
+        if isinstance(value, (list, tuple)):
+            pairs.extend([prefix + _encode_query('%s' % item)
+                          for item in value if item is not None])
         else:
-            raise InvalidParameterError
-        if parameter == '':
-            raise InvalidParameterError
-        return parameter
+            pairs.append(prefix + _encode_query('%s' % value))
+    return '?' + '&'.join(pairs) if pairs else ''
 
-    def substitute_parameters(self, parameters, route=None):
-        """Substitutes parameter values in place of parameter keys.
+
+def _check_on_error(on_error):
+    """Raises ValueError unless :on_error: is one of ON_ERROR_CHOICES."""
+
+    if on_error not in ON_ERROR_CHOICES:
+        raise ValueError('on_error must be one of %r, not %r' %
+                         (ON_ERROR_CHOICES, on_error))
+
+
+class UnknownRouteError(KeyError):
+    """Raised to signal a lookup of a route that was never added to a
+    RouteRegistry."""
+
+
+class PrunedTemplate(namedtuple('PrunedTemplate', 'parts slots encoders')):
+    """A compiled route with all of its options decided.
+
+    Attributes:
+        parts (tuple): The literal text of the route, with None in place of
+                       each parameter.
+        slots (tuple): (index, name) pairs locating each parameter in
+                       :parts:--or (index, position) pairs for positional
+                       parameter values.
+        encoders (tuple|None): The function that encodes each slot's value
+                               (or None to insert it as it is)--in the
+                               order of :slots:.  None if no slot is
+                               encoded.
+    """
+
+    __slots__ = ()
+
+    def render(self, parameters):
+        """Substitutes the :parameters: into THIS PrunedTemplate.
 
         Args:
-            parameters (dict): A dictionary of parameter names / keys
-                               and values.
-            route (str|None): The route to substitute values in place of keys
-                              or None to use THIS RSRReverser's route.
+            parameters (dict|tuple): A dictionary of parameter names / keys
+                                     and values--or a tuple of positional
+                                     values.  It must supply every
+                                     parameter in :slots:.
 
         Returns (str):
-            The route--with the parameter keys substituted by the parameter 
-            values.
+            The reversed route.
+        """
+
+        parts = list(self.parts)
+        if self.encoders is None:
+            for index, name in self.slots:
+                parts[index] = parameters[name]
+        else:
+            for (index, name), encode in zip(self.slots, self.encoders):
+                value = parameters[name]
+                parts[index] = value if encode is None else encode(value)
+        return ''.join(parts)
+
+    def format_string(self):
+        """Gets THIS PrunedTemplate as a %-format string.
+
+        Returns (str):
+            The literal text with a %s in place of each parameter--in the
+            order of :slots:.
 
             example:
-                :parameters: {
-                                'p1': 'examples',
-                                'p2': 'are',
-                                'p3': 'useful',
-                             }
-                :route: '/eg/{p1}/{p3}'
-                
-                    -> '/eg/examples/useful'
+                :parts: ('/eg/', None, '/100%', None) -> '/eg/%s/100%%%s'
         """
 
-        substituted_route = route if route else self.get_route()
-        for param, value in parameters.iteritems():
-            pattern = self._param_pattern % re.escape(param)
-            matches = re.finditer(pattern, substituted_route)
-            for match in matches:
-                substituted_route = substituted_route.replace(match.group(),
-                                                              value)
-        return substituted_route
+        return ''.join('%s' if part is None else part.replace('%', '%%')
+                       for part in self.parts)
 
-    def prune_options(self, parameters):
-        """Prunes any options that cannot be replaced due to unsupplied
-        parameters.
 
-        Args:
-            parameters (dict): A dictionary of parameter names / keys
-                               and values.
+PrunedTemplate.__new__.__defaults__ = (None,)
 
-        Returns:
-            THIS RSRReverer's route--with any unsubstitutable options pruned.
 
-            example:
-                :self.route: '/eg[/{o1}[/{o2}]]/s1[/{o3}[/{o4}]]/s2[/{o5}]'
-                :parameters: {
-                                 'o1': 'nest_1',
-                                 'o2': 'replaced',
-                                 'o4': 'nest_2_not',
-                                 'aside': 'neither_is_o5',
-                             }
-                
-                    -> '/eg/{op1}/{op2}/s1/s2'
-        """
+def prune_nodes(nodes, names, encoders=None):
+    """Decides the options of the compiled :nodes: for a set of supplied
+    parameter names.
 
-        route = self.get_route()
-        while True:
-            option = self.get_option(route)
-            if option == '':
-                return route
+    Args:
+        nodes (tuple): A route compiled by RSRReverser::compile_route.
+        names (set|frozenset): The names of the supplied parameters.
+        encoders (dict|None): Parameter names / keys and the functions that
+                              encode their values.
 
-            option_reverser = RSRReverser(option[1:-1],
-                                    option_bounds=self.option_bounds,
-                                    param_bounds=self.param_bounds,
-                                    param_separator=self.param_separator)
+    Returns (PrunedTemplate|None):
+        @see RSRReverser::prune_template.
+    """
 
-            pruned_route = option_reverser.prune_options(parameters)
+    items = []
+    if not _prune(nodes, names, items):
+        return None
+
+    parts = []
+    slots = []
+    for item in items:
+        if isinstance(item, ParameterNode):
+            slots.append((len(parts), item.name))
+            parts.append(None)
+        elif parts and parts[-1] is not None:
+            parts[-1] += item
+        else:
+            parts.append(item)
+    slot_encoders = None
+    if encoders and any(name in encoders for _, name in slots):
+        slot_encoders = tuple([encoders.get(name) for _, name in slots])
+    return PrunedTemplate(tuple(parts), tuple(slots), slot_encoders)
 
-            substituted_route = option_reverser.substitute_parameters(
-                                                            parameters,
-                                                            pruned_route)
-            if self.is_reversed(substituted_route):
-                route = route.replace(option, option[1:-1])
-            else:
-                route = route.replace(option, '')
 
-    def is_reversed(self, route=None):
-        """Determines whether a :route: is reversed.
+def _prune(nodes, names, items):
+    """Appends the literal text and ParameterNodes of the compiled :nodes: to
+    :items:.
 
-        Args:
-            route (str|None): The route to substitute values in place of keys
-                              or None to use THIS RSRReverser's route.
+    Options that cannot be reversed are dropped from :items:.
 
-        Returns (bool):
-            Whehter or not the route is reversed.
-        """
+    Returns (bool):
+        Whether or not the :nodes: are reversible given the supplied
+        parameter :names:.
+    """
 
-        route = route if route else self.get_route()
-        if route.find(self.option_bounds[0]) != -1:
-            return False
-        if route.find(self.option_bounds[1]) != -1:
+    for node in nodes:
+        if isinstance(node, LiteralNode):
+            items.append(node.text)
+        elif isinstance(node, ParameterNode):
+            if node.name not in names:
+                return False
+            items.append(node)
+        elif isinstance(node, OptionNode):
+            mark = len(items)
+            if not _prune(node.children, names, items):
+                del items[mark:]
+        else:
             return False
-        if route.find(self.param_bounds[0]) != -1:
+    return True
+
+
+def _compile_match_regex(nodes, validators, encoders):
+    """@see RSRReverser::compile_match_regex."""
+
+    groups = {}
+    pattern = _match_pattern(nodes, validators, encoders, groups, {})
+    return re.compile(pattern + r'\Z', re.DOTALL), groups
+
+
+def _match_pattern(nodes, validators, encoders, groups, seen, scope=()):
+    """Gets the regular expression matching the compiled :nodes:.
+
+    A repeated parameter is a backreference if its only earlier group always
+    takes part when it does--i.e. that group is not inside an option the
+    repeat is outside of.  Otherwise it is a conditional group that matches
+    whichever earlier group took part, or captures a group of its own if
+    none did, so the regular expression itself backtracks until every
+    occurrence is equal.
+    """
+
+    pattern = []
+    for node in nodes:
+        if isinstance(node, LiteralNode):
+            pattern.append(re.escape(node.text))
+        elif isinstance(node, ParameterNode):
+            previous = seen.setdefault(node.name, [])
+            if len(previous) == 1 and \
+                    scope[:len(previous[0][1])] == previous[0][1]:
+                pattern.append('(?P=%s)' % previous[0][0])
+                continue
+            group = 'g%d' % len(groups)
+            groups[group] = node.name
+            previous.append((group, scope))
+            value_pattern = getattr(validators.get(node.name), 'pattern',
+                                    None)
+            if value_pattern is None:
+                safe = getattr(encoders.get(node.name), 'safe', '')
+                # Lazy, so that options after it in the segment match
+                # rather than being swallowed by the parameter.
+                value_pattern = '.+?' if '/' in safe else '[^/]+?'
+            value_pattern = '(?P<%s>(?:%s))' % (group, value_pattern)
+            for earlier, _ in reversed(previous[:-1]):
+                value_pattern = '(?(%s)(?P=%s)|%s)' % (earlier, earlier,
+                                                     value_pattern)
+            pattern.append(value_pattern)
+        elif isinstance(node, OptionNode):
+            if any(isinstance(child, InvalidNode) for child in node.children):
+                continue
+            optional = any(isinstance(child, ParameterNode)
+                           for child in node.children)
+            option_pattern = _match_pattern(
+                node.children, validators, encoders, groups, seen,
+                scope + (object(),) if optional else scope)
+            if optional:
+                option_pattern = '(?:%s)?' % option_pattern
+            pattern.append(option_pattern)
+        else:
+            pattern.append('(?!)')
+    return ''.join(pattern)
+
+
+def _match_parameters(matcher, url, validators, encoders):
+    """Matches a :url: against a route's :matcher:--the compiled regular
+    expression and groups of _compile_match_regex.
+
+    Returns (dict|None):
+        @see RSRReverser::match.
+    """
+
+    regex, groups = matcher
+    match = regex.match(url)
+    if match is None:
+        return None
+    parameters = {}
+    # The regular expression already makes repeated parameters equal; this
+    # only guards against a group it does not constrain.
+    for group, value in match.groupdict().items():
+        if value is not None and \
+                parameters.setdefault(groups[group], value) != value:
+            return None
+    for name in encoders:
+        if name in parameters:
+            parameters[name] = unquote(parameters[name])
+    for name, value in parameters.items():
+        validator = validators.get(name)
+        if validator is not None and not hasattr(validator, 'pattern') \
+                and not validator(value):
+            return None
+    return parameters
+
+
+def _supplied_parameters(names, validators, parameters):
+    """@see RSRReverser::supplied_parameters--for a route's parameter
+    :names: and :validators:."""
+
+    if not validators:
+        return frozenset([name for name in names if name in parameters])
+    return frozenset([name for name in names
+                      if name in parameters and
+                      (name not in validators or
+                       validators[name](parameters[name]))])
+
+
+def _has_required(required, validators, parameters):
+    """Determines whether the :parameters: supply every :required:
+    parameter with a valid value."""
+
+    for name in required:
+        if name not in parameters:
             return False
-        if route.find(self.param_bounds[1]) != -1:
+        if name in validators and not validators[name](parameters[name]):
             return False
-        return True
+    return True
 
-    def reverse(self, parameters):
-        """Reverses a Rails-style route.
 
-        Args:
-            parameters (dict): A dictionary of parameter names / keys
-                               and values.
+def _missing_parameters(required, validators, parameters):
+    """@see RSRReverser::missing_parameters--for a route's :required:
+    parameters and :validators:."""
 
-        Returns (str):
-            THIS RSRReverser's route--reversed given the :parameters:.
+    return tuple([name for name in required
+                  if name not in parameters or
+                  (name in validators and
+                   not validators[name](parameters[name]))])
 
-            example:
-                :self.route: '/eg[/{o1}[/{o2}]]/s1[/{o3}[/{o4}]]/s2/{p1}'
-                :parameters: {
-                                 'o1': 'nest_1',
-                                 'o2': 'replaced',
-                                 'o4': 'nest_2_not',
-                                 'p1': 'param_must_be_supplied',
-                             }
-                
-                    -> '/eg/nest_1/replaced/s1/s2/param_must_be_supplied'
 
-                :self.route: '/eg/{p1}'
+def _positional_key(names, validators, values):
+    """Gets the key of the positional template for the :values: of a route
+    with the parameter :names:--whether or not each value is missing.
+
+    Args:
+        validators (tuple|None): The validator of each positional value--or
+                                 None if no parameter has one.
+
+    Raises:
+        TypeError: If there are more :values: than :names:.
+    """
+
+    if len(values) > len(names):
+        raise TypeError('reverse_args takes at most %d values (%d given)'
+                        % (len(names), len(values)))
+    if validators is None:
+        return tuple([value is None for value in values])
+    return tuple([value is None or
+                  (validate is not None and not validate(value))
+                  for value, validate in zip(values, validators)])
+
+
+def _positional_template(get_pruned_template, names, missing):
+    """@see RSRReverser::get_positional_template--uncached, for a route with
+    the parameter :names: and its :get_pruned_template:."""
+
+    template = get_pruned_template(frozenset(
+        [name for name, skip in zip(names, missing) if not skip]))
+    if template is not None:
+        positions = dict((name, i) for i, name in enumerate(names))
+        template = template._replace(slots=tuple(
+            [(index, positions[name]) for index, name in template.slots]))
+    return template
+
+
+class LRUCache(object):
+    """A bounded, least-recently-used cache with hit and miss counters.
+
+    Attributes:
+        maxsize (int|None): The most entries to keep--or None to keep all
+                            entries.
+        hits (int): The number of successful lookups.
+        misses (int): The number of failed lookups.
+    """
+
+    __slots__ = ('maxsize', 'hits', 'misses', '_entries')
+
+    def __init__(self, maxsize=RSR_CACHE_SIZE):
+        """Constructs a new LRUCache.
+
+        Args:
+            maxsize (int|None): @see LRUCache::maxsize.
+        """
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        """Gets the value cached for the :key: and marks it as recently used.
+
+        Returns (var):
+            The cached value or :default: if there is none.
+        """
+
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries[key] = value
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Caches the :value: for the :key:, evicting the least recently
+        used entry if THIS LRUCache is full.
+        """
+
+        if self.maxsize is not None and self.maxsize <= 0:
+            return
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Empties THIS LRUCache and resets its counters."""
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Gets THIS LRUCache's statistics.
+
+        Returns (CacheInfo):
+            The hits, misses, maxsize and current size.
+        """
+
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_worker_reverser = None
+_unpickled_routes = {}
+
+
+def _freeze(values):
+    """Gets the :values: as a tuple that can key a dictionary--with each
+    dictionary among them as a sorted tuple of its items.
+
+    Raises:
+        TypeError: If the items of a dictionary cannot be sorted.  (Looking
+                   the tuple up raises it if a value cannot be hashed.)
+    """
+
+    return tuple([tuple(sorted(value.items(), key=itemgetter(0)))
+                  if isinstance(value, dict) else value
+                  for value in values])
+
+
+def _build_reverser(route, options, bound=None):
+    """Builds an RSRReverser in another process from its route, the values
+    of RSRReverser::_rebuild_options and its bound parameters.
+    """
+
+    reverser = RSRReverser(route, **dict(zip(_REBUILD_OPTIONS, options)))
+    return reverser.bind(bound) if bound else reverser
+
+
+def _init_worker(route, options, bound=None):
+    """Builds the RSRReverser a worker process of
+    RSRReverser::reverse_parallel uses for every chunk.
+    """
+
+    global _worker_reverser
+    _worker_reverser = _build_reverser(route, options, bound)
+
+
+def _unpickle_compiled_route(route, options, bound):
+    """Rebuilds a pickled CompiledRoute--once per process for the same
+    route and options, since an executor gets it pickled with every batch.
+    @see CompiledRoute::__reduce__.
+    """
+
+    try:
+        key = (route, _freeze(options), _freeze((bound,)))
+        return _unpickled_routes[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return _build_reverser(route, options, bound).compile()
+
+    if len(_unpickled_routes) >= RSR_CACHE_SIZE:
+        _unpickled_routes.clear()
+    compiled = _build_reverser(route, options, bound).compile()
+    _unpickled_routes[key] = compiled
+    return compiled
+
+
+def _reverse_chunk(records):
+    """Reverses a chunk of records in a worker process.
+
+    Returns (list):
+        The reversed routes--with None for each irreversible record.
+    """
+
+    return list(_worker_reverser.reverse_many(records,
+                                              on_error=ON_ERROR_DEFAULT))
+
+
+def _bounded_imap(pool, chunks, limit):
+    """Reverses the :chunks: in the :pool: with at most :limit: of them in
+    flight--unlike Pool.imap, which reads all of its input up front.
+
+    Returns (generator):
+        The results of :_reverse_chunk:--in the order of the :chunks:.
+    """
+
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(_reverse_chunk, (chunk,)))
+        if len(pending) >= limit:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _chunk(records, size):
+    """Splits the :records: iterable into lists of at most :size: records.
+    """
+
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class Dialect(object):
+    """The delimiters of a family of routes and every pattern and regular
+    expression built from them.
+
+    Dialects are immutable and get_dialect caches one per configuration, so
+    every RSRReverser with the same delimiters shares them.
+
+    Attributes:
+        option_bounds (str): @see RSRReverser::option_bounds.
+        param_bounds (str): @see RSRReverser::param_bounds.
+        param_separator (str): @see RSRReverser::param_separator.
+        param_pattern (str): The regular expression to be used to match
+                             parameters, with %s in place of the name.
+        param_regex (re.RegexObject): Matches every parameter in a route.
+                                      Unlike :param_pattern:, the bounds
+                                      and separator are escaped.  The
+                                      parameter's name is in the 'name'
+                                      group and its type (with the
+                                      separator) in group 2.
+        token_regex (re.RegexObject): Splits a route into tokens.  Every
+                                      character of a route belongs to
+                                      exactly one match, and the match's
+                                      lastgroup is one of 'open', 'close',
+                                      'param', 'text' or 'stray'.
+        type_regex (re.RegexObject): Matches a parameter's type (with the
+                                     separator), or the empty string.
+    """
+
+    __slots__ = ('option_bounds', 'param_bounds', 'param_separator',
+                 'param_pattern', 'param_regex', 'token_regex', 'type_regex')
+
+    def __init__(self, option_bounds, param_bounds, param_separator):
+        """Constructs a new Dialect.
+
+        Args:
+            option_bounds (str): @see RSRReverser::option_bounds.
+            param_bounds (str): @see RSRReverser::param_bounds.
+            param_separator (str): @see RSRReverser::param_separator.
+        """
+
+        self.option_bounds = option_bounds
+        self.param_bounds = param_bounds
+        self.param_separator = param_separator
+
+        self.param_pattern = '%s%%s%s%s' % (
+            param_bounds[0], RSR_TYPE_PATTERN % param_separator,
+            param_bounds[1])
+
+        start = re.escape(param_bounds[0])
+        end = re.escape(param_bounds[1])
+        type_pattern = RSR_TYPE_PATTERN % re.escape(param_separator)
+        self.param_regex = re.compile('%s(?P<name>[^%s%s]*?)%s%s' % (
+            start, start, end, type_pattern, end))
+
+        bounds = ''.join(re.escape(char) for char in
+                         option_bounds[:2] + param_bounds[:2])
+        self.token_regex = re.compile(
+            '(?P<open>%s)|(?P<close>%s)|%s(?P<param>[^%s]*)%s|'
+            '(?P<text>[^%s]+)|(?P<stray>.)' % (
+                re.escape(option_bounds[0]), re.escape(option_bounds[1]),
+                start, bounds, end, bounds), re.DOTALL)
+
+        self.type_regex = re.compile(type_pattern + r'\Z')
+
+    def __reduce__(self):
+        return get_dialect, (self.option_bounds, self.param_bounds,
+                             self.param_separator)
+
+    def __repr__(self):
+        return 'Dialect(%r, %r, %r)' % (self.option_bounds, self.param_bounds,
+                                        self.param_separator)
+
+
+def get_dialect(option_bounds=None, param_bounds=None, param_separator=None):
+    """Gets the shared Dialect for a configuration of delimiters--building it
+    the first time.
+
+    Args:
+        option_bounds (str|None): @see RSRReverser::option_bounds--or None
+                                  for the default.
+        param_bounds (str|None): @see RSRReverser::param_bounds--or None for
+                                 the default.
+        param_separator (str|None): @see RSRReverser::param_separator--or
+                                    None for the default.
+
+    Returns (Dialect):
+        The same Dialect for every call with the same delimiters.
+
+        example:
+            get_dialect() is get_dialect('[]', '{}', ':') -> True
+    """
+
+    key = (option_bounds, param_bounds, param_separator)
+    try:
+        return _dialects[key]
+    except KeyError:
+        pass
+
+    delimiters = (option_bounds or RSRReverser.option_bounds,
+                  param_bounds or RSRReverser.param_bounds,
+                  param_separator or RSRReverser.param_separator)
+    dialect = _dialects.get(delimiters)
+    if dialect is None:
+        dialect = _dialects[delimiters] = Dialect(*delimiters)
+    _dialects[key] = dialect
+    return dialect
+
+
+class _Config(object):
+    """The configuration of an RSRReverser that does not depend on its
+    route--shared by every RSRReverser built with the same options, so
+    each one keeps a single reference to it.  @see RSRReverser::__init__.
+    """
+
+    __slots__ = ('dialect', 'codegen', 'validate', 'encode', 'query_exclude',
+                 'custom_types', 'custom_validators', 'shared_cache',
+                 'shared_url_cache')
+
+    def __init__(self, dialect, codegen, validate, encode, query_exclude,
+                 custom_types, shared_cache, shared_url_cache):
+        self.dialect = dialect
+        self.codegen = codegen
+        self.validate = validate
+        self.encode = encode
+        self.query_exclude = query_exclude
+        self.custom_types = custom_types
+        self.custom_validators = dict(
+            (type_name, compile_validator(validator))
+            for type_name, validator in (custom_types or {}).items())
+        self.shared_cache = shared_cache
+        self.shared_url_cache = shared_url_cache
+
+
+def _get_config(*options):
+    """Gets the shared _Config for the :options:--building it the first
+    time.  Options that cannot be hashed, e.g. a types dictionary with an
+    unhashable validator, get a _Config of their own.
+    """
+
+    try:
+        key = _freeze(options)
+        return _configs[key]
+    except KeyError:
+        pass
+    except TypeError:
+        return _Config(*options)
+
+    if len(_configs) >= RSR_CACHE_SIZE:
+        _configs.clear()
+    _configs[key] = _Config(*options)
+    return _configs[key]
+
+
+class _Delimiter(object):
+    """An RSRReverser attribute read from its Dialect--or the default, when
+    read from the class.
+    """
+
+    def __init__(self, name, default):
+        self.name = name
+        self.default = default
+
+    def __get__(self, reverser, owner):
+        if reverser is None:
+            return self.default
+        return getattr(reverser._config.dialect, self.name)
+
+
+class RSRReverser(object):
+    """A Rails-style route reverser.
+
+    Attributes:
+        option_bounds (str): The characters signaling the beginning and end
+                             of a route option.
+        param_bounds (str): The characters signaling the beginning and end
+                            of a route parameter.
+        param_separator (str): The character signaling the separator between
+                               the parameter's name and type.
+
+    NOTE:
+        The option_bounds, param_bounds, and param_separator must all be
+        regex-safe strings.
+    """
+
+    option_bounds = _Delimiter('option_bounds', '[]')
+    param_bounds = _Delimiter('param_bounds', '{}')
+    param_separator = _Delimiter('param_separator', ':')
+
+    def __init__(self, route, option_bounds=None, param_bounds=None,
+                 param_separator=None, codegen=False,
+                 cache_size=RSR_CACHE_SIZE, cache=None, validate=True,
+                 types=None, url_cache_size=None, url_cache=None,
+                 dialect=None, encode=None, query=False, query_exclude=None):
+        """Constructs a new RSRReverser.
+
+        Args:
+            option_bounds (str): @see RSRReverser::option_bounds.
+            param_bounds (str): @see RSRReverser::param_bounds.
+            param_separator (str): @see RSRReverser::param_separator.
+            codegen (bool): Whether or not to reverse with a Python function
+                            generated for the route.
+                            @see RSRReverser::compile_reverse_function.
+            cache_size (int|None): The most pruned templates to cache--or
+                                   None to cache every parameter shape.
+                                   @see RSRReverser::get_pruned_template.
+            cache (LRUCache|None): A pruned template cache to share with
+                                   other RSRReversers--or None for a cache
+                                   of THIS RSRReverser's own.  Overrides
+                                   :cache_size:.
+            validate (bool): Whether or not to validate the values of typed
+                             parameters; e.g. '{page:digits}'.  A value that
+                             fails validation counts as not supplied.
+            types (dict|None): Type names / keys and validators that add to
+                               or override the registered parameter types.
+                               @see register_parameter_type.
+            url_cache_size (int|None): The most reversed routes to cache--or
+                                       None to not cache reversed routes.
+                                       @see RSRReverser::reverse.
+            url_cache (LRUCache|None): A reversed route cache to share with
+                                       other RSRReversers.  Overrides
+                                       :url_cache_size:.
+            dialect (Dialect|None): The delimiters of the route.  Overrides
+                                    :option_bounds:, :param_bounds: and
+                                    :param_separator:.  @see get_dialect.
+            encode (str|function|dict|None): How to URL-encode parameter
+                                             values: ENCODE_SEGMENT,
+                                             ENCODE_PATH (which leaves '/'
+                                             for catch-all parameters) or a
+                                             function--for every parameter,
+                                             or a dictionary of parameter
+                                             names / keys and those (or
+                                             None) that override
+                                             ENCODE_SEGMENT.  None to insert
+                                             values as they are.
+            query (bool): Whether or not to append the parameters that are
+                          not in the route as a query string.
+                          @see RSRReverser::query_string.
+            query_exclude (iterable|None): Parameter names to never put in
+                                           the query string.
+        """
+
+        self._route = route
+        self._config = _get_config(
+            dialect or get_dialect(option_bounds, param_bounds,
+                                   param_separator),
+            codegen, validate, encode,
+            frozenset(query_exclude or ()) if query else None,
+            types, cache is not None, url_cache is not None)
+        self._cache = cache if cache is not None else LRUCache(cache_size)
+        if url_cache is None and url_cache_size is not None:
+            url_cache = LRUCache(url_cache_size)
+        self._url_cache = url_cache
+        self._bound = {}
+        self._prepare_route()
+
+    def pick(self, attr, val):
+        """Gets the matching class attribute from RSRReverser if val is None.
+
+        Args:
+            attr (str): The name of the attribute to select from RSRReverser.
+            val (var): Any value.
+
+        Returns (var):
+            If val is None, returns the matching class attribute from
+            RSRReverser.  Otherwise, returns val.
+        """
+
+        val = val if val else getattr(RSRReverser, attr)
+        return val
+
+    def set_route(self, route):
+        """Sets THIS RSRReverser's route.
+
+        Args:
+            route (str): A Rails-style route.
+        """
+
+        self._route = route
+        self._prepare_route()
+
+    def _prepare_route(self):
+        """Compiles THIS RSRReverser's route and drops anything prepared for
+        a previous route.
+        """
+
+        config = self._config
+        self._template = self.compile_route()
+        self._validators = self.compile_validators(self._template) \
+            if config.validate else {}
+        self._names = self.extract_parameter_names(self._template)
+        self._query_skip = config.query_exclude.union(self._names) \
+            if config.query_exclude is not None else None
+        self._encoders = self.pick_encoders(self._names)
+        if self._bound:
+            self._template = self.bind_template(self._template, self._bound,
+                                                self._validators,
+                                                self._encoders)
+            self._names = self.extract_parameter_names(self._template)
+            self._validators = dict((name, validator) for name, validator
+                                    in self._validators.items()
+                                    if name in self._names)
+            self._encoders = dict((name, encoder) for name, encoder
+                                  in self._encoders.items()
+                                  if name in self._names)
+        self._required = self.extract_required_parameters(self._template)
+        self._reversible = not self._has_invalid_node(self._template)
+        self._option_requirements = None
+        self._reverse_function = self.pick_reverse_function()
+        self._positional_validators = tuple(
+            [self._validators.get(name) for name in self._names]) \
+            if self._validators else None
+        self._positional_templates = {}
+        self._matcher = None
+        self._cache_key = (self._route, self.option_bounds,
+                           self.param_bounds, self.param_separator,
+                           tuple(sorted(self._bound.items())),
+                           self._positional_validators,
+                           tuple([self._encoders.get(name)
+                                  for name in self._names])
+                           if self._encoders else None) \
+            if config.shared_cache or config.shared_url_cache else None
+        if not config.shared_cache:
+            self._cache.clear()
+        if self._url_cache is not None and not config.shared_url_cache:
+            self._url_cache.clear()
+
+    def bind(self, parameters):
+        """Gets a new RSRReverser for THIS RSRReverser's route with some
+        parameters substituted once and for all.
+
+        The bound values become literal text, options they complete are
+        kept, options they invalidate are dropped, and only the remaining
+        parameters are left to reverse.  THIS RSRReverser is unchanged.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values to bind.  Names that are not in
+                               the route are ignored.
+
+        Returns (RSRReverser):
+            The bound RSRReverser.  Its :get_route: is still the unbound
+            route, and values passed to it for bound parameters are
+            ignored.  It is not itself immutable--:set_route: binds the
+            same values to the new route--so call :compile: on it for a
+            snapshot that cannot change.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1}[/{o2}]]'
+                :parameters: {'p1': 'a', 'o1': 'b'}
+
+                    -> reverses like '/eg/a/b[/{o2}]'
+        """
+
+        reverser = copy.copy(self)
+        reverser._bound = dict(self._bound)
+        reverser._bound.update((name, parameters[name])
+                               for name in self._names if name in parameters)
+        if not self._config.shared_cache:
+            reverser._cache = LRUCache(self._cache.maxsize)
+        if self._url_cache is not None and not self._config.shared_url_cache:
+            reverser._url_cache = LRUCache(self._url_cache.maxsize)
+        reverser._prepare_route()
+        return reverser
+
+    def compile(self):
+        """Gets an immutable snapshot of THIS RSRReverser's route that any
+        number of threads can share.
+
+        Returns (CompiledRoute):
+            The route as THIS RSRReverser has compiled it--including any
+            bound parameters, validators and generated reverse function.
+            Later calls to :set_route: do not affect it.
+        """
+
+        return CompiledRoute(self)
+
+    def get_bound_parameters(self):
+        """Gets the parameters bound to THIS RSRReverser.
+
+        Returns (dict):
+            @see RSRReverser::bind.
+        """
+
+        return dict(self._bound)
+
+    def get_route(self):
+        """Gets THIS RSRReverser's route.
+
+        Returns (str):
+            THIS RSRReverser's route.
+        """
+
+        return self._route
+
+    def get_template(self):
+        """Gets THIS RSRReverser's compiled route.
+
+        Returns (tuple):
+            THIS RSRReverser's route compiled by :compile_route:.
+        """
+
+        return self._template
+
+    def get_parameter_names(self):
+        """Gets the names of the parameters in THIS RSRReverser's route.
+
+        Returns (tuple):
+            @see RSRReverser::extract_parameter_names.
+        """
+
+        return self._names
+
+    def get_validators(self):
+        """Gets the validators of THIS RSRReverser's typed parameters.
+
+        Returns (dict):
+            @see RSRReverser::compile_validators.
+        """
+
+        return self._validators
+
+    def get_required_parameters(self):
+        """Gets the names of the parameters THIS RSRReverser's route cannot
+        be reversed without.
+
+        Returns (tuple):
+            @see RSRReverser::extract_required_parameters.
+        """
+
+        return self._required
+
+    def get_option_requirements(self):
+        """Gets what each option in THIS RSRReverser's route needs in order
+        to be reversed.
+
+        Returns (tuple):
+            @see RSRReverser::analyze_options.
+        """
+
+        if self._option_requirements is None:
+            self._option_requirements = self.analyze_options(self._template)
+        return self._option_requirements
+
+    def can_reverse(self, parameters):
+        """Determines whether THIS RSRReverser's route can be reversed given
+        the :parameters:--without reversing it.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values.
+
+        Returns (bool):
+            Whether or not :reverse: would succeed.
+        """
+
+        return self._reversible and \
+            _has_required(self._required, self._validators, parameters)
+
+    def missing_parameters(self, parameters):
+        """Gets the required parameters missing from the :parameters:--or
+        supplied with an invalid value.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values.
+
+        Returns (tuple):
+            The names of the missing required parameters--in route order.
+            Note that a route with a syntactically invalid parameter outside
+            of its options can never be reversed, even with none missing.
+
+            example:
+                :self.route: '/eg/{p1}/{p2}[/{o1}]'
+                :parameters: {'p2': 'b', 'o1': 'c'}
+
+                    -> ('p1',)
+        """
+
+        return _missing_parameters(self._required, self._validators,
+                                   parameters)
+
+    def cache_info(self):
+        """Gets the statistics of THIS RSRReverser's pruned template cache.
+
+        Returns (CacheInfo):
+            The hits, misses, maxsize and current size.
+        """
+
+        return self._cache.info()
+
+    def url_cache_info(self):
+        """Gets the statistics of THIS RSRReverser's reversed route cache.
+
+        Returns (CacheInfo|None):
+            The hits, misses, maxsize and current size--or None if THIS
+            RSRReverser does not cache reversed routes.
+        """
+
+        if self._url_cache is None:
+            return None
+        return self._url_cache.info()
+
+    def clear_url_cache(self):
+        """Empties THIS RSRReverser's reversed route cache--including the
+        entries of every RSRReverser sharing it.
+        """
+
+        if self._url_cache is not None:
+            self._url_cache.clear()
+
+    def clear_cache(self):
+        """Empties THIS RSRReverser's pruned template cache--including the
+        entries of every RSRReverser sharing it.
+        """
+
+        self._cache.clear()
+
+    def pick_encoders(self, names):
+        """Gets the functions that URL-encode the values of the parameters
+        with the :names:--as THIS RSRReverser's :encode: option asks.
+
+        Args:
+            names (tuple): The names of parameters.
+
+        Returns (dict):
+            Parameter names / keys and functions that take a value and return
+            it encoded.  Parameters that are not encoded are left out.
+
+            example:
+                :encode: {'path': ENCODE_PATH, 'raw': None}
+                :names: ('artist', 'path', 'raw')
+
+                    -> {'artist': <segment encoder>, 'path': <path encoder>}
+        """
+
+        encode = self._config.encode
+        if encode is None or encode is False:
+            return {}
+        if not isinstance(encode, dict):
+            modes = dict((name, encode) for name in names)
+        else:
+            modes = dict((name, encode.get(name, ENCODE_SEGMENT))
+                         for name in names)
+
+        encoders = {}
+        for name, mode in modes.items():
+            if mode is None:
+                continue
+            if mode is True:
+                mode = ENCODE_SEGMENT
+            if callable(mode):
+                encoders[name] = mode
+            elif mode in RSR_URL_ENCODERS:
+                encoders[name] = RSR_URL_ENCODERS[mode]
+            else:
+                raise ValueError('encode must be one of %r or a function, '
+                                 'not %r' % (sorted(RSR_URL_ENCODERS), mode))
+        return encoders
+
+    def pick_reverse_function(self):
+        """Gets the generated reverse function if THIS RSRReverser is in
+        codegen mode.
+
+        Returns (function|None):
+            The result of :compile_reverse_function: or None.
+        """
+
+        if not self._config.codegen:
+            return None
+        return self.compile_reverse_function()
+
+    def extrapolate_param_pattern(self):
+        """Extrapolates the regular expression to be used to match parameters
+        based on THIS RSRReverser's :param_separator: and :param_bounds:.
+
+        Returns (str):
+            @see Dialect::param_pattern.
+        """
+
+        return self._config.dialect.param_pattern
+
+    def extrapolate_param_regex(self):
+        """Extrapolates the compiled regular expression that matches every
+        parameter in a route based on THIS RSRReverser's :param_separator:
+        and :param_bounds:.
+
+        Returns (re.RegexObject):
+            @see Dialect::param_regex.
+        """
+
+        return self._config.dialect.param_regex
+
+    def extrapolate_token_regex(self):
+        """Extrapolates the regular expression used to split a route into
+        tokens based on THIS RSRReverser's :option_bounds: and
+        :param_bounds:.
+
+        Returns (re.RegexObject):
+            @see Dialect::token_regex.
+        """
+
+        return self._config.dialect.token_regex
+
+    def get_option_start(self, route=None):
+        """Gets the starting position of the FIRST option in the :route:.
+
+        Args:
+            route (str|None): The route to search--or None to search THIS
+                              RSRReverser's route.
+
+        Returns (int):
+            The starting position of the FIRST option or -1 if none exists.
+        """
+
+        route = route if route else self.get_route()
+
+        start = route.find(self.option_bounds[0])
+        end = route.find(self.option_bounds[1])
+        if end == -1:
+            return -1
+        if end < start:
+            return -1
+        return start
+
+    def get_option_end(self, route=None):
+        """Gets the ending position of the FIRST option in the :route:.
+
+        Args:
+            route (str|None): The route to search--or None to search THIS
+                              RSRReverser's route.
+
+        Returns (int):
+            The ending position of the FIRST option or -1 if none exists.
+        """
+
+        route = route if route else self.get_route()
+
+        start = self.get_option_start(route)
+        if start == -1:
+            return -1
+
+        pos = start
+        opts = 1
+        while opts > 0:
+            pos += 1
+            if pos >= len(route):
+                return -1
+
+            char = route[pos]
+            if char not in self.option_bounds:
+                continue
+
+            if char == self.option_bounds[0]:
+                opts += 1
+
+            if char == self.option_bounds[1]:
+                opts -= 1
+
+        return pos
+
+    def get_option(self, route=None):
+        """Gets the FIRST option in the :route:.
+
+        Args:
+            route (str|None): The route to search--or None to search THIS
+                              RSRReverser's route.
+
+        Returns (str):
+            The first option in the :route: or '' if none exists.
+
+            example:
+                :route: '/eg[/{option1}]/sep[/{option2}]' -> '[/{option1}]'
+                :route: '/eg/no/options' -> ''
+        """
+
+        route = route if route else self.get_route()
+        op_start = self.get_option_start(route)
+        op_end = self.get_option_end(route)
+        if op_start == -1 or op_end == -1:
+            return ''
+        if op_end < op_start:
+            return ''
+        return route[op_start:op_end + 1]
+
+    def clean_parameter(self, parameter):
+        """Ensures that the :parameter: is syntactically valid and returns its
+        name.
+
+        Args:
+            parameter (str|None): A route parameter string.
+
+        Returns (str):
+            The :parameter:'s name or '' if the :parameter: is syntactically
+            invalid.
+
+        example:
+            :parameter: '{param}' -> 'param'
+            :parameter: '{param:digits}' -> 'param'
+            :parameter: '{param:invalid:type}' -> ''
+        """
+
+        parts = parameter.split(self.param_separator)
+        if len(parts) == 1:
+            pass
+        elif len(parts) == 2:
+            parameter = parts[0]
+        else:
+            raise InvalidParameterError
+        if parameter == '':
+            raise InvalidParameterError
+        return parameter
+
+    def compile_parameter(self, token, parameter):
+        """Compiles a single route parameter into a node.
+
+        Args:
+            token (str): The parameter exactly as it appears in the route.
+            parameter (str): The parameter without its bounds.
+
+        Returns (ParameterNode|InvalidNode):
+            A ParameterNode or an InvalidNode if the :parameter: is
+            syntactically invalid.
+
+        example:
+            :parameter: 'param' -> ParameterNode('param', None, '{param}')
+            :parameter: 'param:digits' ->
+                ParameterNode('param', 'digits', '{param:digits}')
+            :parameter: 'param:invalid:type' -> InvalidNode('{...}')
+        """
+
+        try:
+            name = self.clean_parameter(parameter)
+        except InvalidParameterError:
+            return InvalidNode(token)
+
+        param_type = parameter[len(name):]
+        if not self._config.dialect.type_regex.match(param_type):
+            return InvalidNode(token)
+        param_type = param_type[len(self.param_separator):] or None
+        return ParameterNode(name, param_type, token)
+
+    def compile_route(self, route=None):
+        """Compiles a :route: into an immutable tree of nodes in a single
+        pass.
+
+        Args:
+            route (str|None): The route to compile--or None to compile THIS
+                              RSRReverser's route.
+
+        Returns (tuple):
+            The route's LiteralNodes, ParameterNodes, OptionNodes and
+            InvalidNodes--in order.  An unmatched option bound becomes an
+            InvalidNode.
+
+            example:
+                :route: '/eg/{p1}[/{o1}]' -> (
+                    LiteralNode('/eg/'),
+                    ParameterNode('p1', None, '{p1}'),
+                    OptionNode((
+                        LiteralNode('/'),
+                        ParameterNode('o1', None, '{o1}'),
+                    )),
+                )
+        """
+
+        route = route if route else self.get_route()
+
+        stack = [[]]
+        for match in self._config.dialect.token_regex.finditer(route):
+            kind = match.lastgroup
+            if kind == 'text':
+                stack[-1].append(shared_node(LiteralNode(match.group())))
+            elif kind == 'param':
+                stack[-1].append(shared_node(self.compile_parameter(
+                    match.group(), match.group(kind))))
+            elif kind == 'open':
+                stack.append([])
+            elif kind == 'close' and len(stack) > 1:
+                children = tuple(stack.pop())
+                stack[-1].append(OptionNode(children))
+            else:
+                stack[-1].append(InvalidNode(match.group()))
+
+        while len(stack) > 1:
+            children = stack.pop()
+            stack[-1].append(InvalidNode(self.option_bounds[0]))
+            stack[-1].extend(children)
+        return tuple(stack[0])
+
+    def bind_template(self, nodes, parameters, validators, encoders=None):
+        """Substitutes the :parameters: into the compiled :nodes:.
+
+        Args:
+            nodes (tuple): A route compiled by :compile_route:.
+            parameters (dict): A dictionary of parameter names / keys
+                               and values to bind.
+            validators (dict): @see RSRReverser::compile_validators.
+            encoders (dict|None): @see RSRReverser::pick_encoders.
+
+        Returns (tuple):
+            The :nodes: with each bound parameter replaced by a LiteralNode
+            of its (encoded) value--or by an InvalidNode if the value is
+            invalid.
+            Options left without parameters are kept as literal text,
+            options left with an InvalidNode are dropped.
+
+            example:
+                :route: '/eg/{p1}[/{o1}][/{o2}]'
+                :parameters: {'p1': 'a', 'o1': 'b'} -> (
+                    LiteralNode('/eg/a/b'),
+                    OptionNode((
+                        LiteralNode('/'),
+                        ParameterNode('o2', None, '{o2}'),
+                    )),
+                )
+        """
+
+        bound = []
+        for node in nodes:
+            if isinstance(node, ParameterNode) and node.name in parameters:
+                value = parameters[node.name]
+                if node.name in validators and \
+                        not validators[node.name](value):
+                    node = InvalidNode(node.token)
+                elif encoders and node.name in encoders:
+                    node = LiteralNode(encoders[node.name](value))
+                else:
+                    node = LiteralNode(value)
+            elif isinstance(node, OptionNode):
+                children = self.bind_template(node.children, parameters,
+                                              validators, encoders)
+                if any(isinstance(child, InvalidNode) for child in children):
+                    continue
+                if all(isinstance(child, LiteralNode) for child in children):
+                    for child in children:
+                        self._append_node(bound, child)
+                    continue
+                node = OptionNode(children)
+            self._append_node(bound, node)
+        return tuple(bound)
+
+    def _append_node(self, nodes, node):
+        """Appends the compiled :node: to :nodes:, merging adjacent
+        LiteralNodes.
+        """
+
+        if isinstance(node, LiteralNode) and nodes and \
+                isinstance(nodes[-1], LiteralNode):
+            nodes[-1] = LiteralNode(nodes[-1].text + node.text)
+        else:
+            nodes.append(node)
+
+    def extract_required_parameters(self, nodes):
+        """Gets the names of the parameters in the compiled :nodes: that are
+        not inside an option.
+
+        Args:
+            nodes (tuple): A route compiled by :compile_route:.
+
+        Returns (tuple):
+            Each required parameter name once--in the order they first
+            appear.
+
+            example:
+                :route: '/eg/{p1}[/{o1}]/{p2}' -> ('p1', 'p2')
+        """
+
+        names = []
+        for node in nodes:
+            if isinstance(node, ParameterNode) and node.name not in names:
+                names.append(node.name)
+        return tuple(names)
+
+    def analyze_options(self, nodes, parent=None, requirements=None):
+        """Gets what each option in the compiled :nodes: needs in order to be
+        reversed.
+
+        Args:
+            nodes (tuple): A route compiled by :compile_route:.
+
+        Returns (tuple):
+            An OptionRequirement per option--in the order the options open.
+
+            example:
+                :route: '/eg[/{o1}[/{o2}]][/{o3}]' -> (
+                    OptionRequirement(frozenset(['o1']), None, True),
+                    OptionRequirement(frozenset(['o2']), 0, True),
+                    OptionRequirement(frozenset(['o3']), None, True),
+                )
+        """
+
+        requirements = [] if requirements is None else requirements
+        for node in nodes:
+            if not isinstance(node, OptionNode):
+                continue
+            index = len(requirements)
+            requirements.append(OptionRequirement(
+                frozenset(self.extract_required_parameters(node.children)),
+                parent,
+                not self._has_invalid_node(node.children)))
+            self.analyze_options(node.children, index, requirements)
+        return tuple(requirements)
+
+    def compile_validators(self, nodes):
+        """Compiles the validators of the typed parameters in the compiled
+        :nodes:.  Parameters of an unknown type are not validated.
+
+        Args:
+            nodes (tuple): A route compiled by :compile_route:.
+
+        Returns (dict):
+            Parameter names / keys and functions that take a value and
+            return whether or not it is valid.
+
+            example:
+                :route: '/eg/{p1:digits}/{p2}' -> {'p1': <digits validator>}
+        """
+
+        types = {}
+        self._collect_types(nodes, types)
+        # The registered types are read on every compile, so a type
+        # registered after these options were first used still counts.
+        custom = self._config.custom_validators
+        validators = {}
+        for name, type_names in types.items():
+            checks = [custom.get(type_name) or
+                      RSR_PARAMETER_TYPES.get(type_name)
+                      for type_name in type_names]
+            checks = [check for check in checks if check is not None]
+            if len(checks) == 1:
+                validators[name] = checks[0]
+            elif checks:
+                validators[name] = lambda value, checks=tuple(checks): all(
+                    check(value) for check in checks)
+        return validators
+
+    def _collect_types(self, nodes, types):
+        """Collects the type names of the typed parameters in the compiled
+        :nodes: into :types:.
+        """
+
+        for node in nodes:
+            if isinstance(node, ParameterNode) and node.type is not None:
+                type_names = types.setdefault(node.name, [])
+                if node.type not in type_names:
+                    type_names.append(node.type)
+            elif isinstance(node, OptionNode):
+                self._collect_types(node.children, types)
+
+    def supplied_parameters(self, parameters):
+        """Gets the names of THIS RSRReverser's parameters that are supplied
+        by the :parameters: with a valid value.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values.
+
+        Returns (frozenset):
+            The names of the supplied parameters.
+
+            example:
+                :self.route: '/eg/{p1:digits}[/{o1}][/{o2}]'
+                :parameters: {'p1': 'not_digits', 'o1': 'a', 'aside': 'b'}
+
+                    -> frozenset(['o1'])
+        """
+
+        return _supplied_parameters(self._names, self._validators,
+                                    parameters)
+
+    def extract_parameter_names(self, nodes):
+        """Gets the names of the parameters in the compiled :nodes:,
+        including those inside options.
+
+        Args:
+            nodes (tuple): A route compiled by :compile_route:.
+
+        Returns (tuple):
+            Each parameter name once--in the order they first appear.
+
+            example:
+                :route: '/eg/{p1}[/{o1}/{p1}]' -> ('p1', 'o1')
+        """
+
+        names = []
+        for node in nodes:
+            if isinstance(node, ParameterNode):
+                if node.name not in names:
+                    names.append(node.name)
+            elif isinstance(node, OptionNode):
+                for name in self.extract_parameter_names(node.children):
+                    if name not in names:
+                        names.append(name)
+        return tuple(names)
+
+    def substitute_parameters(self, parameters, route=None):
+        """Substitutes parameter values in place of parameter keys.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values.
+            route (str|None): The route to substitute values in place of keys
+                              or None to use THIS RSRReverser's route.
+
+        Returns (str):
+            The route--with the parameter keys substituted by the parameter 
+            values.
+
+            example:
+                :parameters: {
+                                'p1': 'examples',
+                                'p2': 'are',
+                                'p3': 'useful',
+                             }
+                :route: '/eg/{p1}/{p3}'
+                
+                    -> '/eg/examples/useful'
+        """
+
+        route = route if route else self.get_route()
+        encoders = self._encoders
+
+        def substitute(match):
+            name = match.group('name')
+            try:
+                value = parameters[name]
+            except KeyError:
+                try:
+                    value = parameters[name + (match.group(2) or '')]
+                except KeyError:
+                    return match.group()
+            encode = encoders.get(name)
+            return value if encode is None else encode(value)
+
+        return self._config.dialect.param_regex.sub(substitute, route)
+
+    def prune_options(self, parameters):
+        """Prunes any options that cannot be replaced due to unsupplied
+        parameters.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values.
+
+        Returns:
+            THIS RSRReverer's route--with any unsubstitutable options pruned.
+
+            example:
+                :self.route: '/eg[/{o1}[/{o2}]]/s1[/{o3}[/{o4}]]/s2[/{o5}]'
+                :parameters: {
+                                 'o1': 'nest_1',
+                                 'o2': 'replaced',
+                                 'o4': 'nest_2_not',
+                                 'aside': 'neither_is_o5',
+                             }
+                
+                    -> '/eg/{o1}/{o2}/s1/s2'
+        """
+
+        names = self.supplied_parameters(parameters)
+        parts = []
+        for node in self._template:
+            if isinstance(node, OptionNode):
+                items = []
+                if _prune(node.children, names, items):
+                    parts.extend(self._tokens(items))
+            elif isinstance(node, ParameterNode):
+                parts.append(node.token)
+            else:
+                parts.append(node.text)
+        return ''.join(parts)
+
+    def _tokens(self, items):
+        """Gets the route text of the literal text and ParameterNodes
+        appended to :items: by :_prune:.
+        """
+
+        return [item.token if isinstance(item, ParameterNode) else item
+                for item in items]
+
+    def is_reversed(self, route=None):
+        """Determines whether a :route: is reversed.
+
+        Args:
+            route (str|None): The route to substitute values in place of keys
+                              or None to use THIS RSRReverser's route.
+
+        Returns (bool):
+            Whehter or not the route is reversed.
+        """
+
+        route = route if route else self.get_route()
+        if route.find(self.option_bounds[0]) != -1:
+            return False
+        if route.find(self.option_bounds[1]) != -1:
+            return False
+        if route.find(self.param_bounds[0]) != -1:
+            return False
+        if route.find(self.param_bounds[1]) != -1:
+            return False
+        return True
+
+    def reverse(self, parameters):
+        """Reverses a Rails-style route.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values.
+
+        Returns (str):
+            THIS RSRReverser's route--reversed given the :parameters:.
+
+            example:
+                :self.route: '/eg[/{o1}[/{o2}]]/s1[/{o3}[/{o4}]]/s2/{p1}'
+                :parameters: {
+                                 'o1': 'nest_1',
+                                 'o2': 'replaced',
+                                 'o4': 'nest_2_not',
+                                 'p1': 'param_must_be_supplied',
+                             }
+                
+                    -> '/eg/nest_1/replaced/s1/s2/param_must_be_supplied'
+
+                :self.route: '/eg/{p1}'
                 :parameters: {
                                  'aside': 'this_fials_param_must_be_supplied',
                              }
                 
                     -> raises RouteParameterizationIrreversibleError  
+
+            If THIS RSRReverser has a reversed route cache, it is keyed by
+            the values of only the parameters in the route.
+        """
+
+        if self._url_cache is not None:
+            url = self._reverse_cached(parameters)
+        else:
+            url = self._reverse(parameters)
+        if self._query_skip is not None:
+            url += self.query_string(parameters)
+        return url
+
+    def query_string(self, parameters):
+        """Gets the query string of the :parameters: that are not in THIS
+        RSRReverser's route.
+
+        Args:
+            parameters (dict): A dictionary of parameter names / keys
+                               and values.  A list or tuple value repeats
+                               its key; None values are left out, as are
+                               the names in :query_exclude: if THIS
+                               RSRReverser was built with :query:.
+
+        Returns (str):
+            The encoded query string, sorted by name--or '' if there is
+            nothing to put in it.
+
+            example:
+                :self.route: '/eg/{p1}'
+                :parameters: {'p1': 'a', 'tag': ['x', 'y z'], 'q': 1}
+
+                    -> '?q=1&tag=x&tag=y%20z'
+        """
+
+        skip = self._query_skip
+        return _query_string(parameters,
+                             self._names if skip is None else skip)
+
+    def _reverse_cached(self, parameters):
+        """Reverses through THIS RSRReverser's reversed route cache."""
+
+        key = tuple([parameters[name] if name in parameters else _MISSING
+                     for name in self._names])
+        if self._config.shared_url_cache:
+            key = (self._cache_key, key)
+        try:
+            url = self._url_cache.get(key, _MISSING)
+        except TypeError:
+            return self._reverse(parameters)
+
+        if url is _MISSING:
+            try:
+                url = self._reverse(parameters)
+            except RouteParameterizationIrreversibleError:
+                url = None
+            self._url_cache.set(key, url)
+        if url is None:
+            raise RouteParameterizationIrreversibleError
+        return url
+
+    def _reverse(self, parameters):
+        """Reverses without THIS RSRReverser's reversed route cache."""
+
+        if self._reverse_function is not None:
+            return self._reverse_function(parameters)
+
+        names = self.supplied_parameters(parameters)
+        template = self.get_pruned_template(names)
+        if template is None:
+            raise RouteParameterizationIrreversibleError
+        return template.render(parameters)
+
+    def reverse_args(self, *values):
+        """Reverses THIS RSRReverser's route given positional parameter
+        values--without building a dictionary.
+
+        Args:
+            *values (str): The parameter values--in the order of
+                           :get_parameter_names:.  A value of None, or one
+                           left off the end, is not supplied.
+
+        Returns (str):
+            @see RSRReverser::reverse.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1}][/{o2}]'
+                :values: ('a', None, 'c')
+
+                    -> '/eg/a/c'
+
+            For rows from a database cursor:
+
+                urls = itertools.starmap(reverser.reverse_args, rows)
+        """
+
+        key = _positional_key(self._names, self._positional_validators,
+                              values)
+        try:
+            template = self._positional_templates[key]
+        except KeyError:
+            template = self.get_positional_template(key)
+        if template is None:
+            raise RouteParameterizationIrreversibleError
+        return template.render(values)
+
+    def reverse_kw(self, **parameters):
+        """Reverses THIS RSRReverser's route given keyword parameter values.
+
+        Returns (str):
+            @see RSRReverser::reverse.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1}]'
+
+                reverse_kw(p1='a', o1='b') -> '/eg/a/b'
+        """
+
+        return self.reverse(parameters)
+
+    def get_positional_template(self, missing):
+        """Gets THIS RSRReverser's route with its options decided for
+        positional parameter values--from the cache if possible.
+
+        Args:
+            missing (tuple): Whether or not each positional value is not
+                             supplied--in the order of
+                             :get_parameter_names:.  Positions past its end
+                             are not supplied.
+
+        Returns (PrunedTemplate|None):
+            @see RSRReverser::prune_template--but with the position of each
+            parameter in :slots: instead of its name.
+        """
+
+        template = _positional_template(self.get_pruned_template,
+                                        self._names, missing)
+        maxsize = self._cache.maxsize
+        if maxsize is None or len(self._positional_templates) < maxsize:
+            self._positional_templates[missing] = template
+        return template
+
+    def reverse_many(self, records, on_error=ON_ERROR_RAISE, default=None):
+        """Reverses THIS RSRReverser's route once per record--lazily.
+
+        Args:
+            records (iterable): Dictionaries of parameter names / keys and
+                                values.
+            on_error (str): What to do with a record the route cannot be
+                            reversed for: ON_ERROR_RAISE to raise
+                            RouteParameterizationIrreversibleError,
+                            ON_ERROR_SKIP to yield nothing for it or
+                            ON_ERROR_DEFAULT to yield :default:.
+            default (var): @see :on_error:.
+
+        Returns (generator):
+            The reversed routes--in the order of the :records:.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1}]'
+                :records: [{'p1': 'a'}, {'o1': 'b'}, {'p1': 'c', 'o1': 'd'}]
+                :on_error: ON_ERROR_DEFAULT
+
+                    -> '/eg/a', None, '/eg/c/d'
+        """
+
+        _check_on_error(on_error)
+        return self._reverse_many(records, on_error, default)
+
+    def _reverse_many(self, records, on_error, default):
+        """The generator behind :reverse_many:."""
+
+        reverse_function = self._reverse_function
+        query_string = self.query_string \
+            if self._query_skip is not None else None
+        route_names = self._names
+        validated = bool(self._validators)
+        supplied_parameters = self.supplied_parameters
+        get_pruned_template = self.get_pruned_template
+        templates = {}
+        maxsize = self._cache.maxsize
+        for parameters in records:
+            if reverse_function is not None:
+                try:
+                    url = reverse_function(parameters)
+                except RouteParameterizationIrreversibleError:
+                    template = None
+                else:
+                    if query_string is not None:
+                        url += query_string(parameters)
+                    yield url
+                    continue
+            else:
+                if validated:
+                    names = supplied_parameters(parameters)
+                else:
+                    names = frozenset([name for name in route_names
+                                       if name in parameters])
+                try:
+                    template = templates[names]
+                except KeyError:
+                    template = get_pruned_template(names)
+                    if maxsize is None or len(templates) < maxsize:
+                        templates[names] = template
+                if template is not None:
+                    if template.encoders is not None or \
+                            query_string is not None:
+                        url = template.render(parameters)
+                        if query_string is not None:
+                            url += query_string(parameters)
+                        yield url
+                        continue
+                    parts = list(template.parts)
+                    for index, name in template.slots:
+                        parts[index] = parameters[name]
+                    yield ''.join(parts)
+                    continue
+
+            if on_error == ON_ERROR_RAISE:
+                raise RouteParameterizationIrreversibleError
+            if on_error == ON_ERROR_DEFAULT:
+                yield default
+
+    def areverse_many(self, records, batch_size=None,
+                      on_error=ON_ERROR_RAISE, default=None, executor=None,
+                      concurrency=2):
+        """Reverses THIS RSRReverser's route once per record of an async
+        source--yielding to the event loop between batches.
+
+        Args:
+            records (iterable): An async iterable (or plain iterable) of
+                                dictionaries of parameter names / keys and
+                                values.
+            batch_size (int|None): The number of records reversed between
+                                   yields to the event loop--or None for
+                                   reverser_async.RSR_BATCH_SIZE.
+            on_error (str): @see RSRReverser::reverse_many.
+            default (var): @see RSRReverser::reverse_many.
+            executor (concurrent.futures.Executor|None): An executor to
+                                                         offload batches
+                                                         to--or None to
+                                                         reverse them on the
+                                                         event loop.
+            concurrency (int): The most batches in the :executor: at once.
+
+        Returns (async generator):
+            The reversed routes--in the order of the :records:.
+
+            example:
+                async for url in reverser.areverse_many(cursor):
+                    await sink.write(url)
+        """
+
+        import reverser_async
+
+        _check_on_error(on_error)
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1, not %r' %
+                             concurrency)
+        return reverser_async.areverse_many(
+            self, records, batch_size or reverser_async.RSR_BATCH_SIZE,
+            on_error, default, executor, concurrency)
+
+    def reverse_columns(self, columns, on_error=ON_ERROR_RAISE, default=None,
+                        as_array=False):
+        """Reverses THIS RSRReverser's route once per row of parameter
+        columns.
+
+        Rows are grouped by which of their values are missing, so the
+        options are decided once per group instead of once per row.
+
+        Args:
+            columns (dict): Parameter names / keys and equally long sequences
+                            (or NumPy arrays) of values.  None, or a masked
+                            NumPy value, marks a missing value.
+            on_error (str): @see RSRReverser::reverse_many.  ON_ERROR_SKIP
+                            leaves the row out of the result.
+            default (var): @see RSRReverser::reverse_many.
+            as_array (bool): Whether or not to return a NumPy object array
+                             instead of a list.
+
+        Returns (list|numpy.ndarray):
+            The reversed routes--in the order of the rows.  Values are
+            substituted with %s formatting.  With :query:, columns that are
+            not in the route make up each row's query string.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1}]'
+                :columns: {
+                              'p1': ['a', 'b', 'c'],
+                              'o1': [None, 'd', None],
+                          }
+
+                    -> ['/eg/a', '/eg/b/d', '/eg/c']
+        """
+
+        _check_on_error(on_error)
+        if as_array and numpy is None:
+            raise ImportError('as_array requires NumPy')
+
+        values = {}
+        for name, column in columns.items():
+            values[name] = column.tolist() if hasattr(column, 'tolist') \
+                else column
+        lengths = set(len(column) for column in values.values())
+        if len(lengths) > 1:
+            raise ValueError('columns must all have the same length')
+        length = lengths.pop() if lengths else 0
+
+        validators = self._validators
+        names = [name for name in self._names if name in values]
+        optional = [name for name in names
+                    if name in validators or None in values[name]]
+        required = frozenset(names).difference(optional)
+        if optional:
+            masks = list(zip(*[self._mask(values[name],
+                                          validators.get(name))
+                               for name in optional]))
+        else:
+            masks = [()] * length
+        groups = {}
+        for row, mask in enumerate(masks):
+            groups.setdefault(mask, []).append(row)
+
+        skipped = []
+        failed = []
+        encoded = {}
+        results = [None] * length
+        for mask, rows in groups.items():
+            supplied = required.union(itertools.compress(optional, mask))
+            template = self.get_pruned_template(supplied)
+            if template is None:
+                if on_error == ON_ERROR_RAISE:
+                    raise RouteParameterizationIrreversibleError
+                failed.extend(rows)
+                if on_error == ON_ERROR_SKIP:
+                    skipped.extend(rows)
+                for row in rows:
+                    results[row] = default
+                continue
+
+            format_string = template.format_string()
+            slot_values = [self._encoded(values, encoded, name)
+                           for index, name in template.slots]
+            if len(rows) == length and slot_values:
+                results = [format_string % row for row in zip(*slot_values)]
+            else:
+                for row in rows:
+                    results[row] = format_string % tuple(
+                        [column[row] for column in slot_values])
+
+        extra = sorted([name for name in values
+                        if name not in self._query_skip]) \
+            if self._query_skip is not None else None
+        if extra:
+            failed = set(failed)
+            for row in range(length):
+                if row not in failed:
+                    results[row] += _query_string(dict(
+                        [(name, values[name][row]) for name in extra]), ())
+
+        if skipped:
+            skipped = set(skipped)
+            results = [result for row, result in enumerate(results)
+                       if row not in skipped]
+        if as_array:
+            array = numpy.empty(len(results), dtype=object)
+            array[:] = results
+            return array
+        return results
+
+    def _encoded(self, values, encoded, name):
+        """Gets the column of values for the parameter with the :name:,
+        encoded once and kept in :encoded: if the parameter is encoded.
+        """
+
+        encode = self._encoders.get(name)
+        if encode is None:
+            return values[name]
+        if name not in encoded:
+            encoded[name] = [None if value is None else encode(value)
+                             for value in values[name]]
+        return encoded[name]
+
+    def _mask(self, column, validator):
+        """Gets whether each value in the :column: counts as supplied."""
+
+        if validator is None:
+            return [value is not None for value in column]
+        return [value is not None and validator(value) for value in column]
+
+    def reverse_parallel(self, records, processes=None,
+                         chunksize=RSR_CHUNK_SIZE, on_error=ON_ERROR_RAISE,
+                         default=None):
+        """Reverses THIS RSRReverser's route once per record in a pool of
+        worker processes--lazily.
+
+        Each worker builds its own copy of THIS RSRReverser once.  Records
+        are streamed to the workers in chunks--at most two per worker at a
+        time, so memory stays flat however many records there are--and the
+        results come back in the order of the :records:.
+
+        Args:
+            records (iterable): Picklable dictionaries of parameter names /
+                                keys and values.
+            processes (int|None): The number of worker processes--or None for
+                                  one per CPU.
+            chunksize (int): The number of records sent to a worker at once.
+            on_error (str): @see RSRReverser::reverse_many.
+            default (var): @see RSRReverser::reverse_many.
+
+        Returns (generator):
+            The reversed routes--in the order of the :records:.
+        """
+
+        _check_on_error(on_error)
+        if chunksize < 1:
+            raise ValueError('chunksize must be at least 1, not %r' %
+                             chunksize)
+        return self._reverse_parallel(records, processes, chunksize, on_error,
+                                      default)
+
+    def _reverse_parallel(self, records, processes, chunksize, on_error,
+                          default):
+        """The generator behind :reverse_parallel:."""
+
+        processes = processes or multiprocessing.cpu_count()
+        pool = multiprocessing.Pool(processes, _init_worker,
+                                    (self.get_route(), self._rebuild_options(),
+                                     self._bound))
+        try:
+            for results in _bounded_imap(pool, _chunk(records, chunksize),
+                                         2 * processes):
+                for result in results:
+                    if result is not None:
+                        yield result
+                    elif on_error == ON_ERROR_RAISE:
+                        raise RouteParameterizationIrreversibleError
+                    elif on_error == ON_ERROR_DEFAULT:
+                        yield default
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _rebuild_options(self):
+        """Gets the values of the _REBUILD_OPTIONS keyword arguments that
+        rebuild THIS RSRReverser in another process--all but its caches,
+        which are not shared there.
+        """
+
+        config = self._config
+        return (config.dialect, config.encode,
+                config.query_exclude is not None, config.query_exclude,
+                config.codegen, config.validate, config.custom_types,
+                self._cache.maxsize)
+
+    def get_pruned_template(self, names):
+        """Gets THIS RSRReverser's route with its options decided for a set
+        of supplied parameter names--from the cache if possible.
+
+        Args:
+            names (frozenset): The names of the supplied parameters.
+
+        Returns (PrunedTemplate|None):
+            @see RSRReverser::prune_template.
+        """
+
+        key = (self._cache_key, names) if self._config.shared_cache else names
+        template = self._cache.get(key, self._cache)
+        if template is self._cache:
+            template = self.prune_template(names)
+            self._cache.set(key, template)
+        return template
+
+    def prune_template(self, names):
+        """Decides THIS RSRReverser's options for a set of supplied parameter
+        names.
+
+        Args:
+            names (set|frozenset): The names of the supplied parameters.
+
+        Returns (PrunedTemplate|None):
+            The route with the options that can be reversed kept and the
+            others dropped--or None if the route cannot be reversed.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1}][/{o2}]'
+                :names: frozenset(['p1', 'o2'])
+
+                    -> PrunedTemplate(('/eg/', None, '/', None),
+                                      ((1, 'p1'), (3, 'o2')))
+        """
+
+        return prune_nodes(self._template, names, self._encoders)
+
+    def match(self, url):
+        """Matches a :url: against THIS RSRReverser's route--the opposite of
+        :reverse:.
+
+        Args:
+            url (str): A URL path.
+
+        Returns (dict|None):
+            The parameter names / keys and values the :url: was reversed
+            from--or None if it does not match the route.  A parameter
+            matches as few characters other than '/' as it can, so options
+            after it are kept, unless its type has a regular expression--or
+            it is encoded with ENCODE_PATH, which leaves '/' as it is.
+            URL-encoded values are decoded.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1:digits}]'
+                :url: '/eg/a/2' -> {'p1': 'a', 'o1': '2'}
+                :url: '/eg/a' -> {'p1': 'a'}
+                :url: '/eg/a/b' -> None
+        """
+
+        if self._matcher is None:
+            self._matcher = self.compile_match_regex()
+        return _match_parameters(self._matcher, url, self._validators,
+                                 self._encoders)
+
+    def compile_match_regex(self):
+        """Compiles THIS RSRReverser's route into one regular expression that
+        matches the URLs it reverses to.
+
+        Options become optional groups (unless they have no parameters of
+        their own, which are always reversed) and parameters become named
+        groups, constrained by their type's regular expression if it has
+        one.  Parameters encoded with ENCODE_PATH (or another encoder whose
+        safe characters include '/') match across '/'.
+
+        Returns (tuple):
+            The compiled regular expression and a dictionary of its group
+            names / keys and parameter names.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1:digits}]'
+
+                    -> '/eg/(?P<g0>(?:[^/]+?))(?:/(?P<g1>(?:[0-9]+)))?\\Z',
+                       {'g0': 'p1', 'g1': 'o1'}
+        """
+
+        return _compile_match_regex(self._template, self._validators,
+                                    self._encoders)
+
+    def generate_reverse_source(self, name='reverse'):
+        """Generates the source of a Python function dedicated to reversing
+        THIS RSRReverser's route.
+
+        Required parameters become direct dictionary lookups and options
+        become nested if statements around literal string concatenation.
+
+        Args:
+            name (str): The name of the generated function.
+
+        Returns (str):
+            The function's source.
+
+            example:
+                :self.route: '/eg/{p1}[/{o1}]'
+
+                    -> def reverse(parameters):
+                           try:
+                               v0 = parameters['p1']
+                           except KeyError:
+                               raise RouteParameterizationIrreversibleError
+                           s0 = '/eg/' + v0
+                           if 'o1' in parameters:
+                               v1 = parameters['o1']
+                               s0 += '/' + v1
+                           return s0
+        """
+
+        lines = ['def %s(parameters):' % name]
+        if self._has_invalid_node(self._template):
+            lines.append('    raise RouteParameterizationIrreversibleError')
+            return '\n'.join(lines) + '\n'
+
+        variables = {}
+        counter = itertools.count()
+        names = self._new_names(self._template, variables)
+        if names:
+            lines.append('    try:')
+            for param in names:
+                variables[param] = 'v%d' % next(counter)
+                lines.append('        %s = parameters[%r]' %
+                             (variables[param], param))
+            lines.append('    except KeyError:')
+            lines.append('        raise '
+                         'RouteParameterizationIrreversibleError')
+            checks = ['not %s(%s)' % (self._validator_name(param),
+                                      variables[param])
+                      for param in names if param in self._validators]
+            if checks:
+                lines.append('    if %s:' % ' or '.join(checks))
+                lines.append('        raise '
+                             'RouteParameterizationIrreversibleError')
+
+        pieces = []
+        assigned = [False]
+        self._generate(self._template, pieces, assigned, variables, counter,
+                       lines, 1)
+        self._flush(pieces, assigned, lines, 1, force=True)
+        lines.append('    return s0')
+        return '\n'.join(lines) + '\n'
+
+    def compile_reverse_function(self):
+        """Compiles the source from :generate_reverse_source:.
+
+        Returns (function):
+            A function that takes a dictionary of parameters and behaves
+            exactly like :reverse:.
+        """
+
+        namespace = {
+            'RouteParameterizationIrreversibleError':
+                RouteParameterizationIrreversibleError,
+        }
+        for name, validator in self._validators.items():
+            namespace[self._validator_name(name)] = validator
+        for name, encoder in self._encoders.items():
+            namespace[self._encoder_name(name)] = encoder
+        code = compile(self.generate_reverse_source(), '<rsr-reverse %r>' %
+                       self.get_route(), 'exec')
+        exec(code, namespace)
+        return namespace['reverse']
+
+    def _has_invalid_node(self, nodes):
+        """Determines whether any of the :nodes: (not counting nested ones)
+        is an InvalidNode.
+        """
+
+        return any(isinstance(node, InvalidNode) for node in nodes)
+
+    def _new_names(self, nodes, variables):
+        """Gets the names of the ParameterNodes among the :nodes: (not
+        counting nested ones) that have no generated variable yet--in order.
+        """
+
+        names = []
+        for node in nodes:
+            if isinstance(node, ParameterNode) and \
+                    node.name not in variables and node.name not in names:
+                names.append(node.name)
+        return names
+
+    def _generate(self, nodes, pieces, assigned, variables, counter, lines,
+                  depth):
+        """Appends the statements that concatenate the compiled :nodes: onto
+        the generated s0 variable to :lines:.
+
+        Literal text and parameter variables are collected in :pieces: until
+        an option needs its own if statement.
+        """
+
+        for node in nodes:
+            if isinstance(node, LiteralNode):
+                pieces.append(repr(node.text))
+            elif isinstance(node, ParameterNode):
+                if node.name in self._encoders:
+                    pieces.append('%s(%s)' % (self._encoder_name(node.name),
+                                              variables[node.name]))
+                else:
+                    pieces.append(variables[node.name])
+            elif self._has_invalid_node(node.children):
+                continue
+            else:
+                names = self._new_names(node.children, variables)
+                if not names:
+                    self._generate(node.children, pieces, assigned, variables,
+                                   counter, lines, depth)
+                    continue
+
+                indent = '    ' * depth
+                self._flush(pieces, assigned, lines, depth, force=True)
+                lines.append('%sif %s:' % (indent, ' and '.join(
+                    self._condition(param) for param in names)))
+                option_variables = dict(variables)
+                for param in names:
+                    option_variables[param] = 'v%d' % next(counter)
+                    lines.append('%s    %s = parameters[%r]' %
+                                 (indent, option_variables[param], param))
+                self._generate(node.children, pieces, assigned,
+                               option_variables, counter, lines, depth + 1)
+                self._flush(pieces, assigned, lines, depth + 1)
+
+    def _validator_name(self, name):
+        """Gets the name of the parameter's validator in the generated code.
+        """
+
+        return 'validate_%d' % self._names.index(name)
+
+    def _encoder_name(self, name):
+        """Gets the name of the parameter's encoder in the generated code."""
+
+        return 'encode_%d' % self._names.index(name)
+
+    def _condition(self, name):
+        """Gets the generated condition for the parameter being supplied."""
+
+        if name not in self._validators:
+            return '%r in parameters' % name
+        return '(%r in parameters and %s(parameters[%r]))' % (
+            name, self._validator_name(name), name)
+
+    def _flush(self, pieces, assigned, lines, depth, force=False):
+        """Appends the statement that concatenates the collected :pieces:
+        onto the generated s0 variable to :lines:.
+        """
+
+        if not pieces and not (force and not assigned[0]):
+            return
+        operator = '+=' if assigned[0] else '='
+        lines.append('%ss0 %s %s' % ('    ' * depth, operator,
+                                     ' + '.join(pieces) or "''"))
+        assigned[0] = True
+        del pieces[:]
+
+
+class CompiledRoute(object):
+    """An immutable, compiled route that any number of threads can reverse
+    and match with at once--without locks.
+
+    Pruned templates are memoized in plain dictionaries and the match
+    regex in a one-element list: every thread that misses computes the
+    same value, so a race only costs repeated work.
+    @see RSRReverser::compile.
+
+    A CompiledRoute pickles as its route and options and is compiled again
+    when unpickled--e.g. in a worker process--so any custom types and
+    encode functions must be picklable too.
+    """
+
+    __slots__ = ('_route', '_template', '_names', '_required', '_reversible',
+                 '_validators', '_positional_validators', '_encoders',
+                 '_query_skip',
+                 '_reverse_function', '_matcher_cache', '_templates',
+                 '_positional_templates', '_maxsize', '_rebuild')
+
+    def __init__(self, reverser):
+        """Constructs a new CompiledRoute.
+
+        Args:
+            reverser (RSRReverser): The reverser to snapshot.
+        """
+
+        names = reverser.get_parameter_names()
+        validators = dict(reverser.get_validators())
+        attributes = {
+            '_route': reverser.get_route(),
+            '_template': reverser.get_template(),
+            '_names': names,
+            '_required': reverser.get_required_parameters(),
+            '_reversible': reverser._reversible,
+            '_validators': validators,
+            '_encoders': dict(reverser._encoders),
+            '_query_skip': reverser._query_skip,
+            '_positional_validators': tuple(
+                [validators.get(name) for name in names])
+            if validators else None,
+            '_reverse_function': reverser._reverse_function,
+            '_matcher_cache': [None],
+            '_templates': {},
+            '_positional_templates': {},
+            '_maxsize': reverser._cache.maxsize,
+            '_rebuild': reverser._rebuild_options() + (
+                reverser._bound or None,),
+        }
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return _unpickle_compiled_route, (self._route, self._rebuild[:-1],
+                                          self._rebuild[-1])
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CompiledRoute is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('CompiledRoute is immutable')
+
+    def get_route(self):
+        """Gets THIS CompiledRoute's route.
+
+        Returns (str):
+            @see RSRReverser::get_route.
+        """
+
+        return self._route
+
+    def get_template(self):
+        """Gets THIS CompiledRoute's compiled nodes.
+
+        Returns (tuple):
+            @see RSRReverser::compile_route.
+        """
+
+        return self._template
+
+    def get_parameter_names(self):
+        """Gets the names of the parameters in THIS CompiledRoute.
+
+        Returns (tuple):
+            @see RSRReverser::extract_parameter_names.
+        """
+
+        return self._names
+
+    def get_required_parameters(self):
+        """Gets the names of the parameters THIS CompiledRoute cannot be
+        reversed without.
+
+        Returns (tuple):
+            @see RSRReverser::extract_required_parameters.
         """
 
-        pruned_route = self.prune_options(parameters)
-        reversed_route = self.substitute_parameters(parameters, pruned_route)
-        if not self.is_reversed(reversed_route):
+        return self._required
+
+    def supplied_parameters(self, parameters):
+        """@see RSRReverser::supplied_parameters."""
+
+        return _supplied_parameters(self._names, self._validators,
+                                    parameters)
+
+    def can_reverse(self, parameters):
+        """@see RSRReverser::can_reverse."""
+
+        return self._reversible and \
+            _has_required(self._required, self._validators, parameters)
+
+    def missing_parameters(self, parameters):
+        """@see RSRReverser::missing_parameters."""
+
+        return _missing_parameters(self._required, self._validators,
+                                   parameters)
+
+    def reverse(self, parameters):
+        """@see RSRReverser::reverse."""
+
+        if self._reverse_function is not None:
+            url = self._reverse_function(parameters)
+        else:
+            template = self.get_pruned_template(
+                self.supplied_parameters(parameters))
+            if template is None:
+                raise RouteParameterizationIrreversibleError
+            url = template.render(parameters)
+        if self._query_skip is not None:
+            url += _query_string(parameters, self._query_skip)
+        return url
+
+    def reverse_args(self, *values):
+        """@see RSRReverser::reverse_args."""
+
+        key = _positional_key(self._names, self._positional_validators,
+                              values)
+        try:
+            template = self._positional_templates[key]
+        except KeyError:
+            template = self.get_positional_template(key)
+        if template is None:
             raise RouteParameterizationIrreversibleError
-        return reversed_route
+        return template.render(values)
+
+    def reverse_kw(self, **parameters):
+        """@see RSRReverser::reverse_kw."""
+
+        return self.reverse(parameters)
+
+    def get_pruned_template(self, names):
+        """@see RSRReverser::get_pruned_template."""
+
+        try:
+            return self._templates[names]
+        except KeyError:
+            template = prune_nodes(self._template, names, self._encoders)
+        if self._maxsize is None or len(self._templates) < self._maxsize:
+            self._templates[names] = template
+        return template
+
+    def get_positional_template(self, missing):
+        """@see RSRReverser::get_positional_template."""
+
+        template = _positional_template(self.get_pruned_template,
+                                        self._names, missing)
+        if self._maxsize is None or \
+                len(self._positional_templates) < self._maxsize:
+            self._positional_templates[missing] = template
+        return template
+
+    def match(self, url):
+        """@see RSRReverser::match."""
+
+        matcher = self._matcher_cache[0]
+        if matcher is None:
+            matcher = self._matcher_cache[0] = _compile_match_regex(
+                self._template, self._validators, self._encoders)
+        return _match_parameters(matcher, url, self._validators,
+                                 self._encoders)
+
+
+class RouteRegistry(object):
+    """A registry of named routes whose RSRReversers are built on first use
+    and share one pruned template cache.
+
+    Routes are registered under a name, a callable (e.g. the callback the
+    route is mapped to) or both.
+    """
+
+    def __init__(self, routes=None, cache_size=RSR_REGISTRY_CACHE_SIZE,
+                 url_cache_size=None, **options):
+        """Constructs a new RouteRegistry.
+
+        Args:
+            routes (dict|None): Names or callables / keys and routes to add.
+            cache_size (int|None): @see LRUCache::maxsize.
+            url_cache_size (int|None): The most reversed routes to cache
+                                       across all routes--or None to not
+                                       cache reversed routes.
+            options (dict): Keyword arguments for every RSRReverser; e.g.
+                            option_bounds or codegen.
+        """
+
+        self._routes = {}
+        self._reversers = {}
+        self._cache = LRUCache(cache_size)
+        self._url_cache = None if url_cache_size is None \
+            else LRUCache(url_cache_size)
+        self._options = options
+        for key, route in (routes or {}).items():
+            self.add(key, route)
+
+    def add(self, key, route):
+        """Adds a :route: to THIS RouteRegistry.  It is compiled on first
+        use.
+
+        Args:
+            key (str|callable): The route's name or callable.
+            route (str): A Rails-style route.
+        """
+
+        self._routes[key] = route
+        self._reversers.pop(key, None)
+
+    def route(self, route, name=None):
+        """Gets a decorator that adds a :route: for the decorated callable
+        (and the :name:, if given).
+
+        example:
+            @registry.route('/hello/{param}', name='hello')
+            def say_hello(param):
+                ...
+
+            registry.reverse(say_hello, {'param': 'World'}) -> '/hello/World'
+        """
+
+        def decorator(method):
+            self.add(method, route)
+            if name is not None:
+                self.add(name, route)
+            return method
+        return decorator
+
+    def get_route(self, key):
+        """Gets the route added under the :key:.
+
+        Raises:
+            UnknownRouteError: If no route was added under the :key:.
+        """
+
+        try:
+            return self._routes[key]
+        except KeyError:
+            raise UnknownRouteError(key)
+
+    def get_reverser(self, key):
+        """Gets the RSRReverser for the route added under the :key:--building
+        it on first use.
+
+        Raises:
+            UnknownRouteError: If no route was added under the :key:.
+        """
+
+        try:
+            return self._reversers[key]
+        except KeyError:
+            pass
+        reverser = RSRReverser(self.get_route(key), cache=self._cache,
+                               url_cache=self._url_cache, **self._options)
+        self._reversers[key] = reverser
+        return reverser
+
+    def reverse(self, key, parameters):
+        """Reverses the route added under the :key:.
+
+        @see RSRReverser::reverse.
+
+        Raises:
+            UnknownRouteError: If no route was added under the :key:.
+        """
+
+        return self.get_reverser(key).reverse(parameters)
+
+    def reverse_many(self, records, route_key='route',
+                     on_error=ON_ERROR_RAISE, default=None):
+        """Reverses each record with the route it names--lazily.
+
+        Args:
+            records (iterable): Dictionaries of parameter names / keys and
+                                values.
+            route_key (str): The record key naming the route.
+            on_error (str): @see RSRReverser::reverse_many.  A record that
+                            names no route--or an unknown one--is an error
+                            too.
+            default (var): @see RSRReverser::reverse_many.
+
+        Returns (generator):
+            The reversed routes--in the order of the :records:.
+        """
+
+        _check_on_error(on_error)
+        return self._reverse_many(records, route_key, on_error, default)
+
+    def _reverse_many(self, records, route_key, on_error, default):
+        """The generator behind :reverse_many:."""
+
+        query = self._options.get('query')
+        for parameters in records:
+            try:
+                key = parameters[route_key]
+                if query:
+                    # The key names the route--it is not a query parameter.
+                    parameters = dict(parameters)
+                    del parameters[route_key]
+                url = self.reverse(key, parameters)
+            except (KeyError, RouteParameterizationIrreversibleError):
+                if on_error == ON_ERROR_RAISE:
+                    raise
+                if on_error == ON_ERROR_DEFAULT:
+                    yield default
+                continue
+            yield url
+
+    def cache_info(self):
+        """Gets the statistics of the pruned template cache shared by THIS
+        RouteRegistry's RSRReversers.
+
+        Returns (CacheInfo):
+            The hits, misses, maxsize and current size.
+        """
+
+        return self._cache.info()
+
+    def url_cache_info(self):
+        """Gets the statistics of the reversed route cache shared by THIS
+        RouteRegistry's RSRReversers.
+
+        Returns (CacheInfo|None):
+            The hits, misses, maxsize and current size--or None if THIS
+            RouteRegistry does not cache reversed routes.
+        """
+
+        if self._url_cache is None:
+            return None
+        return self._url_cache.info()
+
+    def clear_url_cache(self):
+        """Empties the reversed route cache shared by THIS RouteRegistry's
+        RSRReversers.
+        """
+
+        if self._url_cache is not None:
+            self._url_cache.clear()
+
+    def __contains__(self, key):
+        return key in self._routes
+
+    def __len__(self):
+        return len(self._routes)
+
+
+class _TooManyVariants(Exception):
+    """Raised while expanding a route with more option combinations than a
+    Router puts in its tree."""
+
+
+class _RouterNode(object):
+    """A node of a Router's radix tree.
+
+    Attributes:
+        edges (dict): First characters / keys and [text, _RouterNode] pairs
+                      for literal text.
+        params (list): (validator, encoder, _RouterNode) triples for
+                       parameters--shared by every route with the same type
+                       and encoding at this position, whatever they name
+                       the parameter.
+        routes (list): (name, parameter names) pairs for the routes that
+                       end at this node--in the order they were added.
+    """
+
+    __slots__ = ('edges', 'params', 'routes')
+
+    def __init__(self):
+        self.edges = {}
+        self.params = []
+        self.routes = []
+
+
+class Router(object):
+    """Matches URL paths against many routes at once.
+
+    Every combination of each route's options is inserted into a radix
+    tree of literal text and parameters, so a lookup costs time in the
+    length of the path instead of the number of routes.  A parameter
+    matches as few characters other than '/' as it can, like
+    RSRReverser::match--unless it is encoded with ENCODE_PATH, which
+    leaves '/' as it is.  URL-encoded values are
+    decoded.  Literal text is tried before parameters, and routes added
+    earlier win ties.
+    """
+
+    def __init__(self, routes=None, max_variants=RSR_ROUTER_MAX_VARIANTS,
+                 **options):
+        """Constructs a new Router.
+
+        Args:
+            routes (dict|list|None): Names / keys and routes to add--or a
+                                     list of (name, route) pairs.
+            max_variants (int): The most option combinations of a single
+                                route to put in the tree.  Routes with more
+                                are matched one by one after the tree.
+            options (dict): Keyword arguments for every RSRReverser; e.g.
+                            param_bounds or types.
+        """
+
+        self._root = _RouterNode()
+        self._fallbacks = []
+        self._max_variants = max_variants
+        if options.get('types'):
+            options['types'] = dict(
+                (type_name, compile_validator(validator))
+                for type_name, validator in options['types'].items())
+        self._options = options
+        routes = routes.items() if hasattr(routes, 'items') else routes
+        for name, route in routes or ():
+            self.add(name, route)
+
+    def add(self, name, route):
+        """Adds a :route: to THIS Router.
+
+        Args:
+            name (var): The name the route is matched as.
+            route (str): A Rails-style route.
+        """
+
+        reverser = RSRReverser(route, **self._options)
+        try:
+            variants = self.expand_options(reverser.get_template())
+        except _TooManyVariants:
+            self._fallbacks.append((name, reverser))
+            return
+
+        validators = reverser.get_validators()
+        encoders = reverser.pick_encoders(reverser.get_parameter_names())
+        for variant in variants:
+            node = self._root
+            names = []
+            for item in variant:
+                if isinstance(item, ParameterNode):
+                    node = self._insert_param(node,
+                                              validators.get(item.name),
+                                              encoders.get(item.name))
+                    names.append(item.name)
+                elif item:
+                    node = self._insert_text(node, item)
+            node.routes.append((name, tuple(names)))
+
+    def expand_options(self, nodes):
+        """Expands the compiled :nodes: into every combination of their
+        options.
+
+        Args:
+            nodes (tuple): A route compiled by :compile_route:.
+
+        Returns (list):
+            Lists of literal text and ParameterNodes--one per combination of
+            options that can be reversed.
+
+            example:
+                :route: '/eg[/{o1}]' -> [
+                    ['/eg', '/', ParameterNode('o1', None, '{o1}')],
+                    ['/eg'],
+                ]
+        """
+
+        variants = [[]]
+        for node in nodes:
+            if isinstance(node, LiteralNode):
+                for variant in variants:
+                    variant.append(node.text)
+            elif isinstance(node, ParameterNode):
+                for variant in variants:
+                    variant.append(node)
+            elif isinstance(node, InvalidNode):
+                return []
+            elif not any(isinstance(child, InvalidNode)
+                         for child in node.children):
+                options = self.expand_options(node.children)
+                if any(isinstance(child, ParameterNode)
+                       for child in node.children):
+                    options.append([])
+                # Each variant keeps its options before leaving them out,
+                # so earlier options win like they do in match().
+                variants = [variant + option for variant in variants
+                            for option in options]
+            if len(variants) > self._max_variants:
+                raise _TooManyVariants
+        return variants
+
+    def _insert_text(self, node, text):
+        """Inserts literal :text: below the :node:, splitting edges as
+        needed.
+
+        Returns (_RouterNode):
+            The node the :text: ends at.
+        """
+
+        while text:
+            edge = node.edges.get(text[0])
+            if edge is None:
+                child = _RouterNode()
+                node.edges[text[0]] = [text, child]
+                return child
+
+            edge_text, child = edge
+            common = 0
+            limit = min(len(text), len(edge_text))
+            while common < limit and text[common] == edge_text[common]:
+                common += 1
+            if common < len(edge_text):
+                middle = _RouterNode()
+                middle.edges[edge_text[common]] = [edge_text[common:], child]
+                edge[0] = edge_text[:common]
+                edge[1] = middle
+                child = middle
+            node = child
+            text = text[common:]
+        return node
+
+    def _insert_param(self, node, validator, encoder):
+        """Inserts a parameter below the :node:.
+
+        Parameters are keyed by their validator and encoder alone; the
+        routes ending below name them.
+
+        Returns (_RouterNode):
+            The node the parameter ends at.
+        """
+
+        for param_validator, param_encoder, child in node.params:
+            if param_validator is validator and param_encoder is encoder:
+                return child
+        child = _RouterNode()
+        node.params.append((validator, encoder, child))
+        return child
+
+    def match(self, path):
+        """Matches a URL :path: against THIS Router's routes.
+
+        Args:
+            path (str): A URL path.
+
+        Returns (RouteMatch|None):
+            The name of the matching route and its parameters--or None if
+            no route matches.
+
+            example:
+                :routes: {'song': '/mixna/{artist}/{song}[/{page}]'}
+                :path: '/mixna/a/b' ->
+                    RouteMatch('song', {'artist': 'a', 'song': 'b'})
+        """
+
+        found = self._lookup(self._root, path, 0, [])
+        if found is not None:
+            return found
+        for name, reverser in self._fallbacks:
+            parameters = reverser.match(path)
+            if parameters is not None:
+                return RouteMatch(name, parameters)
+        return None
+
+    def _lookup(self, node, path, pos, values):
+        """Matches the rest of the :path: from :pos: below the :node:."""
+
+        if pos == len(path):
+            for name, names in node.routes:
+                parameters = {}
+                for param, value in zip(names, values):
+                    if parameters.setdefault(param, value) != value:
+                        break
+                else:
+                    return RouteMatch(name, parameters)
+            return None
+
+        edge = node.edges.get(path[pos])
+        if edge is not None and path.startswith(edge[0], pos):
+            found = self._lookup(edge[1], path, pos + len(edge[0]), values)
+            if found is not None:
+                return found
+
+        if not node.params:
+            return None
+        segment_end = path.find('/', pos)
+        if segment_end == -1:
+            segment_end = len(path)
+        for validator, encoder, child in node.params:
+            end = segment_end
+            if '/' in getattr(encoder, 'safe', ''):
+                end = len(path)
+            for stop in range(pos + 1, end + 1):
+                if stop < end and path[stop] not in child.edges and \
+                        not child.params:
+                    continue
+                raw = path[pos:stop]
+                value = raw if encoder is None else unquote(raw)
+                # Typed patterns check the URL as it is, like match() does.
+                if validator is not None and not validator(
+                        raw if hasattr(validator, 'pattern') else value):
+                    continue
+                values.append(value)
+                found = self._lookup(child, path, stop, values)
+                values.pop()
+                if found is not None:
+                    return found
+        return None
+
+
+if __name__ == '__main__':
+    from reverser_cli import main
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""asyncio support for reverser: reverse records from an async source
+without blocking the event loop.
+
+Kept apart from reverser.py so that module stays importable on Pythons
+without async generators.  @see RSRReverser::areverse_many.
+"""
+
+import asyncio
+import collections
+
+from reverser import (ON_ERROR_RAISE, ON_ERROR_DEFAULT,
+                      RouteParameterizationIrreversibleError)
+
+RSR_BATCH_SIZE = 1000
+
+
+def _reverse_batch(reverse, batch):
+    """Reverses a batch of records in an executor.
+
+    Returns (list):
+        The reversed routes--with None for each irreversible record, which
+        (unlike a sentinel object) survives the trip back from a worker
+        process.
+    """
+
+    urls = []
+    for parameters in batch:
+        try:
+            urls.append(reverse(parameters))
+        except RouteParameterizationIrreversibleError:
+            urls.append(None)
+    return urls
+
+
+async def _batches(records, batch_size):
+    """Groups the async (or plain) iterable :records: into lists of at most
+    :batch_size: records.
+    """
+
+    batch = []
+    if hasattr(records, '__aiter__'):
+        async for parameters in records:
+            batch.append(parameters)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for parameters in records:
+            batch.append(parameters)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+async def areverse_many(reverser, records, batch_size=RSR_BATCH_SIZE,
+                        on_error=ON_ERROR_RAISE, default=None, executor=None,
+                        concurrency=2):
+    """Reverses the :reverser:'s route once per record of an async source.
+
+    Args:
+        reverser (RSRReverser): The reverser.
+        records (iterable): An async iterable (or plain iterable) of
+                            dictionaries of parameter names / keys and
+                            values.
+        batch_size (int): The number of records reversed between yields to
+                          the event loop--or sent to the :executor: at
+                          once.
+        on_error (str): @see RSRReverser::reverse_many.
+        default (var): @see RSRReverser::reverse_many.
+        executor (concurrent.futures.Executor|None): An executor to reverse
+                                                     batches in--or None to
+                                                     reverse them on the
+                                                     event loop.  Its
+                                                     workers share one
+                                                     CompiledRoute--which
+                                                     goes to a process
+                                                     pool's workers as its
+                                                     route and options and
+                                                     is compiled again
+                                                     there.
+        concurrency (int): The most batches in the :executor: at once.
+
+    Returns (async generator):
+        The reversed routes--in the order of the :records:.
+    """
+
+    loop = asyncio.get_running_loop()
+    if executor is None:
+        pending = None
+    else:
+        pending = collections.deque()
+        reverse = reverser.compile().reverse
+
+    async def results():
+        async for batch in _batches(records, batch_size):
+            if pending is None:
+                yield list(reverser.reverse_many(batch,
+                                                 on_error=ON_ERROR_DEFAULT,
+                                                 default=None))
+                await asyncio.sleep(0)
+                continue
+            pending.append(loop.run_in_executor(executor, _reverse_batch,
+                                                reverse, batch))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+
+    try:
+        async for urls in results():
+            for url in urls:
+                if url is not None:
+                    yield url
+                elif on_error == ON_ERROR_RAISE:
+                    raise RouteParameterizationIrreversibleError
+                elif on_error == ON_ERROR_DEFAULT:
+                    yield default
+    finally:
+        for future in pending or ():
+            future.cancel()
@@ -0,0 +1,177 @@
+"""The command line of reverser: reverse a route (or a RouteRegistry's
+routes) once per record of a JSON Lines or CSV stream and write the URLs
+to stdout.  @see main.
+
+    $ python -m reverser '/mixna/{artist}/{song}[/{page}]' < songs.jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+
+from reverser import (RSRReverser, RouteRegistry, ON_ERROR_DEFAULT,
+                      RSR_CHUNK_SIZE)
+
+_MISSING = object()
+
+
+def _read_records(stream, record_format):
+    """Reads parameter records from the :stream: one at a time.
+
+    Args:
+        stream (file): The input.
+        record_format (str): 'jsonl' for one JSON object per line or 'csv'
+                             for a header row of parameter names.
+
+    Returns (generator):
+        Dictionaries of parameter names / keys and string values.  Nulls
+        and empty CSV cells are left out; other JSON values are converted
+        to strings.
+    """
+
+    if record_format == 'csv':
+        for row in csv.DictReader(stream):
+            yield dict((key, value) for key, value in row.items()
+                       if value)
+        return
+
+    for line in stream:
+        if line.strip():
+            yield dict((key, '%s' % value)
+                       for key, value in json.loads(line).items()
+                       if value is not None)
+
+
+def _reverse_records(args, records):
+    """Reverses the :records: as the command line :args: ask.
+
+    Returns (generator):
+        A reversed route--or _MISSING if it cannot be reversed--per record.
+    """
+
+    if args.registry is None:
+        reverser = RSRReverser(args.route, option_bounds=args.option_bounds,
+                               param_bounds=args.param_bounds,
+                               param_separator=args.param_separator)
+        if args.workers > 1:
+            return reverser.reverse_parallel(records, processes=args.workers,
+                                             chunksize=args.chunksize,
+                                             on_error=ON_ERROR_DEFAULT,
+                                             default=_MISSING)
+        return reverser.reverse_many(records, on_error=ON_ERROR_DEFAULT,
+                                     default=_MISSING)
+
+    with open(args.registry) as registry_file:
+        registry = RouteRegistry(json.load(registry_file),
+                                 option_bounds=args.option_bounds,
+                                 param_bounds=args.param_bounds,
+                                 param_separator=args.param_separator)
+    return registry.reverse_many(records, route_key=args.route_key,
+                                 on_error=ON_ERROR_DEFAULT, default=_MISSING)
+
+
+def main(argv=None):
+    """Reverses a route once per parameter record on stdin (or in a file)
+    and streams the URLs to stdout--one per line.
+
+        $ python -m reverser '/mixna/{artist}/{song}[/{page}]' < songs.jsonl
+        $ python -m reverser --registry routes.json --format csv songs.csv
+
+    Returns (int):
+        The exit status: 0 on success, 1 if a record could not be reversed
+        with --on-error abort.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m reverser',
+        description='Reverses a route once per parameter record.')
+    parser.add_argument('route', nargs='?',
+                        help='the route to reverse (unless --registry)')
+    parser.add_argument('input', nargs='?',
+                        help='the records file (default: stdin)')
+    parser.add_argument('--registry', metavar='FILE',
+                        help='a JSON object of route names and routes; each '
+                             'record names its route in --route-key')
+    parser.add_argument('--route-key', default='route',
+                        help='the record key naming the route with '
+                             '--registry (default: %(default)s)')
+    parser.add_argument('-f', '--format', choices=('jsonl', 'csv'),
+                        help='the record format (default: from the input '
+                             'file extension, else jsonl)')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='worker processes (default: %(default)s)')
+    parser.add_argument('--chunksize', type=int, default=RSR_CHUNK_SIZE,
+                        help='records per worker chunk and per write')
+    parser.add_argument('--on-error', choices=('skip', 'emit', 'abort'),
+                        default='abort',
+                        help='what to do with an irreversible record: '
+                             'drop it, write --error-line in its place, or '
+                             'stop (default: %(default)s)')
+    parser.add_argument('--error-line', default='',
+                        help='the line --on-error emit writes')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='do not report throughput on stderr')
+    parser.add_argument('--option-bounds')
+    parser.add_argument('--param-bounds')
+    parser.add_argument('--param-separator')
+    args = parser.parse_args(argv)
+
+    if args.registry is not None:
+        if args.input is not None:
+            parser.error('--registry takes no route argument')
+        args.input = args.route
+    elif args.route is None:
+        parser.error('a route or --registry is required')
+    if args.registry is not None and args.workers > 1:
+        parser.error('--workers needs a single route, not --registry')
+
+    record_format = args.format
+    if record_format is None:
+        record_format = 'csv' if args.input and \
+            args.input.lower().endswith('.csv') else 'jsonl'
+
+    stream = open(args.input) if args.input else sys.stdin
+    start = time.time()
+    count = errors = 0
+    status = 0
+    lines = []
+    try:
+        records = _read_records(stream, record_format)
+        for url in _reverse_records(args, records):
+            count += 1
+            if url is _MISSING:
+                errors += 1
+                if args.on_error == 'abort':
+                    status = 1
+                    break
+                if args.on_error == 'skip':
+                    continue
+                url = args.error_line
+            lines.append(url)
+            if len(lines) >= args.chunksize:
+                lines.append('')
+                sys.stdout.write('\n'.join(lines))
+                lines = []
+        if lines:
+            lines.append('')
+            sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    if status:
+        sys.stderr.write('record %d cannot be reversed\n' % count)
+    if not args.quiet:
+        seconds = time.time() - start
+        sys.stderr.write('%d records, %d errors in %.3fs (%.0f records/s)\n'
+                         % (count, errors, seconds,
+                            count / seconds if seconds else 0))
+    return status
+
+
+
+if __name__ == '__main__':
+    sys.exit(main())
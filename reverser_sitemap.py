@@ -0,0 +1,199 @@
+"""Sitemaps built on reverser: reverse a route (or a RouteRegistry's
+routes) for a stream of records and write the URLs as sitemap files.
+
+Files are split at the sitemap protocol's limits, gzipped as they are
+written, and listed in a sitemap index.  @see write_sitemaps.
+
+    index = write_sitemaps(RSRReverser(route), records, 'public',
+                           'https://example.com')
+"""
+
+import gzip
+import os
+from xml.sax.saxutils import escape
+
+from reverser import RouteRegistry, ON_ERROR_SKIP
+
+RSR_SITEMAP_MAX_URLS = 50000
+RSR_SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+RSR_SITEMAP_BUFFER_URLS = 1000
+
+SITEMAP_HEADER = (b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                  b'<urlset xmlns="http://www.sitemaps.org/schemas/'
+                  b'sitemap/0.9">\n')
+SITEMAP_FOOTER = b'</urlset>\n'
+INDEX_HEADER = (b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/'
+                b'sitemap/0.9">\n')
+INDEX_FOOTER = b'</sitemapindex>\n'
+XML_ENTITIES = {"'": '&apos;', '"': '&quot;'}
+
+
+class SitemapWriter(object):
+    """Writes URLs into numbered sitemap files and a sitemap index.
+
+    Attributes:
+        paths (list): The paths of the sitemap files written so far.
+        index_path (str|None): The path of the sitemap index, once it is
+                               written.
+    """
+
+    def __init__(self, directory, base_url, name='sitemap', compress=True,
+                 max_urls=RSR_SITEMAP_MAX_URLS,
+                 max_bytes=RSR_SITEMAP_MAX_BYTES,
+                 buffer_urls=RSR_SITEMAP_BUFFER_URLS, sitemap_url=None):
+        """Constructs a new SitemapWriter.
+
+        Args:
+            directory (str): The directory to write the files in.
+            base_url (str): The scheme and host prepended to every reversed
+                            route; e.g. 'https://example.com'.
+            name (str): The index is written to '<name>.xml' and the
+                        sitemaps to '<name>-1.xml.gz', '<name>-2.xml.gz'...
+            compress (bool): Whether or not to gzip the sitemaps.
+            max_urls (int): The most URLs in one sitemap.
+            max_bytes (int): The most (uncompressed) bytes in one sitemap.
+            buffer_urls (int): The number of URLs buffered between writes.
+            sitemap_url (str|None): Where the sitemaps are served from, for
+                                    the index--or None for :base_url:.
+        """
+
+        self.paths = []
+        self.index_path = None
+        self._directory = directory
+        self._base_url = base_url.rstrip('/')
+        self._sitemap_url = (sitemap_url or base_url).rstrip('/')
+        self._name = name
+        self._compress = compress
+        self._max_urls = max_urls
+        self._max_bytes = max_bytes
+        self._buffer_urls = buffer_urls
+        self._file = None
+        self._buffer = []
+        self._urls = 0
+        self._bytes = 0
+
+    def write(self, route):
+        """Adds a reversed :route: to the current sitemap--starting a new one
+        if it is full.
+
+        Args:
+            route (str): A reversed route; e.g. '/mixna/artist/song'.
+        """
+
+        entry = ('<url><loc>%s</loc></url>\n' %
+                 escape(self._base_url + route, XML_ENTITIES)).encode('utf-8')
+        if self._file is None or self._urls >= self._max_urls or \
+                self._bytes + len(entry) > self._max_bytes:
+            self._open()
+        self._buffer.append(entry)
+        self._urls += 1
+        self._bytes += len(entry)
+        if len(self._buffer) >= self._buffer_urls:
+            self._flush()
+
+    def write_many(self, routes):
+        """Adds every reversed route in the iterable :routes:.
+
+        Returns (int):
+            The number of routes added.
+        """
+
+        count = 0
+        write = self.write
+        for route in routes:
+            write(route)
+            count += 1
+        return count
+
+    def close(self):
+        """Finishes the current sitemap and writes the index.
+
+        Returns (str|None):
+            The path of the sitemap index--or None if no URL was written,
+            since an index must list at least one sitemap.
+        """
+
+        self._finish()
+        if not self.paths:
+            return None
+        path = os.path.join(self._directory, self._name + '.xml')
+        with open(path, 'wb') as index:
+            index.write(INDEX_HEADER)
+            index.write(b''.join(
+                ('<sitemap><loc>%s</loc></sitemap>\n' % escape(
+                    '%s/%s' % (self._sitemap_url, os.path.basename(sitemap)),
+                    XML_ENTITIES)).encode('utf-8') for sitemap in self.paths))
+            index.write(INDEX_FOOTER)
+        self.index_path = path
+        return path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._finish()
+
+    def _open(self):
+        """Finishes the current sitemap and starts the next one."""
+
+        self._finish()
+        path = os.path.join(self._directory, '%s-%d.xml%s' % (
+            self._name, len(self.paths) + 1, '.gz' if self._compress else ''))
+        if self._compress:
+            self._file = gzip.open(path, 'wb', compresslevel=6)
+        else:
+            self._file = open(path, 'wb')
+        self.paths.append(path)
+        self._file.write(SITEMAP_HEADER)
+        self._urls = 0
+        self._bytes = len(SITEMAP_HEADER) + len(SITEMAP_FOOTER)
+
+    def _flush(self):
+        self._file.write(b''.join(self._buffer))
+        self._buffer = []
+
+    def _finish(self):
+        """Writes out and closes the current sitemap, if any."""
+
+        if self._file is None:
+            return
+        self._flush()
+        self._file.write(SITEMAP_FOOTER)
+        self._file.close()
+        self._file = None
+
+
+def write_sitemaps(reverser, records, directory, base_url,
+                   route_key='route', **options):
+    """Reverses a route once per record and writes the URLs as sitemaps.
+
+    Records that cannot be reversed are left out.
+
+    Args:
+        reverser (RSRReverser|RouteRegistry): The route to reverse--or a
+                                              registry of routes, each
+                                              record naming its route.
+        records (iterable): Dictionaries of parameter names / keys and
+                            values.
+        directory (str): @see SitemapWriter::__init__.
+        base_url (str): @see SitemapWriter::__init__.
+        route_key (str): The record key naming the route, with a
+                         RouteRegistry.
+        **options: @see SitemapWriter::__init__.
+
+    Returns (str|None):
+        The path of the sitemap index--or None if no record was reversed.
+    """
+
+    if isinstance(reverser, RouteRegistry):
+        routes = reverser.reverse_many(records, route_key=route_key,
+                                       on_error=ON_ERROR_SKIP)
+    else:
+        routes = reverser.reverse_many(records, on_error=ON_ERROR_SKIP)
+    with SitemapWriter(directory, base_url, **options) as writer:
+        writer.write_many(routes)
+    return writer.index_path
@@ -0,0 +1,102 @@
+import pickle
+import threading
+
+import pytest
+
+from reverser import (RSRReverser, CompiledRoute,
+                      RouteParameterizationIrreversibleError)
+
+
+def test_compiledroute_reverse():
+    route = RSRReverser('/test/{param1}[/{option1}[/{option2}]]').compile()
+    assert isinstance(route, CompiledRoute)
+    assert route.reverse({'param1': 'a'}) == '/test/a'
+    assert route.reverse({'param1': 'a', 'option1': 'b'}) == '/test/a/b'
+    assert route.reverse_args('a', 'b', 'c') == '/test/a/b/c'
+    assert route.reverse_kw(param1='a', option2='c') == '/test/a'
+
+
+def test_compiledroute_snapshot():
+    reverser = RSRReverser('/test/{param1}')
+    route = reverser.compile()
+    reverser.set_route('/set/{param1}')
+    assert route.get_route() == '/test/{param1}'
+    assert route.reverse({'param1': 'a'}) == '/test/a'
+
+
+def test_compiledroute_bound_codegen():
+    reverser = RSRReverser('/test/{param1}/{param2:digits}', codegen=True)
+    route = reverser.bind({'param1': 'a'}).compile()
+    assert route.get_parameter_names() == ('param2',)
+    assert route.reverse({'param2': '2'}) == '/test/a/2'
+    assert not route.can_reverse({'param2': 'two'})
+    assert route.missing_parameters({'param2': 'two'}) == ('param2',)
+
+
+def test_compiledroute_match():
+    route = RSRReverser('/test/{param1}[/{option1:digits}]').compile()
+    assert route.match('/test/a/2') == {'param1': 'a', 'option1': '2'}
+    assert route.match('/test/a/b') is None
+
+
+def test_compiledroute_irreversible():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        route = RSRReverser('/test/{param1}/{param2}').compile()
+        route.reverse({'param1': 'a'})
+
+
+def test_compiledroute_immutable():
+    with pytest.raises(AttributeError):
+        route = RSRReverser('/test/{param1}').compile()
+        route._route = '/other/{param1}'
+
+
+def test_compiledroute_slots():
+    with pytest.raises(AttributeError):
+        route = RSRReverser('/test/{param1}').compile()
+        object.__setattr__(route, 'extra', True)
+
+
+def test_compiledroute_threads():
+    route = RSRReverser('/test/{param1}[/{option1}][/{option2}]').compile()
+    errors = []
+
+    def reverse(offset):
+        try:
+            for i in range(2000):
+                params = {'param1': str(i)}
+                if (i + offset) % 2:
+                    params['option1'] = 'o'
+                if (i + offset) % 3:
+                    params['option2'] = 'p'
+                expected = '/test/%d%s%s' % (i, '/o' if 'option1' in params
+                                             else '', '/p' if 'option2'
+                                             in params else '')
+                assert route.reverse(params) == expected
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=reverse, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+def test_compiledroute_pickle():
+    compiled = RSRReverser('/test/{param1:digits}[/{option1}]',
+                           codegen=True).bind({'option1': 'o'}).compile()
+    unpickled = pickle.loads(pickle.dumps(compiled))
+    assert unpickled.get_route() == compiled.get_route()
+    assert unpickled.reverse({'param1': '1'}) == '/test/1/o'
+    assert unpickled.match('/test/1/o') == {'param1': '1'}
+
+
+def test_compiledroute_unpickle_once():
+    compiled = RSRReverser('/mixna/{artist}/{song}[/{page}]',
+                           codegen=True).compile()
+    data = pickle.dumps(compiled)
+    assert pickle.loads(data) is pickle.loads(data)
+    other = RSRReverser('/mixna/{artist}', codegen=True).compile()
+    assert pickle.loads(pickle.dumps(other)) is not pickle.loads(data)
@@ -0,0 +1,30 @@
+from reverser import RSRReverser, OptionRequirement
+
+
+def test_rsrreverser_analyze_options_none():
+    reverser = RSRReverser('/test/{param1}')
+    assert reverser.get_option_requirements() == ()
+
+
+def test_rsrreverser_analyze_options_nested():
+    reverser = RSRReverser('/test[/{o1}[/{o2}/{o3}]]/{p1}[/{o4}]')
+    requirements = (
+        OptionRequirement(frozenset(['o1']), None, True),
+        OptionRequirement(frozenset(['o2', 'o3']), 0, True),
+        OptionRequirement(frozenset(['o4']), None, True),
+    )
+    assert reverser.get_option_requirements() == requirements
+
+
+def test_rsrreverser_analyze_options_invalid():
+    reverser = RSRReverser('/test[/{o1:bad!}[/{o2}]]')
+    requirements = (
+        OptionRequirement(frozenset(), None, False),
+        OptionRequirement(frozenset(['o2']), 0, True),
+    )
+    assert reverser.get_option_requirements() == requirements
+
+
+def test_rsrreverser_analyze_options_required_parameters():
+    reverser = RSRReverser('/test/{p1}[/{o1}]/{p2}/{p1}')
+    assert reverser.get_required_parameters() == ('p1', 'p2')
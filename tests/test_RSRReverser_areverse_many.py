@@ -0,0 +1,96 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import pytest
+
+from reverser import (RSRReverser, RouteParameterizationIrreversibleError,
+                      ON_ERROR_SKIP, ON_ERROR_DEFAULT)
+
+
+async def cursor(records):
+    for record in records:
+        await asyncio.sleep(0)
+        yield record
+
+
+def collect(reverser, records, **kwargs):
+    async def run():
+        return [url async for url in reverser.areverse_many(records,
+                                                            **kwargs)]
+    return asyncio.run(run())
+
+
+def test_rsrreverser_areverse_many_order():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    records = [{'param1': str(i)} if i % 3 else
+               {'param1': str(i), 'option1': 'o'} for i in range(50)]
+    reversed_urls = [reverser.reverse(record) for record in records]
+    assert collect(reverser, cursor(records), batch_size=7) == reversed_urls
+
+
+def test_rsrreverser_areverse_many_plain_iterable():
+    reverser = RSRReverser('/test/{param1}')
+    assert collect(reverser, [{'param1': 'a'}]) == ['/test/a']
+
+
+def test_rsrreverser_areverse_many_executor():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    records = [{'param1': str(i)} for i in range(50)] + [{}]
+    with ThreadPoolExecutor(2) as executor:
+        urls = collect(reverser, cursor(records), batch_size=4,
+                       executor=executor, on_error=ON_ERROR_DEFAULT)
+    assert urls == ['/test/%d' % i for i in range(50)] + [None]
+
+
+def test_rsrreverser_areverse_many_process_pool():
+    reverser = RSRReverser('/test/{param1:digits}[/{option1}]', encode=True)
+    reverser = reverser.bind({'option1': 'a b'})
+    records = [{'param1': str(i)} for i in range(20)] + [{'param1': 'x'}]
+    with ProcessPoolExecutor(2) as executor:
+        urls = collect(reverser, cursor(records), batch_size=4,
+                       executor=executor, on_error=ON_ERROR_DEFAULT,
+                       default='irreversible')
+    assert urls == ['/test/%d/a%%20b' % i for i in range(20)] + \
+        ['irreversible']
+
+
+def test_rsrreverser_areverse_many_skip():
+    reverser = RSRReverser('/test/{param1}')
+    records = [{'param1': 'a'}, {'param2': 'b'}, {'param1': 'c'}]
+    assert collect(reverser, cursor(records), on_error=ON_ERROR_SKIP) == \
+        ['/test/a', '/test/c']
+
+
+def test_rsrreverser_areverse_many_yields_to_loop():
+    reverser = RSRReverser('/test/{param1}')
+    ticks = []
+
+    async def run():
+        async def tick():
+            while True:
+                ticks.append(len(urls))
+                await asyncio.sleep(0)
+
+        urls = []
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        records = [{'param1': str(i)} for i in range(100)]
+        async for url in reverser.areverse_many(records, batch_size=10):
+            urls.append(url)
+        ticker.cancel()
+        return urls
+
+    assert len(asyncio.run(run())) == 100
+    assert len(set(ticks)) > 2
+
+
+def test_rsrreverser_areverse_many_raise():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}')
+        collect(reverser, cursor([{'param1': 'ok'}, {'param2': 'fail'}]))
+
+
+def test_rsrreverser_areverse_many_bad_on_error():
+    with pytest.raises(ValueError):
+        reverser = RSRReverser('/test/{param1}')
+        reverser.areverse_many([], on_error='ignore')
@@ -0,0 +1,80 @@
+import pytest
+
+from reverser import (RSRReverser, LiteralNode, ParameterNode, OptionNode,
+                      RouteParameterizationIrreversibleError)
+
+
+def test_rsrreverser_bind_required():
+    reverser = RSRReverser('/mixna/{artist}/{song}[/{page}]')
+    bound = reverser.bind({'artist': 'cuzzo'})
+    assert bound.get_parameter_names() == ('song', 'page')
+    assert bound.reverse({'song': 'hello'}) == '/mixna/cuzzo/hello'
+    assert bound.reverse({'song': 'hello', 'page': '2'}) == \
+        '/mixna/cuzzo/hello/2'
+
+
+def test_rsrreverser_bind_folds_literals():
+    reverser = RSRReverser('/eg/{p1}[/{o1}][/{o2}]')
+    bound = reverser.bind({'p1': 'a', 'o1': 'b'})
+    template = (
+        LiteralNode('/eg/a/b'),
+        OptionNode((
+            LiteralNode('/'),
+            ParameterNode('o2', None, '{o2}'),
+        )),
+    )
+    assert bound.get_template() == template
+
+
+def test_rsrreverser_bind_nested_options():
+    reverser = RSRReverser('/test[/{option1}[/{option2}]]')
+    bound = reverser.bind({'option2': 'nested'})
+    assert bound.reverse({}) == '/test'
+    assert bound.reverse({'option1': 'parent'}) == '/test/parent/nested'
+
+
+def test_rsrreverser_bind_invalid_option():
+    reverser = RSRReverser('/test/{param1}[/{page:digits}]')
+    bound = reverser.bind({'page': 'two'})
+    assert bound.get_template() == (
+        LiteralNode('/test/'),
+        ParameterNode('param1', None, '{param1}'),
+    )
+    assert bound.reverse({'param1': 'a', 'page': '2'}) == '/test/a'
+
+
+def test_rsrreverser_bind_invalid_required():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{page:digits}/{param1}')
+        bound = reverser.bind({'page': 'two'})
+        bound.reverse({'param1': 'a'})
+
+
+def test_rsrreverser_bind_leaves_original():
+    reverser = RSRReverser('/test/{param1}[/{option1}]', codegen=True)
+    bound = reverser.bind({'param1': 'a', 'unrelated': 'b'})
+    assert bound.get_bound_parameters() == {'param1': 'a'}
+    assert bound.reverse({'param1': 'ignored'}) == '/test/a'
+    assert reverser.get_bound_parameters() == {}
+    assert reverser.reverse({'param1': 'c'}) == '/test/c'
+
+
+def test_rsrreverser_bind_twice():
+    reverser = RSRReverser('/test/{param1}/{param2}/{param3}')
+    bound = reverser.bind({'param1': 'a'}).bind({'param2': 'b'})
+    assert bound.get_bound_parameters() == {'param1': 'a', 'param2': 'b'}
+    assert bound.reverse_args('c') == '/test/a/b/c'
+
+
+def test_rsrreverser_bind_match():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    bound = reverser.bind({'param1': 'a'})
+    assert bound.match('/test/a/b') == {'option1': 'b'}
+    assert bound.match('/test/c/b') is None
+
+
+def test_rsrreverser_bind_compile():
+    compiled = RSRReverser('/test/{param1}/{param2}') \
+        .bind({'param1': 'bound'}).compile()
+    assert compiled.reverse({'param2': 'x'}) == '/test/bound/x'
+    assert compiled.get_parameter_names() == ('param2',)
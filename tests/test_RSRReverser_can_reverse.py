@@ -0,0 +1,34 @@
+from reverser import RSRReverser
+
+
+def test_rsrreverser_can_reverse_full_params():
+    reverser = RSRReverser('/test/{param1}/{param2}[/{option1}]')
+    params = {
+        'param1': 'can',
+        'param2': 'reverse',
+    }
+    assert reverser.can_reverse(params)
+
+
+def test_rsrreverser_can_reverse_some_params():
+    reverser = RSRReverser('/test/{param1}/{param2}[/{option1}]')
+    params = {
+        'param1': 'cannot',
+        'option1': 'reverse',
+    }
+    assert not reverser.can_reverse(params)
+
+
+def test_rsrreverser_can_reverse_options_only():
+    reverser = RSRReverser('/test[/{option1}[/{option2}]]')
+    assert reverser.can_reverse({})
+
+
+def test_rsrreverser_can_reverse_invalid():
+    reverser = RSRReverser('/test/{param1:bad!}')
+    assert not reverser.can_reverse({'param1': 'never'})
+
+
+def test_rsrreverser_can_reverse_invalid_option():
+    reverser = RSRReverser('/test[/{option1:bad!}]')
+    assert reverser.can_reverse({})
@@ -1,4 +1,4 @@
-from nose.tools import raises
+import pytest
 
 from reverser import RSRReverser, InvalidParameterError
 
@@ -28,13 +28,13 @@ def test_rsrreverser_clean_parameter_complex_invalid():
     assert reverser.clean_parameter('#+*&:type') == '#+*&'
 
 
-@raises(InvalidParameterError)
 def test_rsrreverser_clean_parameter_complex_multi_separator():
-    reverser = RSRReverser('')
-    reverser.clean_parameter('param:type:bad') 
+    with pytest.raises(InvalidParameterError):
+        reverser = RSRReverser('')
+        reverser.clean_parameter('param:type:bad') 
 
 
-@raises(InvalidParameterError)
 def test_rsrreverser_clean_parameter_empty():
-    reverser = RSRReverser('')
-    reverser.clean_parameter('')
+    with pytest.raises(InvalidParameterError):
+        reverser = RSRReverser('')
+        reverser.clean_parameter('')
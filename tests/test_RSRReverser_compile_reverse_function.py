@@ -0,0 +1,78 @@
+import pytest
+
+from reverser import RSRReverser, RouteParameterizationIrreversibleError
+
+
+def test_rsrreverser_compile_reverse_function_full_params():
+    reverser = RSRReverser('/test/{param1}/{param2}/{param3}')
+    reverse = reverser.compile_reverse_function()
+    params = {
+        'param1': 'params',
+        'param2': 'are',
+        'param3': 'fun',
+    }
+    assert reverse(params) == '/test/params/are/fun'
+
+
+def test_rsrreverser_compile_reverse_function_some_nested_options():
+    route = '/test[/{param1}[/{param2}]]/sep[/{param3}[/{param4}]]'
+    reverser = RSRReverser(route)
+    reverse = reverser.compile_reverse_function()
+    params = {
+        'param2': 'no_parent',
+        'param3': 'some',
+        'param4': 'nested_options',
+    }
+    assert reverse(params) == '/test/sep/some/nested_options'
+
+
+def test_rsrreverser_compile_reverse_function_literal_option():
+    reverser = RSRReverser('[/{param1}]/test[/literal[/{param2}]]')
+    reverse = reverser.compile_reverse_function()
+    params = {
+        'param2': 'always',
+    }
+    assert reverse(params) == '/test/literal/always'
+
+
+def test_rsrreverser_compile_reverse_function_invalid_option():
+    reverser = RSRReverser('/test[/{param1:bad!}]/{param2}')
+    reverse = reverser.compile_reverse_function()
+    params = {
+        'param1': 'pruned',
+        'param2': 'kept',
+    }
+    assert reverse(params) == '/test/kept'
+
+
+def test_rsrreverser_compile_reverse_function_unsafe_literals():
+    reverser = RSRReverser("/'quoted'\\/\"{param}\"")
+    reverse = reverser.compile_reverse_function()
+    params = {
+        'param': 'safe',
+    }
+    assert reverse(params) == "/'quoted'\\/\"safe\""
+
+
+def test_rsrreverser_compile_reverse_function_some_params():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}/{param2}')
+        reverse = reverser.compile_reverse_function()
+        reverse({'param1': 'epic'})
+
+
+def test_rsrreverser_compile_reverse_function_invalid_param():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test]/{param1}')
+        reverse = reverser.compile_reverse_function()
+        reverse({'param1': 'fail'})
+
+
+def test_rsrreverser_compile_reverse_function_codegen_reverse():
+    reverser = RSRReverser('/test/{param1}[/{param2}]', codegen=True)
+    reverser.set_route('/set/{param1}[/{param2}]')
+    params = {
+        'param1': 'code',
+        'param2': 'gen',
+    }
+    assert reverser.reverse(params) == '/set/code/gen'
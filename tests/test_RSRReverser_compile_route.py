@@ -0,0 +1,79 @@
+from reverser import (RSRReverser, LiteralNode, ParameterNode, OptionNode,
+                      InvalidNode)
+
+
+def test_rsrreverser_compile_route_plain():
+    reverser = RSRReverser('/test/plain/route')
+    assert reverser.compile_route() == (LiteralNode('/test/plain/route'),)
+
+
+def test_rsrreverser_compile_route_params():
+    reverser = RSRReverser('/test/{param1}/{param2:digits}')
+    template = (
+        LiteralNode('/test/'),
+        ParameterNode('param1', None, '{param1}'),
+        LiteralNode('/'),
+        ParameterNode('param2', 'digits', '{param2:digits}'),
+    )
+    assert reverser.compile_route() == template
+
+
+def test_rsrreverser_compile_route_nested_options():
+    reverser = RSRReverser('/test[/{option1}[/{option2}]]')
+    template = (
+        LiteralNode('/test'),
+        OptionNode((
+            LiteralNode('/'),
+            ParameterNode('option1', None, '{option1}'),
+            OptionNode((
+                LiteralNode('/'),
+                ParameterNode('option2', None, '{option2}'),
+            )),
+        )),
+    )
+    assert reverser.compile_route() == template
+
+
+def test_rsrreverser_compile_route_invalid_params():
+    reverser = RSRReverser('/test/{p:bad:type}/{p:_t}/{}')
+    template = (
+        LiteralNode('/test/'),
+        InvalidNode('{p:bad:type}'),
+        LiteralNode('/'),
+        InvalidNode('{p:_t}'),
+        LiteralNode('/'),
+        InvalidNode('{}'),
+    )
+    assert reverser.compile_route() == template
+
+
+def test_rsrreverser_compile_route_unmatched_bounds():
+    reverser = RSRReverser('/test]/sep[/{option}')
+    template = (
+        LiteralNode('/test'),
+        InvalidNode(']'),
+        LiteralNode('/sep'),
+        InvalidNode('['),
+        LiteralNode('/'),
+        ParameterNode('option', None, '{option}'),
+    )
+    assert reverser.compile_route() == template
+
+
+def test_rsrreverser_compile_route_custom():
+    reverser = RSRReverser('/test[/{fake}]</=option;>', option_bounds='<>',
+                           param_bounds='=;')
+    template = (
+        LiteralNode('/test[/{fake}]'),
+        OptionNode((
+            LiteralNode('/'),
+            ParameterNode('option', None, '=option;'),
+        )),
+    )
+    assert reverser.compile_route() == template
+
+
+def test_rsrreverser_compile_route_set_route():
+    reverser = RSRReverser('/test/{param1}')
+    reverser.set_route('/test')
+    assert reverser.get_template() == (LiteralNode('/test'),)
@@ -0,0 +1,107 @@
+import pytest
+
+from reverser import (RSRReverser, ENCODE_PATH, ENCODE_SEGMENT, url_encoder,
+                      PrunedTemplate, LRUCache)
+
+
+def test_rsrreverser_encode_off():
+    reverser = RSRReverser('/test/{param1}')
+    assert reverser.reverse({'param1': 'a b/c'}) == '/test/a b/c'
+
+
+def test_rsrreverser_encode_segment():
+    reverser = RSRReverser('/mixna/{artist}[/{song}]', encode=ENCODE_SEGMENT)
+    params = {
+        'artist': 'AC/DC',
+        'song': 'T.N.T & Friends?',
+    }
+    assert reverser.reverse(params) == '/mixna/AC%2FDC/T.N.T%20&%20Friends%3F'
+
+
+def test_rsrreverser_encode_per_parameter():
+    reverser = RSRReverser('/files/{user}/{path}[/{raw}]',
+                           encode={'path': ENCODE_PATH, 'raw': None})
+    params = {
+        'user': 'a b',
+        'path': 'docs/read me.txt',
+        'raw': '%2F',
+    }
+    assert reverser.reverse(params) == '/files/a%20b/docs/read%20me.txt/%2F'
+
+
+def test_rsrreverser_encode_unicode():
+    reverser = RSRReverser('/test/{param1}', encode=True)
+    assert reverser.reverse({'param1': u'caf\xe9'}) == '/test/caf%C3%A9'
+
+
+def test_rsrreverser_encode_safe_fast_path():
+    encode = url_encoder('')
+    value = 'already-safe_value.1~'
+    assert encode(value) is value
+
+
+def test_rsrreverser_encode_every_path():
+    route = '/test/{param1}[/{option1}]'
+    params = {
+        'param1': 'a b',
+        'option1': 'c/d',
+    }
+    expected = '/test/a%20b/c%2Fd'
+    reverser = RSRReverser(route, encode=ENCODE_SEGMENT)
+    codegen = RSRReverser(route, encode=ENCODE_SEGMENT, codegen=True)
+    assert reverser.reverse(params) == expected
+    assert codegen.reverse(params) == expected
+    assert list(reverser.reverse_many([params])) == [expected]
+    assert reverser.reverse_args('a b', 'c/d') == expected
+    assert reverser.reverse_columns({'param1': ['a b'],
+                                     'option1': ['c/d']}) == [expected]
+    assert reverser.compile().reverse(params) == expected
+    assert reverser.bind({'param1': 'a b'}).reverse(params) == expected
+    assert reverser.substitute_parameters(params) == \
+        '/test/a%20b[/c%2Fd]'
+
+
+def test_rsrreverser_encode_template():
+    reverser = RSRReverser('/test/{param1}/{param2}',
+                           encode={'param2': None})
+    template = reverser.get_pruned_template(frozenset(['param1', 'param2']))
+    assert template.parts == ('/test/', None, '/', None)
+    assert template.encoders[1] is None
+    assert PrunedTemplate(('/t',), ()).encoders is None
+
+
+def test_rsrreverser_encode_match():
+    reverser = RSRReverser('/mixna/{artist}', encode=True)
+    assert reverser.match('/mixna/AC%2FDC') == {'artist': 'AC/DC'}
+
+
+def test_rsrreverser_encode_match_path():
+    reverser = RSRReverser('/files/{path}[/raw]', encode=ENCODE_PATH)
+    url = reverser.reverse({'path': 'docs/read me.txt'})
+    assert url == '/files/docs/read%20me.txt/raw'
+    assert reverser.match(url) == {'path': 'docs/read me.txt'}
+    assert reverser.compile().match(url) == {'path': 'docs/read me.txt'}
+    segment = RSRReverser('/files/{path}', encode=ENCODE_SEGMENT)
+    assert segment.match('/files/docs/read%20me.txt') is None
+
+
+def test_rsrreverser_encode_shared_cache():
+    cache = LRUCache(10)
+    url_cache = LRUCache(10)
+    encoded = RSRReverser('/s/{x}', cache=cache, url_cache=url_cache,
+                          encode=True)
+    plain = RSRReverser('/s/{x}', cache=cache, url_cache=url_cache)
+    assert encoded.reverse({'x': 'a b'}) == '/s/a%20b'
+    assert plain.reverse({'x': 'a b'}) == '/s/a b'
+    assert encoded.reverse({'x': 'a b'}) == '/s/a%20b'
+
+
+def test_rsrreverser_encode_custom():
+    reverser = RSRReverser('/test/{param1}', encode=lambda value:
+                           value.lower())
+    assert reverser.reverse({'param1': 'LOUD'}) == '/test/loud'
+
+
+def test_rsrreverser_encode_unknown_mode():
+    with pytest.raises(ValueError):
+        RSRReverser('/test/{param1}', encode='query')
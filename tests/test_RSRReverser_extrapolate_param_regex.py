@@ -0,0 +1,29 @@
+from reverser import RSRReverser
+
+
+def test_rsrreverser_extrapolate_param_regex_plain():
+    reverser = RSRReverser('')
+    match = reverser.extrapolate_param_regex().match('{param}')
+    assert match.group('name') == 'param'
+    assert match.group(2) is None
+
+
+def test_rsrreverser_extrapolate_param_regex_typed():
+    reverser = RSRReverser('')
+    match = reverser.extrapolate_param_regex().match('{param:digits}')
+    assert match.group('name') == 'param'
+    assert match.group(2) == ':digits'
+
+
+def test_rsrreverser_extrapolate_param_regex_invalid_type():
+    reverser = RSRReverser('')
+    match = reverser.extrapolate_param_regex().match('{param:_digits}')
+    assert match.group('name') == 'param:_digits'
+    assert match.group(2) is None
+
+
+def test_rsrreverser_extrapolate_param_regex_custom_bounds_and_separator():
+    reverser = RSRReverser('', param_bounds='()', param_separator='|')
+    regex = reverser.extrapolate_param_regex()
+    assert [match.group('name') for match in
+            regex.finditer('/(p1)/(p2|type)/{p3}')] == ['p1', 'p2']
@@ -0,0 +1,52 @@
+from reverser import RSRReverser, CacheInfo
+
+
+def test_rsrreverser_get_pruned_template_cached():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    names = frozenset(['param1'])
+    template = reverser.get_pruned_template(names)
+    assert reverser.get_pruned_template(names) is template
+    assert reverser.cache_info() == CacheInfo(1, 1, 128, 1)
+
+
+def test_rsrreverser_get_pruned_template_irreversible_cached():
+    reverser = RSRReverser('/test/{param1}')
+    names = frozenset()
+    assert reverser.get_pruned_template(names) is None
+    assert reverser.get_pruned_template(names) is None
+    assert reverser.cache_info() == CacheInfo(1, 1, 128, 1)
+
+
+def test_rsrreverser_get_pruned_template_reverse_shapes():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    reverser.reverse({'param1': 'a', 'unrelated': 'key'})
+    reverser.reverse({'param1': 'b'})
+    reverser.reverse({'param1': 'c', 'option1': 'd'})
+    assert reverser.cache_info() == CacheInfo(1, 2, 128, 2)
+
+
+def test_rsrreverser_get_pruned_template_evicts_least_recent():
+    reverser = RSRReverser('/test[/{option1}][/{option2}]', cache_size=2)
+    first = frozenset(['option1'])
+    reverser.get_pruned_template(first)
+    reverser.get_pruned_template(frozenset(['option2']))
+    reverser.get_pruned_template(first)
+    reverser.get_pruned_template(frozenset())
+    reverser.get_pruned_template(first)
+    assert reverser.cache_info() == CacheInfo(2, 3, 2, 2)
+
+
+def test_rsrreverser_get_pruned_template_disabled():
+    reverser = RSRReverser('/test[/{option1}]', cache_size=0)
+    names = frozenset(['option1'])
+    reverser.get_pruned_template(names)
+    reverser.get_pruned_template(names)
+    assert reverser.cache_info() == CacheInfo(0, 2, 0, 0)
+
+
+def test_rsrreverser_get_pruned_template_set_route():
+    reverser = RSRReverser('/test[/{option1}]')
+    reverser.reverse({'option1': 'old'})
+    reverser.set_route('/set[/{option1}]')
+    assert reverser.cache_info() == CacheInfo(0, 0, 128, 0)
+    assert reverser.reverse({'option1': 'new'}) == '/set/new'
@@ -0,0 +1,105 @@
+from reverser import CompiledRoute, RSRReverser
+
+
+def test_rsrreverser_match_full_params():
+    reverser = RSRReverser('/test/{param1}/{param2}')
+    params = {
+        'param1': 'forward',
+        'param2': 'match',
+    }
+    assert reverser.match('/test/forward/match') == params
+
+
+def test_rsrreverser_match_some_nested_options():
+    route = '/test[/{param1}[/{param2}]]/sep[/{param3}[/{param4}]]'
+    reverser = RSRReverser(route)
+    params = {
+        'param3': 'some',
+        'param4': 'nested_options',
+    }
+    assert reverser.match('/test/sep/some/nested_options') == params
+
+
+def test_rsrreverser_match_no_match():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    assert reverser.match('/test') is None
+    assert reverser.match('/test/a/b/c') is None
+    assert reverser.match('/other/a') is None
+
+
+def test_rsrreverser_match_typed():
+    reverser = RSRReverser('/test[/{option1:digits}]/{param1}')
+    assert reverser.match('/test/42/page') == {'option1': '42',
+                                               'param1': 'page'}
+    assert reverser.match('/test/page') == {'param1': 'page'}
+    assert reverser.match('/test/4a/page') is None
+
+
+def test_rsrreverser_match_typed_callable():
+    types = {
+        'even': lambda value: int(value) % 2 == 0,
+    }
+    reverser = RSRReverser('/test/{param1:even}', types=types)
+    assert reverser.match('/test/2') == {'param1': '2'}
+    assert reverser.match('/test/3') is None
+
+
+def test_rsrreverser_match_literal_option():
+    reverser = RSRReverser('/test[/literal][/{option1}]')
+    assert reverser.match('/test/literal/x') == {'option1': 'x'}
+    assert reverser.match('/test/x') is None
+
+
+def test_rsrreverser_match_repeated_param():
+    reverser = RSRReverser('/test/{param1}/{param1}')
+    assert reverser.match('/test/same/same') == {'param1': 'same'}
+    assert reverser.match('/test/not/same') is None
+
+
+def test_rsrreverser_match_invalid():
+    reverser = RSRReverser('/test[/{option1:bad!}]/{param1}')
+    assert reverser.match('/test/x') == {'param1': 'x'}
+    assert RSRReverser('/test]/{param1}').match('/test]/x') is None
+
+
+def test_rsrreverser_match_round_trip():
+    reverser = RSRReverser('/mixna/{artist}/{song}[/{page:digits}'
+                           '[/{date}[/{comment}]]]')
+    params = {
+        'artist': 'artist',
+        'song': 'song',
+        'page': '2',
+    }
+    assert reverser.match(reverser.reverse(params)) == params
+
+
+def test_rsrreverser_match_repeated_param_after_pruned_option():
+    reverser = RSRReverser('/s[/{lang}/{region}]/p/{lang}')
+    url = reverser.reverse({'lang': 'en'})
+    assert url == '/s/p/en'
+    assert reverser.match(url) == {'lang': 'en'}
+    assert reverser.match('/s/en/us/p/en') == {'lang': 'en',
+                                               'region': 'us'}
+    assert reverser.match('/s/en/us/p/fr') is None
+
+
+def test_rsrreverser_match_repeated_param_backtracks():
+    reverser = RSRReverser('/s[/{lang}-{region}]/p/{lang}')
+    params = {
+        'lang': 'pt',
+        'region': 'br-x',
+    }
+    url = reverser.reverse(params)
+    assert url == '/s/pt-br-x/p/pt'
+    assert reverser.match(url) == params
+    assert CompiledRoute(reverser).match(url) == params
+
+
+def test_rsrreverser_match_option_in_segment():
+    for route, params in [('/d/{y}-{m}[-{d}]',
+                           {'y': '2020', 'm': '01', 'd': '02'}),
+                          ('/d/{y}-{m}[-{d}]', {'y': '2020', 'm': '01'}),
+                          ('/f/{name}[.{ext}]', {'name': 'a', 'ext': 'b'}),
+                          ('/f/{name}[.{ext}]', {'name': 'a'})]:
+        reverser = RSRReverser(route)
+        assert reverser.match(reverser.reverse(params)) == params
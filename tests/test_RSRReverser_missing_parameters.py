@@ -0,0 +1,20 @@
+from reverser import RSRReverser
+
+
+def test_rsrreverser_missing_parameters_none():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    assert reverser.missing_parameters({'param1': 'here'}) == ()
+
+
+def test_rsrreverser_missing_parameters_some():
+    reverser = RSRReverser('/test/{param1}/{param2}/{param3}[/{option1}]')
+    params = {
+        'param2': 'here',
+        'option1': 'does_not_count',
+    }
+    assert reverser.missing_parameters(params) == ('param1', 'param3')
+
+
+def test_rsrreverser_missing_parameters_repeated():
+    reverser = RSRReverser('/test/{param1}/{param1}')
+    assert reverser.missing_parameters({}) == ('param1',)
@@ -96,3 +96,35 @@ def test_rsrreverser_prune_options_nested_custom():
     }
     pruned_route = '/test/=option1;/=option2;/=option3;'
     assert reverser.prune_options(params) == pruned_route
+
+
+def test_rsrreverser_prune_options_deeply_nested():
+    route = '/test' + ''.join('[/{o%d}' % i for i in range(10)) + ']' * 10
+    reverser = RSRReverser(route)
+    params = dict(('o%d' % i, 'deep') for i in range(10) if i != 7)
+    pruned_route = '/test' + ''.join('/{o%d}' % i for i in range(7))
+    assert reverser.prune_options(params) == pruned_route
+
+
+def test_rsrreverser_prune_options_many():
+    reverser = RSRReverser('/test' + ''.join('[/{o%d}]' % i
+                                             for i in range(60)))
+    params = dict(('o%d' % i, 'wide') for i in range(0, 60, 3))
+    pruned_route = '/test' + ''.join('/{o%d}' % i for i in range(0, 60, 3))
+    assert reverser.prune_options(params) == pruned_route
+
+
+def test_rsrreverser_prune_options_keeps_params():
+    reverser = RSRReverser('/test/{param1:digits}[/{option1}]/{param2}')
+    params = {
+        'option1': 'kept',
+    }
+    pruned_route = '/test/{param1:digits}/{option1}/{param2}'
+    assert reverser.prune_options(params) == pruned_route
+
+
+def test_rsrreverser_prune_options_empty_option():
+    reverser = RSRReverser('/test[]/{param1}')
+    params = {}
+    pruned_route = '/test/{param1}'
+    assert reverser.prune_options(params) == pruned_route
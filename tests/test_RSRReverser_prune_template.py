@@ -0,0 +1,46 @@
+from reverser import RSRReverser, PrunedTemplate
+
+
+def test_rsrreverser_prune_template_full():
+    reverser = RSRReverser('/test/{param1}[/{option1}[/{option2}]]')
+    names = frozenset(['param1', 'option1', 'option2'])
+    template = PrunedTemplate(('/test/', None, '/', None, '/', None),
+                              ((1, 'param1'), (3, 'option1'),
+                               (5, 'option2')))
+    assert reverser.prune_template(names) == template
+
+
+def test_rsrreverser_prune_template_merges_literals():
+    reverser = RSRReverser('/test[/{option1}]/sep[/{option2}]/{param1}')
+    names = frozenset(['param1'])
+    template = PrunedTemplate(('/test/sep/', None), ((1, 'param1'),))
+    assert reverser.prune_template(names) == template
+
+
+def test_rsrreverser_prune_template_nested_no_parent():
+    reverser = RSRReverser('/test[/{option1}[/{option2}]]')
+    names = frozenset(['option2'])
+    template = PrunedTemplate(('/test',), ())
+    assert reverser.prune_template(names) == template
+
+
+def test_rsrreverser_prune_template_irreversible():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    names = frozenset(['option1'])
+    assert reverser.prune_template(names) is None
+
+
+def test_rsrreverser_prune_template_invalid():
+    reverser = RSRReverser('/test[/{option1:bad!}]/{param1}]')
+    names = frozenset(['option1', 'param1'])
+    assert reverser.prune_template(names) is None
+
+
+def test_rsrreverser_prune_template_render():
+    reverser = RSRReverser('/test/{param1}[/{option1}]/{param1}')
+    names = frozenset(['param1'])
+    params = {
+        'param1': 'twice',
+        'option1': 'ignored',
+    }
+    assert reverser.prune_template(names).render(params) == '/test/twice/twice'
@@ -0,0 +1,84 @@
+from reverser import RSRReverser
+
+
+def test_rsrreverser_query_string_off():
+    reverser = RSRReverser('/test/{param1}')
+    assert reverser.reverse({'param1': 'a', 'page': '2'}) == '/test/a'
+
+
+def test_rsrreverser_query_string_off_explicit():
+    reverser = RSRReverser('/test/{param1}', query_exclude=['page'])
+    assert reverser.reverse({'param1': 'a', 'page': '2'}) == '/test/a'
+    assert reverser.query_string({'param1': 'a', 'q': 'x'}) == '?q=x'
+    assert reverser.compile().reverse({'param1': 'a', 'q': 'x'}) == '/test/a'
+
+
+def test_rsrreverser_query_string_sorted():
+    reverser = RSRReverser('/test/{param1}[/{option1}]', query=True)
+    params = {
+        'param1': 'a',
+        'zeta': 'last',
+        'page': 2,
+        'empty': None,
+    }
+    assert reverser.reverse(params) == '/test/a?page=2&zeta=last'
+
+
+def test_rsrreverser_query_string_lists_and_encoding():
+    reverser = RSRReverser('/search', query=True)
+    params = {
+        'tag': ['rock', 'hip hop'],
+        'q': 'AC/DC & more=',
+    }
+    assert reverser.reverse(params) == \
+        '/search?q=AC/DC%20%26%20more%3D&tag=rock&tag=hip%20hop'
+
+
+def test_rsrreverser_query_string_exclude():
+    reverser = RSRReverser('/test/{param1}', query=True,
+                           query_exclude=['session'])
+    params = {
+        'param1': 'a',
+        'session': 'secret',
+        'page': '2',
+    }
+    assert reverser.reverse(params) == '/test/a?page=2'
+
+
+def test_rsrreverser_query_string_route_parameters():
+    reverser = RSRReverser('/test[/{option1}[/{option2}]]', query=True)
+    assert reverser.reverse({'option2': 'pruned', 'page': '2'}) == \
+        '/test?page=2'
+
+
+def test_rsrreverser_query_string_nothing_left():
+    reverser = RSRReverser('/test/{param1}', query=True)
+    assert reverser.reverse({'param1': 'a'}) == '/test/a'
+
+
+def test_rsrreverser_query_string_every_path():
+    route = '/test/{param1}'
+    params = {
+        'param1': 'a',
+        'page': '2',
+    }
+    expected = '/test/a?page=2'
+    reverser = RSRReverser(route, query=True, url_cache_size=10)
+    codegen = RSRReverser(route, query=True, codegen=True)
+    assert reverser.reverse(params) == expected
+    assert reverser.reverse({'param1': 'a', 'page': '3'}) == '/test/a?page=3'
+    assert codegen.reverse(params) == expected
+    assert list(reverser.reverse_many([params])) == [expected]
+    assert list(codegen.reverse_many([params])) == [expected]
+    assert reverser.reverse_kw(**params) == expected
+    assert reverser.compile().reverse(params) == expected
+    assert reverser.reverse_columns({'param1': ['a', 'b'],
+                                     'page': ['2', None]}) == \
+        [expected, '/test/b']
+
+
+def test_rsrreverser_query_string_bind():
+    reverser = RSRReverser('/test/{param1}/{param2}', query=True)
+    bound = reverser.bind({'param1': 'a'})
+    assert bound.reverse({'param1': 'ignored', 'param2': 'b', 'page': '2'}) \
+        == '/test/a/b?page=2'
@@ -1,4 +1,4 @@
-from nose.tools import raises
+import pytest
 
 from reverser import RSRReverser, RouteParameterizationIrreversibleError
 
@@ -47,14 +47,14 @@ def test_rsrreverser_reverse_full_nested_options():
     assert reverser.reverse(params) == reversed_url
 
 
-@raises(RouteParameterizationIrreversibleError)
 def test_rsrreverser_reverse_some_params():
-    reverser = RSRReverser('/test/{param1}/{param2}/{param3}')
-    params = {
-        'param1': 'epic',
-        'param2': 'fail',
-    }
-    reverser.reverse(params)
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}/{param2}/{param3}')
+        params = {
+            'param1': 'epic',
+            'param2': 'fail',
+        }
+        reverser.reverse(params)
 
 
 def test_rsrreverser_reverse_some_options():
@@ -67,14 +67,14 @@ def test_rsrreverser_reverse_some_options():
     assert reverser.reverse(params) == reversed_url
 
 
-@raises(RouteParameterizationIrreversibleError)
 def test_rsrreverser_reverse_some_params_and_options():
-    reverser = RSRReverser('/test[/{param1}]/{param2}[/{param3}]/{param4}')
-    params = {
-        'param2': 'some',
-        'param3': 'options',
-    }
-    reverser.reverse(params)
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test[/{param1}]/{param2}[/{param3}]/{param4}')
+        params = {
+            'param2': 'some',
+            'param3': 'options',
+        }
+        reverser.reverse(params)
 
 
 def test_rsrreverser_reverse_some_nested_options():
@@ -0,0 +1,75 @@
+import functools
+import itertools
+
+import pytest
+
+from reverser import RSRReverser, RouteParameterizationIrreversibleError
+
+
+def test_rsrreverser_reverse_args_full_params():
+    reverser = RSRReverser('/test/{param1}/{param2}/{param3}')
+    assert reverser.reverse_args('params', 'are', 'fun') == \
+        '/test/params/are/fun'
+
+
+def test_rsrreverser_reverse_args_parameter_order():
+    reverser = RSRReverser('/test/{param2}[/{option1}]/{param1}/{param2}')
+    assert reverser.get_parameter_names() == ('param2', 'option1', 'param1')
+    assert reverser.reverse_args('a', 'b', 'c') == '/test/a/b/c/a'
+
+
+def test_rsrreverser_reverse_args_none_options():
+    reverser = RSRReverser('/test/{param1}[/{option1}][/{option2}]')
+    assert reverser.reverse_args('a', None, 'c') == '/test/a/c'
+    assert reverser.reverse_args('a', 'b') == '/test/a/b'
+    assert reverser.reverse_args('a') == '/test/a'
+
+
+def test_rsrreverser_reverse_args_invalid_type():
+    reverser = RSRReverser('/test/{param1}[/{page:digits}]')
+    assert reverser.reverse_args('a', 'two') == '/test/a'
+    assert reverser.reverse_args('a', '2') == '/test/a/2'
+
+
+def test_rsrreverser_reverse_args_matches_reverse():
+    route = '/test[/{param1}[/{param2}]]/sep[/{param3}[/{param4}]]'
+    reverser = RSRReverser(route)
+    names = reverser.get_parameter_names()
+    for values in itertools.product(('x', None), repeat=len(names)):
+        params = dict((name, value) for name, value in zip(names, values)
+                      if value is not None)
+        assert reverser.reverse_args(*values) == reverser.reverse(params)
+
+
+def test_rsrreverser_reverse_args_starmap_partial():
+    reverser = RSRReverser('/mixna/{artist}/{song}[/{page}]')
+    rows = [('a', 'b'), ('c', 'd', '2')]
+    assert list(itertools.starmap(reverser.reverse_args, rows)) == \
+        ['/mixna/a/b', '/mixna/c/d/2']
+    reverse = functools.partial(reverser.reverse_args, 'bound')
+    assert reverse('song') == '/mixna/bound/song'
+
+
+def test_rsrreverser_reverse_args_missing_required():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}/{param2}')
+        reverser.reverse_args('a', None)
+
+
+def test_rsrreverser_reverse_args_too_many_values():
+    with pytest.raises(TypeError):
+        reverser = RSRReverser('/test/{param1}')
+        reverser.reverse_args('a', 'b')
+
+
+def test_rsrreverser_reverse_args_set_route():
+    reverser = RSRReverser('/test/{param1}')
+    reverser.reverse_args('a')
+    reverser.set_route('/set/{param1}[/{option1}]')
+    assert reverser.reverse_args('a', 'b') == '/set/a/b'
+
+
+def test_rsrreverser_reverse_kw():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    assert reverser.reverse_kw(param1='a') == '/test/a'
+    assert reverser.reverse_kw(param1='a', option1='b') == '/test/a/b'
@@ -0,0 +1,89 @@
+from unittest import SkipTest
+import pytest
+
+from reverser import (RSRReverser, RouteParameterizationIrreversibleError,
+                      ON_ERROR_SKIP, ON_ERROR_DEFAULT)
+
+
+def test_rsrreverser_reverse_columns_full():
+    reverser = RSRReverser('/test/{param1}/{param2}')
+    columns = {
+        'param1': ['columns', 'are'],
+        'param2': ['fun', 'fast'],
+    }
+    reversed_urls = ['/test/columns/fun', '/test/are/fast']
+    assert reverser.reverse_columns(columns) == reversed_urls
+
+
+def test_rsrreverser_reverse_columns_missing_options():
+    reverser = RSRReverser('/test/{param1}[/{option1}[/{option2}]]')
+    columns = {
+        'param1': ['a', 'b', 'c', 'd'],
+        'option1': [None, 'o1', 'o1', None],
+        'option2': ['o2', None, 'o2', 'o2'],
+    }
+    reversed_urls = ['/test/a', '/test/b/o1', '/test/c/o1/o2', '/test/d']
+    assert reverser.reverse_columns(columns) == reversed_urls
+
+
+def test_rsrreverser_reverse_columns_literal_percent():
+    reverser = RSRReverser('/100%/{param1}')
+    columns = {
+        'param1': ['sure'],
+    }
+    assert reverser.reverse_columns(columns) == ['/100%/sure']
+
+
+def test_rsrreverser_reverse_columns_no_params():
+    reverser = RSRReverser('/test[/{option1}]')
+    columns = {
+        'unrelated': ['a', 'b'],
+    }
+    assert reverser.reverse_columns(columns) == ['/test', '/test']
+
+
+def test_rsrreverser_reverse_columns_raise():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}')
+        reverser.reverse_columns({'param1': ['ok', None]})
+
+
+def test_rsrreverser_reverse_columns_skip():
+    reverser = RSRReverser('/test/{param1}')
+    columns = {
+        'param1': [None, 'ok', None, 'fine'],
+    }
+    assert reverser.reverse_columns(columns, on_error=ON_ERROR_SKIP) == \
+        ['/test/ok', '/test/fine']
+
+
+def test_rsrreverser_reverse_columns_default():
+    reverser = RSRReverser('/test/{param1}')
+    columns = {
+        'param1': ['ok', None],
+    }
+    assert reverser.reverse_columns(columns, on_error=ON_ERROR_DEFAULT,
+                                    default='sentinel') == \
+        ['/test/ok', 'sentinel']
+
+
+def test_rsrreverser_reverse_columns_uneven():
+    with pytest.raises(ValueError):
+        reverser = RSRReverser('/test/{param1}/{param2}')
+        reverser.reverse_columns({'param1': ['a', 'b'], 'param2': ['c']})
+
+
+def test_rsrreverser_reverse_columns_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest('NumPy is not installed')
+
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    columns = {
+        'param1': numpy.array(['numpy', 'arrays']),
+        'option1': numpy.ma.array(['masked', 'kept'], mask=[True, False]),
+    }
+    reversed_urls = reverser.reverse_columns(columns, as_array=True)
+    assert isinstance(reversed_urls, numpy.ndarray)
+    assert reversed_urls.tolist() == ['/test/numpy', '/test/arrays/kept']
@@ -0,0 +1,62 @@
+import itertools
+
+import pytest
+
+from reverser import (RSRReverser, RouteParameterizationIrreversibleError,
+                      ON_ERROR_SKIP, ON_ERROR_DEFAULT)
+
+
+def test_rsrreverser_reverse_many_shapes():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    records = [
+        {'param1': 'many'},
+        {'param1': 'records', 'option1': 'options'},
+        {'param1': 'again'},
+    ]
+    reversed_urls = ['/test/many', '/test/records/options', '/test/again']
+    assert list(reverser.reverse_many(records)) == reversed_urls
+
+
+def test_rsrreverser_reverse_many_lazy():
+    reverser = RSRReverser('/test/{param1}')
+    records = ({'param1': str(i)} for i in itertools.count())
+    reversed_urls = ['/test/0', '/test/1', '/test/2']
+    assert list(itertools.islice(reverser.reverse_many(records), 3)) == \
+        reversed_urls
+
+
+def test_rsrreverser_reverse_many_raise():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}')
+        list(reverser.reverse_many([{'param1': 'ok'}, {'param2': 'fail'}]))
+
+
+def test_rsrreverser_reverse_many_skip():
+    reverser = RSRReverser('/test/{param1}')
+    records = [{'param1': 'ok'}, {'param2': 'fail'}, {'param1': 'fine'}]
+    reversed_urls = ['/test/ok', '/test/fine']
+    assert list(reverser.reverse_many(records, on_error=ON_ERROR_SKIP)) == \
+        reversed_urls
+
+
+def test_rsrreverser_reverse_many_default():
+    reverser = RSRReverser('/test/{param1}')
+    records = [{'param1': 'ok'}, {'param2': 'fail'}]
+    reversed_urls = ['/test/ok', 'sentinel']
+    assert list(reverser.reverse_many(records, on_error=ON_ERROR_DEFAULT,
+                                      default='sentinel')) == reversed_urls
+
+
+def test_rsrreverser_reverse_many_codegen():
+    reverser = RSRReverser('/test/{param1}[/{option1}]', codegen=True)
+    records = [{'param1': 'code', 'option1': 'gen'}, {'option1': 'fail'}]
+    reversed_urls = ['/test/code/gen', None]
+    assert list(reverser.reverse_many(records,
+                                      on_error=ON_ERROR_DEFAULT)) == \
+        reversed_urls
+
+
+def test_rsrreverser_reverse_many_invalid_on_error():
+    with pytest.raises(ValueError):
+        reverser = RSRReverser('/test/{param1}')
+        reverser.reverse_many([], on_error='ignore')
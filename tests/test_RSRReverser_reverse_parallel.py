@@ -0,0 +1,52 @@
+import pytest
+
+from reverser import (RSRReverser, RouteParameterizationIrreversibleError,
+                      ON_ERROR_SKIP, ON_ERROR_DEFAULT)
+
+
+def test_rsrreverser_reverse_parallel_order():
+    reverser = RSRReverser('/test/{param1}[/{option1}]')
+    records = [{'param1': str(i)} if i % 3 else
+               {'param1': str(i), 'option1': 'o'} for i in range(100)]
+    reversed_urls = [reverser.reverse(record) for record in records]
+    assert list(reverser.reverse_parallel(records, processes=2,
+                                          chunksize=7)) == reversed_urls
+
+
+def test_rsrreverser_reverse_parallel_custom():
+    reverser = RSRReverser('/test</=option1;>', option_bounds='<>',
+                           param_bounds='=;', codegen=True)
+    records = [{'option1': 'custom'}, {}]
+    reversed_urls = ['/test/custom', '/test']
+    assert list(reverser.reverse_parallel(records, processes=1)) == \
+        reversed_urls
+
+
+def test_rsrreverser_reverse_parallel_raise():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}')
+        records = [{'param1': 'ok'}, {'param2': 'fail'}]
+        list(reverser.reverse_parallel(records, processes=1))
+
+
+def test_rsrreverser_reverse_parallel_skip():
+    reverser = RSRReverser('/test/{param1}')
+    records = [{'param1': 'ok'}, {'param2': 'fail'}, {'param1': 'fine'}]
+    assert list(reverser.reverse_parallel(records, processes=2, chunksize=1,
+                                          on_error=ON_ERROR_SKIP)) == \
+        ['/test/ok', '/test/fine']
+
+
+def test_rsrreverser_reverse_parallel_default():
+    reverser = RSRReverser('/test/{param1}')
+    records = [{'param2': 'fail'}, {'param1': 'ok'}]
+    assert list(reverser.reverse_parallel(records, processes=1,
+                                          on_error=ON_ERROR_DEFAULT,
+                                          default='sentinel')) == \
+        ['sentinel', '/test/ok']
+
+
+def test_rsrreverser_reverse_parallel_invalid_chunksize():
+    with pytest.raises(ValueError):
+        reverser = RSRReverser('/test/{param1}')
+        reverser.reverse_parallel([], chunksize=0)
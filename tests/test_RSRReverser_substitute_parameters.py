@@ -123,3 +123,30 @@ def test_rsrreverser_substitute_parameters_custom():
     }
     reversed_url = '/test/{param}/fake_out'
     assert reverser.substitute_parameters(params) == reversed_url
+
+
+def test_rsrreverser_substitute_parameters_unrelated_params():
+    reverser = RSRReverser('/test/{param1}/{param2}')
+    params = dict(('unrelated%d' % i, 'ignored') for i in range(25))
+    params['param2'] = 'only_this'
+    sub_route = '/test/{param1}/only_this'
+    assert reverser.substitute_parameters(params) == sub_route
+
+
+def test_rsrreverser_substitute_parameters_separator_in_name():
+    reverser = RSRReverser('/test/{param:a:b}')
+    params = {
+        'param:a': 'multi_separator',
+    }
+    sub_route = '/test/multi_separator'
+    assert reverser.substitute_parameters(params) == sub_route
+
+
+def test_rsrreverser_substitute_parameters_custom_regex_unsafe():
+    reverser = RSRReverser('/test/[param]/{param}', param_bounds='[]',
+                           param_separator='.')
+    params = {
+        'param': 'escaped',
+    }
+    sub_route = '/test/escaped/{param}'
+    assert reverser.substitute_parameters(params) == sub_route
@@ -0,0 +1,87 @@
+import pytest
+
+from reverser import (RSRReverser, RouteRegistry, CacheInfo, LRUCache,
+                      RouteParameterizationIrreversibleError)
+
+
+def test_rsrreverser_url_cache_disabled():
+    reverser = RSRReverser('/test/{param1}')
+    reverser.reverse({'param1': 'uncached'})
+    assert reverser.url_cache_info() is None
+
+
+def test_rsrreverser_url_cache_hits():
+    reverser = RSRReverser('/test/{param1}[/{option1}]', url_cache_size=10)
+    assert reverser.reverse({'param1': 'a'}) == '/test/a'
+    assert reverser.reverse({'param1': 'a'}) == '/test/a'
+    assert reverser.reverse({'param1': 'a', 'option1': 'b'}) == '/test/a/b'
+    assert reverser.url_cache_info() == CacheInfo(1, 2, 10, 2)
+
+
+def test_rsrreverser_url_cache_ignores_unrelated():
+    reverser = RSRReverser('/test/{param1}', url_cache_size=10)
+    reverser.reverse({'param1': 'a', 'unrelated': 'x'})
+    reverser.reverse({'param1': 'a', 'unrelated': 'y', 'other': 'z'})
+    assert reverser.url_cache_info() == CacheInfo(1, 1, 10, 1)
+
+
+def test_rsrreverser_url_cache_evicts():
+    reverser = RSRReverser('/test/{param1}', url_cache_size=2)
+    for value in ('a', 'b', 'c', 'a'):
+        reverser.reverse({'param1': value})
+    assert reverser.url_cache_info() == CacheInfo(0, 4, 2, 2)
+
+
+def test_rsrreverser_url_cache_irreversible():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1}', url_cache_size=10)
+        try:
+            reverser.reverse({'param2': 'a'})
+        except RouteParameterizationIrreversibleError:
+            pass
+        reverser.reverse({'param2': 'a'})
+
+
+def test_rsrreverser_url_cache_unhashable():
+    reverser = RSRReverser('/test/{param1}', url_cache_size=10)
+    reverser.reverse({'param1': 'a', 'unrelated': ['unhashable']})
+    assert reverser.url_cache_info().currsize == 1
+
+
+def test_rsrreverser_url_cache_clear():
+    reverser = RSRReverser('/test/{param1}', url_cache_size=10)
+    reverser.reverse({'param1': 'a'})
+    reverser.clear_url_cache()
+    assert reverser.url_cache_info() == CacheInfo(0, 0, 10, 0)
+
+
+def test_rsrreverser_url_cache_registry():
+    registry = RouteRegistry({
+        'hello': '/hello/{param}',
+        'bye': '/bye/{param}',
+    }, url_cache_size=10)
+    params = {
+        'param': 'World',
+    }
+    assert registry.reverse('hello', params) == '/hello/World'
+    assert registry.reverse('bye', params) == '/bye/World'
+    assert registry.reverse('hello', params) == '/hello/World'
+    assert registry.url_cache_info() == CacheInfo(1, 2, 10, 2)
+
+
+def test_rsrreverser_url_cache_shared_options():
+    url_cache = LRUCache(10)
+    typed = RSRReverser('/s/{x:digits}', url_cache=url_cache)
+    untyped = RSRReverser('/s/{x:digits}', url_cache=url_cache,
+                          validate=False)
+    custom = RSRReverser('/s/{x:digits}', url_cache=url_cache,
+                         types={'digits': '[a-z]+'})
+    try:
+        typed.reverse({'x': 'zz'})
+    except RouteParameterizationIrreversibleError:
+        pass
+    else:
+        assert False
+    assert untyped.reverse({'x': 'zz'}) == '/s/zz'
+    assert custom.reverse({'x': 'zz'}) == '/s/zz'
+    assert url_cache.info().currsize == 3
@@ -0,0 +1,114 @@
+import re
+
+import pytest
+
+from reverser import (RSRReverser, RouteParameterizationIrreversibleError,
+                      register_parameter_type, RSR_PARAMETER_TYPES)
+
+
+def test_rsrreverser_validate_valid():
+    reverser = RSRReverser('/test/{param1:digits}/{param2:slug}')
+    params = {
+        'param1': '42',
+        'param2': 'valid-slug_1',
+    }
+    assert reverser.reverse(params) == '/test/42/valid-slug_1'
+
+
+def test_rsrreverser_validate_invalid_param():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1:digits}')
+        reverser.reverse({'param1': '42a'})
+
+
+def test_rsrreverser_validate_invalid_param_codegen():
+    with pytest.raises(RouteParameterizationIrreversibleError):
+        reverser = RSRReverser('/test/{param1:digits}', codegen=True)
+        reverser.reverse({'param1': '42a'})
+
+
+def test_rsrreverser_validate_invalid_option():
+    reverser = RSRReverser('/test[/{option1:alpha}[/{option2}]]')
+    params = {
+        'option1': 'not4lpha',
+        'option2': 'pruned',
+    }
+    assert reverser.reverse(params) == '/test'
+    assert reverser.prune_options(params) == '/test'
+
+
+def test_rsrreverser_validate_invalid_option_codegen():
+    reverser = RSRReverser('/test[/{option1:alpha}]', codegen=True)
+    assert reverser.reverse({'option1': 'not4lpha'}) == '/test'
+    assert reverser.reverse({'option1': 'alpha'}) == '/test/alpha'
+
+
+def test_rsrreverser_validate_off():
+    reverser = RSRReverser('/test/{param1:digits}', validate=False)
+    assert reverser.reverse({'param1': 'trusted'}) == '/test/trusted'
+
+
+def test_rsrreverser_validate_unknown_type():
+    reverser = RSRReverser('/test/{param1:unknown}')
+    assert reverser.reverse({'param1': 'anything'}) == '/test/anything'
+
+
+def test_rsrreverser_validate_custom_types():
+    types = {
+        'even': lambda value: int(value) % 2 == 0,
+        'year': re.compile('[0-9]{4}'),
+    }
+    reverser = RSRReverser('/test[/{option1:even}][/{option2:year}]',
+                           types=types)
+    params = {
+        'option1': '3',
+        'option2': '2012',
+    }
+    assert reverser.reverse(params) == '/test/2012'
+
+
+def test_rsrreverser_validate_register_parameter_type():
+    register_parameter_type('lower', '[a-z]+')
+    try:
+        reverser = RSRReverser('/test[/{option1:lower}]')
+        assert reverser.reverse({'option1': 'UPPER'}) == '/test'
+        assert reverser.reverse({'option1': 'lower'}) == '/test/lower'
+    finally:
+        del RSR_PARAMETER_TYPES['lower']
+
+
+def test_rsrreverser_validate_register_after_custom_types():
+    types = {
+        'even': lambda value: int(value) % 2 == 0,
+    }
+    RSRReverser('/a/{x:even}', types=types)
+    digits = RSR_PARAMETER_TYPES['digits']
+    register_parameter_type('lower', '[a-z]+')
+    register_parameter_type('digits', '[0-5]+')
+    try:
+        reverser = RSRReverser('/b/{y:lower}[/{z:digits}]', types=types)
+        assert set(reverser.get_validators()) == set(['y', 'z'])
+        assert reverser.reverse({'y': 'b', 'z': '9'}) == '/b/b'
+        assert reverser.can_reverse({'y': 'UPPER'}) is False
+    finally:
+        del RSR_PARAMETER_TYPES['lower']
+        RSR_PARAMETER_TYPES['digits'] = digits
+
+
+def test_rsrreverser_validate_missing_parameters():
+    reverser = RSRReverser('/test/{param1:digits}/{param2}')
+    params = {
+        'param1': 'nope',
+        'param2': 'fine',
+    }
+    assert not reverser.can_reverse(params)
+    assert reverser.missing_parameters(params) == ('param1',)
+
+
+def test_rsrreverser_validate_columns():
+    reverser = RSRReverser('/test/{param1}[/{option1:digits}]')
+    columns = {
+        'param1': ['a', 'b'],
+        'option1': ['1', 'x'],
+    }
+    assert reverser.reverse_columns(columns) == ['/test/a/1', '/test/b']
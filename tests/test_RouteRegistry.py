@@ -0,0 +1,104 @@
+import pytest
+
+from reverser import (RouteRegistry, UnknownRouteError, CacheInfo,
+                      ON_ERROR_DEFAULT, ON_ERROR_SKIP)
+
+
+def say_hello():
+    pass
+
+
+def test_routeregistry_reverse_name():
+    registry = RouteRegistry({'hello': '/hello/{param}[/{option}]'})
+    params = {
+        'param': 'World',
+    }
+    assert registry.reverse('hello', params) == '/hello/World'
+
+
+def test_routeregistry_reverse_callable():
+    registry = RouteRegistry()
+    registry.add(say_hello, '/hello/{param}')
+    assert registry.reverse(say_hello, {'param': 'World'}) == '/hello/World'
+
+
+def test_routeregistry_route_decorator():
+    registry = RouteRegistry()
+
+    @registry.route('/hello/{param}', name='hello')
+    def decorated():
+        pass
+
+    assert registry.reverse(decorated, {'param': 'a'}) == '/hello/a'
+    assert registry.reverse('hello', {'param': 'b'}) == '/hello/b'
+
+
+def test_routeregistry_lazy():
+    registry = RouteRegistry({'hello': '/hello/{param}', 'bye': '/bye'})
+    assert registry._reversers == {}
+    reverser = registry.get_reverser('hello')
+    assert registry.get_reverser('hello') is reverser
+    assert list(registry._reversers) == ['hello']
+
+
+def test_routeregistry_shared_cache():
+    registry = RouteRegistry({
+        'hello': '/hello[/{param}]',
+        'bye': '/bye[/{param}]',
+    }, cache_size=10)
+    params = {
+        'param': 'World',
+    }
+    assert registry.reverse('hello', params) == '/hello/World'
+    assert registry.reverse('bye', params) == '/bye/World'
+    assert registry.reverse('hello', params) == '/hello/World'
+    assert registry.cache_info() == CacheInfo(1, 2, 10, 2)
+
+
+def test_routeregistry_options():
+    registry = RouteRegistry({'hello': '/hello</=param;>'},
+                             option_bounds='<>', param_bounds='=;',
+                             codegen=True)
+    assert registry.reverse('hello', {'param': 'World'}) == '/hello/World'
+
+
+def test_routeregistry_add_replaces():
+    registry = RouteRegistry({'hello': '/hello/{param}'})
+    registry.reverse('hello', {'param': 'World'})
+    registry.add('hello', '/hi/{param}')
+    assert registry.reverse('hello', {'param': 'World'}) == '/hi/World'
+
+
+def test_routeregistry_unknown():
+    with pytest.raises(UnknownRouteError):
+        registry = RouteRegistry()
+        registry.reverse('missing', {})
+
+
+def test_routeregistry_reverse_many():
+    registry = RouteRegistry({
+        'song': '/mixna/{artist}/{song}',
+        'hello': '/hello[/{artist}]',
+    })
+    records = [{'route': 'song', 'artist': 'a', 'song': 'b'},
+               {'route': 'hello'},
+               {'route': 'song', 'artist': 'irreversible'},
+               {'route': 'unknown'},
+               {'artist': 'a'}]
+    assert list(registry.reverse_many(records, on_error=ON_ERROR_DEFAULT)) \
+        == ['/mixna/a/b', '/hello', None, None, None]
+    assert list(registry.reverse_many(records, on_error=ON_ERROR_SKIP)) \
+        == ['/mixna/a/b', '/hello']
+
+
+def test_routeregistry_reverse_many_raise():
+    with pytest.raises(UnknownRouteError):
+        registry = RouteRegistry({'hello': '/hello'})
+        list(registry.reverse_many([{'route': 'hello'}, {'route': 'missing'}]))
+
+
+def test_routeregistry_reverse_many_query():
+    registry = RouteRegistry({'a': '/a/{x}'}, query=True)
+    records = [{'route': 'a', 'x': '1', 'page': '2'}]
+    assert list(registry.reverse_many(records)) == ['/a/1?page=2']
+    assert records[0]['route'] == 'a'
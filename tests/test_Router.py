@@ -0,0 +1,149 @@
+from reverser import ENCODE_PATH, Router, RouteMatch, RSRReverser
+
+
+def test_router_match_params():
+    router = Router({'song': '/mixna/{artist}/{song}'})
+    params = {
+        'artist': 'artist',
+        'song': 'song',
+    }
+    assert router.match('/mixna/artist/song') == RouteMatch('song', params)
+
+
+def test_router_match_options():
+    router = Router({'song': '/mixna/{artist}/{song}[/{page}[/{date}]]'})
+    assert router.match('/mixna/a/b') == \
+        RouteMatch('song', {'artist': 'a', 'song': 'b'})
+    assert router.match('/mixna/a/b/2/today') == \
+        RouteMatch('song', {'artist': 'a', 'song': 'b', 'page': '2',
+                            'date': 'today'})
+
+
+def test_router_match_literal_first():
+    router = Router([
+        ('artist', '/mixna/{artist}'),
+        ('about', '/mixna/about'),
+    ])
+    assert router.match('/mixna/about') == RouteMatch('about', {})
+    assert router.match('/mixna/abou') == \
+        RouteMatch('artist', {'artist': 'abou'})
+
+
+def test_router_match_first_added():
+    router = Router([
+        ('first', '/test/{param1}'),
+        ('second', '/test/{param2}'),
+    ])
+    assert router.match('/test/x') == RouteMatch('first', {'param1': 'x'})
+
+
+def test_router_match_typed():
+    router = Router([
+        ('page', '/test/{page:digits}'),
+        ('slug', '/test/{slug}'),
+    ])
+    assert router.match('/test/42') == RouteMatch('page', {'page': '42'})
+    assert router.match('/test/a42') == RouteMatch('slug', {'slug': 'a42'})
+
+
+def test_router_match_within_segment():
+    router = Router({'file': '/files/{name}.{ext}'})
+    assert router.match('/files/archive.tar.gz') == \
+        RouteMatch('file', {'name': 'archive', 'ext': 'tar.gz'})
+
+
+def test_router_match_repeated_param():
+    router = Router({'same': '/test/{param1}/{param1}'})
+    assert router.match('/test/a/a') == RouteMatch('same', {'param1': 'a'})
+    assert router.match('/test/a/b') is None
+
+
+def test_router_match_distinct_param_names():
+    router = Router([('res%d' % i, '/api/{id%d}/res%d' % (i, i))
+                     for i in range(100)])
+    assert len(router._root.edges['/'][1].params) == 1
+    assert router.match('/api/7/res42') == RouteMatch('res42', {'id42': '7'})
+    assert router.match('/api/7/res100') is None
+
+
+def test_router_match_distinct_param_names_custom_type():
+    types = {
+        'even': lambda value: value.isdigit() and int(value) % 2 == 0,
+    }
+    router = Router([
+        ('a', '/t/{x:even}/a'),
+        ('b', '/t/{y:even}/b'),
+        ('c', '/t/{z:alnum}/c'),
+    ], types=types)
+    assert len(router._root.edges['/'][1].params) == 2
+    assert router.match('/t/4/b') == RouteMatch('b', {'y': '4'})
+    assert router.match('/t/3/b') is None
+    assert router.match('/t/3f/c') == RouteMatch('c', {'z': '3f'})
+
+
+def test_router_match_no_match():
+    router = Router({'song': '/mixna/{artist}/{song}'})
+    assert router.match('/mixna/artist') is None
+    assert router.match('/mixna/artist/song/') is None
+    assert router.match('/other') is None
+
+
+def test_router_match_too_many_variants():
+    route = '/wide' + ''.join('[/{o%d}]' % i for i in range(12))
+    router = Router({'wide': route}, max_variants=16)
+    assert router.match('/wide/a/b') == \
+        RouteMatch('wide', {'o0': 'a', 'o1': 'b'})
+
+
+def test_router_expand_options():
+    router = Router()
+    template = RSRReverser('/t[/{o1}][/x]').get_template()
+    variants = router.expand_options(template)
+    assert [''.join(getattr(item, 'token', item) for item in variant)
+            for variant in variants] == ['/t/{o1}/x', '/t/x']
+
+
+def test_router_match_sibling_options():
+    routes = {
+        'list': '/list[/{page}][/{sort}]',
+        'archive': '/archive[/{year:digits}][/{month:digits}]',
+    }
+    router = Router(routes)
+    for name, path in [('list', '/list/2'), ('list', '/list/2/name'),
+                       ('archive', '/archive/2024'),
+                       ('archive', '/archive/2024/05')]:
+        assert router.match(path) == \
+            RouteMatch(name, RSRReverser(routes[name]).match(path))
+    assert router.match('/list/2') == RouteMatch('list', {'page': '2'})
+
+
+def test_router_match_encoded():
+    router = Router({'band': '/bands/{x}'}, encode=True)
+    path = RSRReverser('/bands/{x}', encode=True).reverse({'x': 'AC/DC'})
+    assert router.match(path) == RouteMatch('band', {'x': 'AC/DC'})
+
+
+def test_router_match_encode_path():
+    router = Router([
+        ('file', '/files/{path}'),
+        ('raw', '/raw/{path}'),
+    ], encode={'path': ENCODE_PATH})
+    path = RSRReverser('/files/{path}', encode=ENCODE_PATH).reverse(
+        {'path': 'a b/c'})
+    assert path == '/files/a%20b/c'
+    assert router.match(path) == RouteMatch('file', {'path': 'a b/c'})
+    assert router.match('/raw/a/b') == RouteMatch('raw', {'path': 'a/b'})
+
+
+def test_router_match_option_in_segment():
+    routes = {
+        'date': '/d/{y}-{m}[-{d}]',
+        'file': '/f/{name}[.{ext}]',
+    }
+    router = Router(routes)
+    for name, params in [('date', {'y': '2020', 'm': '01', 'd': '02'}),
+                         ('date', {'y': '2020', 'm': '01'}),
+                         ('file', {'name': 'a', 'ext': 'b'}),
+                         ('file', {'name': 'a'})]:
+        path = RSRReverser(routes[name]).reverse(params)
+        assert router.match(path) == RouteMatch(name, params)
@@ -0,0 +1,113 @@
+import gzip
+import os
+import shutil
+import tempfile
+
+from reverser import RSRReverser, RouteRegistry
+from reverser_sitemap import SitemapWriter, write_sitemaps
+
+
+def read(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as sitemap:
+        return sitemap.read().decode('utf-8')
+
+
+def test_sitemapwriter_split_by_urls():
+    directory = tempfile.mkdtemp()
+    try:
+        reverser = RSRReverser('/mixna/{artist}/{song}')
+        records = [{'artist': 'a', 'song': str(i)} for i in range(5)]
+        index = write_sitemaps(reverser, records, directory,
+                               'https://example.com/', max_urls=2,
+                               buffer_urls=1)
+        assert sorted(os.listdir(directory)) == [
+            'sitemap-1.xml.gz', 'sitemap-2.xml.gz', 'sitemap-3.xml.gz',
+            'sitemap.xml']
+        first = read(os.path.join(directory, 'sitemap-1.xml.gz'))
+        assert first.count('<url>') == 2
+        assert '<loc>https://example.com/mixna/a/0</loc>' in first
+        assert first.endswith('</urlset>\n')
+        assert read(os.path.join(directory, 'sitemap-3.xml.gz')).count(
+            '<url>') == 1
+        assert read(index).count('<sitemap>') == 3
+        assert '<loc>https://example.com/sitemap-2.xml.gz</loc>' in \
+            read(index)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_sitemapwriter_split_by_bytes():
+    directory = tempfile.mkdtemp()
+    try:
+        with SitemapWriter(directory, 'https://example.com', compress=False,
+                           max_bytes=400) as writer:
+            for i in range(10):
+                writer.write('/page/%d' % i)
+        for path in writer.paths:
+            assert os.path.getsize(path) <= 400
+        assert len(writer.paths) > 1
+        text = ''.join(read(path) for path in writer.paths)
+        assert text.count('<url>') == 10
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_sitemapwriter_escapes():
+    directory = tempfile.mkdtemp()
+    try:
+        with SitemapWriter(directory, 'https://example.com',
+                           compress=False) as writer:
+            writer.write('/search?q=a&page=<2>')
+            writer.write(RSRReverser('/bands/{band}', encode=True).reverse(
+                {'band': 'Guns N\' Roses "GNR"'}))
+        sitemap = read(writer.paths[0])
+        assert '<loc>https://example.com/search?q=a&amp;page=&lt;2&gt;' \
+            '</loc>' in sitemap
+        assert '<loc>https://example.com/bands/Guns%20N&apos;%20Roses%20' \
+            '%22GNR%22</loc>' in sitemap
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_sitemapwriter_registry():
+    directory = tempfile.mkdtemp()
+    try:
+        registry = RouteRegistry({
+            'song': '/mixna/{artist}/{song}',
+            'hello': '/hello[/{artist}]',
+        })
+        records = [{'route': 'song', 'artist': 'a', 'song': 'b'},
+                   {'route': 'hello'},
+                   {'route': 'song', 'artist': 'irreversible'},
+                   {'route': 'unknown'}]
+        write_sitemaps(registry, records, directory, 'https://example.com',
+                       name='songs')
+        sitemap = read(os.path.join(directory, 'songs-1.xml.gz'))
+        assert sitemap.count('<url>') == 2
+        assert '<loc>https://example.com/hello</loc>' in sitemap
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_sitemapwriter_registry_query():
+    directory = tempfile.mkdtemp()
+    try:
+        registry = RouteRegistry({'a': '/a/{x}'}, query=True)
+        write_sitemaps(registry, [{'route': 'a', 'x': '1', 'page': '2'}],
+                       directory, 'https://example.com', compress=False)
+        assert '<loc>https://example.com/a/1?page=2</loc>' in \
+            read(os.path.join(directory, 'sitemap-1.xml'))
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_sitemapwriter_empty():
+    directory = tempfile.mkdtemp()
+    try:
+        reverser = RSRReverser('/mixna/{artist}')
+        assert write_sitemaps(reverser, [{'song': 'b'}], directory,
+                              'https://example.com') is None
+        assert os.listdir(directory) == []
+    finally:
+        shutil.rmtree(directory)
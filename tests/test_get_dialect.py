@@ -0,0 +1,38 @@
+import pickle
+
+from reverser import RSRReverser, Dialect, get_dialect
+
+
+def test_get_dialect_default():
+    dialect = get_dialect()
+    assert dialect is get_dialect('[]', '{}', ':')
+    assert (dialect.option_bounds, dialect.param_bounds,
+            dialect.param_separator) == ('[]', '{}', ':')
+
+
+def test_get_dialect_custom():
+    dialect = get_dialect('<>', '=;')
+    assert dialect is get_dialect('<>', '=;', ':')
+    assert dialect is not get_dialect()
+    assert dialect.token_regex.match('<').lastgroup == 'open'
+    assert dialect.param_regex.match('=param;').group('name') == 'param'
+
+
+def test_get_dialect_shared_by_reversers():
+    first = RSRReverser('/first/{param1}')
+    second = RSRReverser('/second[/{option1}]')
+    assert first.extrapolate_token_regex() is \
+        second.extrapolate_token_regex()
+
+
+def test_get_dialect_reverser_argument():
+    reverser = RSRReverser('/test</=option;>',
+                           dialect=Dialect('<>', '=;', ':'))
+    assert reverser.option_bounds == '<>'
+    assert RSRReverser.option_bounds == '[]'
+    assert reverser.reverse({'option': 'a'}) == '/test/a'
+
+
+def test_get_dialect_pickle():
+    dialect = get_dialect('<>', '=;')
+    assert pickle.loads(pickle.dumps(dialect)) is dialect
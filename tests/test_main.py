@@ -0,0 +1,112 @@
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from reverser_cli import main
+
+
+class Output(object):
+
+    def __init__(self):
+        self.stdout = io.StringIO()
+        self.stderr = io.StringIO()
+
+    def __enter__(self):
+        self.saved = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = self.stdout, self.stderr
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.stdout, sys.stderr = self.saved
+
+
+def write_file(directory, name, text):
+    path = os.path.join(directory, name)
+    with open(path, 'w') as output:
+        output.write(text)
+    return path
+
+
+def run(argv):
+    with Output() as output:
+        status = main(argv)
+    return status, output.stdout.getvalue(), output.stderr.getvalue()
+
+
+def setup_records():
+    directory = tempfile.mkdtemp()
+    records = [{'artist': 'a', 'song': 'b'},
+               {'artist': 'c', 'song': 'd', 'page': 2},
+               {'song': 'irreversible'},
+               {'artist': 'e', 'song': 'f', 'page': None}]
+    path = write_file(directory, 'records.jsonl',
+                      '\n'.join(json.dumps(record) for record in records))
+    return directory, path
+
+
+def test_main_jsonl_emit():
+    directory, path = setup_records()
+    try:
+        status, stdout, stderr = run(['/mixna/{artist}/{song}[/{page}]',
+                                      path, '--on-error', 'emit',
+                                      '--error-line', 'ERROR'])
+    finally:
+        shutil.rmtree(directory)
+    assert status == 0
+    assert stdout == '/mixna/a/b\n/mixna/c/d/2\nERROR\n/mixna/e/f\n'
+    assert stderr.startswith('4 records, 1 errors')
+
+
+def test_main_jsonl_skip_chunks():
+    directory, path = setup_records()
+    try:
+        status, stdout, _ = run(['/mixna/{artist}/{song}[/{page}]', path,
+                                 '--on-error', 'skip', '--chunksize', '1',
+                                 '--quiet'])
+    finally:
+        shutil.rmtree(directory)
+    assert status == 0
+    assert stdout == '/mixna/a/b\n/mixna/c/d/2\n/mixna/e/f\n'
+
+
+def test_main_jsonl_abort():
+    directory, path = setup_records()
+    try:
+        status, stdout, stderr = run(['/mixna/{artist}/{song}', path, '-q'])
+    finally:
+        shutil.rmtree(directory)
+    assert status == 1
+    assert stdout == '/mixna/a/b\n/mixna/c/d\n'
+    assert stderr == 'record 3 cannot be reversed\n'
+
+
+def test_main_workers():
+    directory, path = setup_records()
+    try:
+        status, stdout, _ = run(['/mixna/{artist}/{song}[/{page}]', path,
+                                 '--on-error', 'skip', '-w', '2', '-q'])
+    finally:
+        shutil.rmtree(directory)
+    assert status == 0
+    assert stdout == '/mixna/a/b\n/mixna/c/d/2\n/mixna/e/f\n'
+
+
+def test_main_registry_csv():
+    directory = tempfile.mkdtemp()
+    try:
+        registry = write_file(directory, 'routes.json', json.dumps({
+            'song': '/mixna/{artist}/{song}',
+            'hello': '/hello[/{artist}]',
+        }))
+        path = write_file(directory, 'records.csv',
+                          'route,artist,song\nsong,a,b\nhello,,x\n'
+                          'unknown,a,b\n')
+        status, stdout, _ = run(['--registry', registry, path,
+                                 '--on-error', 'skip', '-q'])
+    finally:
+        shutil.rmtree(directory)
+    assert status == 0
+    assert stdout == '/mixna/a/b\n/hello\n'
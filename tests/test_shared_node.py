@@ -0,0 +1,32 @@
+from reverser import (RSRReverser, LiteralNode, InvalidNode, shared_node,
+                      RouteRegistry)
+
+
+def test_shared_node_same_instance():
+    first = RSRReverser('/shared/{param1}[/{option1}]').get_template()
+    second = RSRReverser('/shared/{param1}/other').get_template()
+    assert first[0] is second[0]
+    assert first[1] is second[1]
+
+
+def test_shared_node_keeps_type():
+    assert type(shared_node(LiteralNode('{typed}'))) is LiteralNode
+    assert type(shared_node(InvalidNode('{typed}'))) is InvalidNode
+
+
+def test_shared_node_parameter_names():
+    first = RSRReverser('/a/{shared_name}').get_parameter_names()
+    second = RSRReverser('/b/{shared_name:digits}').get_parameter_names()
+    assert first[0] is second[0]
+
+
+def test_shared_node_config():
+    registry = RouteRegistry({'a': '/a/{x}', 'b': '/b[/{y}]'},
+                             types={'even': r'[02468]+'}, encode=True,
+                             query=True)
+    first = registry.get_reverser('a')
+    second = registry.get_reverser('b')
+    assert first._config is second._config
+    # CPython only shares the key tables of instance dicts up to 29 keys,
+    # past which every reverser pays for a dict of its own.
+    assert len(vars(first)) < 29